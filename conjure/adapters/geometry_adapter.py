@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import bpy
 import mathutils
+import numpy as np
 
 
 class GeometryAdapter:
@@ -70,16 +71,14 @@ class GeometryAdapter:
     @staticmethod
     def _is_manifold(mesh) -> bool:
         """Check if mesh is manifold (simplified check)."""
-        # Count edge usage
-        edge_counts = {}
-        for poly in mesh.polygons:
-            verts = list(poly.vertices)
-            for i in range(len(verts)):
-                edge = tuple(sorted([verts[i], verts[(i + 1) % len(verts)]]))
-                edge_counts[edge] = edge_counts.get(edge, 0) + 1
-
-        # Each edge should be used exactly twice for manifold mesh
-        return all(count == 2 for count in edge_counts.values())
+        # Count edge usage, one loop per face corner
+        loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("edge_index", loop_edges)
+        edge_counts = np.bincount(loop_edges)
+
+        # Each edge used by a face should be used exactly twice for manifold mesh
+        used = edge_counts[edge_counts > 0]
+        return bool(np.all(used == 2))
 
     @staticmethod
     def calculate_center_of_mass(obj_name: str, density: float = 1.0) -> Optional[Dict[str, Any]]:
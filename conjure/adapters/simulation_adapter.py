@@ -422,12 +422,7 @@ class SimulationAdapter:
             if simulation_type == "rigid_body":
                 bpy.ops.ptcache.bake_all(bake=True)
             else:
-                # Bake individual object caches
-                for obj in obj_refs:
-                    for mod in obj.modifiers:
-                        if hasattr(mod, "point_cache"):
-                            with bpy.context.temp_override(object=obj, point_cache=mod.point_cache):
-                                bpy.ops.ptcache.bake(bake=True)
+                self._bake_object_caches(obj_refs)
 
             frames_computed = frame_end - frame_start + 1
             status = "success"
@@ -451,6 +446,30 @@ class SimulationAdapter:
             warnings=warnings,
         )
 
+    def _bake_object_caches(self, obj_refs: List[bpy.types.Object]):
+        """Bake the point caches of the given objects' physics modifiers.
+
+        Each ptcache.bake call steps through the whole frame range, so with
+        several objects a single bake_all pass is used instead; the depsgraph
+        then evaluates the objects side by side on its own threads. That is
+        only done when the scene has no other caches bake_all would touch.
+        """
+        scene = bpy.context.scene
+        targets = set(obj_refs)
+        has_other_caches = scene.rigidbody_world is not None or any(
+            hasattr(mod, "point_cache") for obj in scene.objects if obj not in targets for mod in obj.modifiers
+        )
+
+        if len(obj_refs) > 1 and not has_other_caches:
+            bpy.ops.ptcache.bake_all(bake=True)
+            return
+
+        for obj in obj_refs:
+            for mod in obj.modifiers:
+                if hasattr(mod, "point_cache"):
+                    with bpy.context.temp_override(object=obj, point_cache=mod.point_cache):
+                        bpy.ops.ptcache.bake(bake=True)
+
     def _setup_rigid_body_simulation(self, objects: List[bpy.types.Object], substeps: int, settings: Dict[str, Any]):
         """Configure rigid body simulation."""
         scene = bpy.context.scene
@@ -5,10 +5,12 @@ Contains:
 - blender_server: Socket server for receiving commands
 - cloud_bridge: WebSocket connection to Conjure cloud
 - command_executor: Command routing and execution
+- scene_cache: Scene lookups cached between depsgraph updates
 """
 
 import bpy
 
+from . import scene_cache
 from .blender_server import ConjureServer
 from .command_executor import CommandExecutor
 
@@ -50,6 +52,8 @@ def stop_server():
 
 def register():
     """Register engine components."""
+    scene_cache.register()
+
     # Auto-start server if preference is set
     prefs = bpy.context.preferences.addons.get("conjure")
     if prefs and prefs.preferences.auto_connect:
@@ -60,3 +64,4 @@ def register():
 def unregister():
     """Unregister engine components."""
     stop_server()
+    scene_cache.unregister()
@@ -174,7 +174,7 @@ class ConjureServer:
                     line, buffer = buffer.split("\n", 1)
                     if line.strip():
                         response = self._execute_command(line.strip())
-                        response_str = json.dumps(response) + "\n"
+                        response_str = json.dumps(response, separators=(",", ":")) + "\n"
                         self.client.send(response_str.encode("utf-8"))
 
             except Exception as e:
@@ -192,6 +192,10 @@ class ConjureServer:
         try:
             cmd = json.loads(command_str)
             cmd_type = cmd.get("type", "")
+            # Interned so the executor's handler lookup can match by identity;
+            # anything else is left for the executor to report as unknown
+            if isinstance(cmd_type, str):
+                cmd_type = sys.intern(cmd_type)
             params = cmd.get("params", {})
             request_id = cmd.get("request_id", str(uuid.uuid4()))
 
@@ -5,20 +5,206 @@ Routes commands to appropriate handlers following the _cmd_{type} pattern.
 All handlers execute Blender operations via bpy API.
 """
 
+import contextlib
+import functools
+import hashlib
+import itertools
 import math
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import os
+import reprlib
+import sys
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import bpy
 import mathutils
+import numpy as np
+
+from ..adapters.nodes_adapter import get_nodes_adapter
+from ..adapters.simulation_adapter import get_simulation_adapter
+from ..utils import (
+    CLOTH_QUALITY_PRESETS,
+    RIGID_BODY_QUALITY_PRESETS,
+    add_edit_bone,
+    bone_edit_session,
+    find_modifier,
+)
+from . import scene_cache
+
+# Pascals to gigapascals
+_PA_TO_GPA = 1e-9
+
+# Degrees to radians and back
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
+# Whether this Blender build reports animation playback on screens
+_HAS_IS_ANIMATION_PLAYING = "is_animation_playing" in bpy.types.Screen.bl_rna.properties
+
+# ID property holding the appearance hash a visual material was built from
+_APPEARANCE_PROP = "conjure_appearance"
+
+# Containers with more items than this are left out of error context
+_MAX_ERROR_PARAM_ITEMS = 16
+
+
+# Compiled scripts and expressions kept for repeat run_script/evaluate calls
+_SCRIPT_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=_SCRIPT_CACHE_SIZE)
+def _compile_script(source: str):
+    """Compile a run_script body, reusing the code object for repeat calls."""
+    return compile(source, "<conjure_script>", "exec")
+
+
+@functools.lru_cache(maxsize=_SCRIPT_CACHE_SIZE)
+def _compile_expression(source: str):
+    """Compile an evaluate expression, reusing the code object for repeat calls."""
+    return compile(source, "<conjure_expression>", "eval")
+
+
+def _make_result_repr() -> reprlib.Repr:
+    """Build the size-capped repr used for non-JSON script results."""
+    result_repr = reprlib.Repr()
+    result_repr.maxstring = 1024
+    result_repr.maxlist = 50
+    result_repr.maxtuple = 50
+    result_repr.maxdict = 50
+    result_repr.maxset = 50
+    result_repr.maxother = 512
+    return result_repr
+
+
+_RESULT_REPR = _make_result_repr()
+
+
+def _filter_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the params worth echoing back in an error response.
+
+    Binary payloads and large containers are dropped. Containers are sized by
+    item count rather than by stringifying them, so a huge ``settings`` dict
+    costs nothing to reject.
+    """
+    return {
+        k: v
+        for k, v in params.items()
+        if not isinstance(v, (bytes, bytearray))
+        and (not isinstance(v, (list, tuple, dict)) or len(v) <= _MAX_ERROR_PARAM_ITEMS)
+    }
+
+
+def _with_object(handler: Callable) -> Callable:
+    """Resolve params["object"] to a Blender object before running a handler.
+
+    The wrapped handler receives the object as a third argument; missing or
+    unknown names are answered with the usual error dict.
+    """
+
+    @functools.wraps(handler)
+    def wrapper(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        obj_name = params.get("object")
+        if not obj_name:
+            return {"status": "error", "error": "object is required"}
+        obj = bpy.data.objects.get(obj_name)
+        if not obj:
+            return {"status": "error", "error": f"Object '{obj_name}' not found"}
+        return handler(self, params, obj)
+
+    return wrapper
+
+
+def _material_alive(material: bpy.types.Material) -> bool:
+    """Whether a cached material still exists in the file."""
+    try:
+        name = material.name
+    except ReferenceError:
+        return False
+    return name in bpy.data.materials
+
+
+@contextlib.contextmanager
+def _selected(objects: Iterable, active) -> Iterator[None]:
+    """Select only the given objects, with active as the active object.
+
+    Only the objects that were selected before are deselected, rather than
+    running select_all over the whole scene, and the previous selection is
+    restored afterwards. Objects removed in the meantime (e.g. by a join)
+    are skipped.
+    """
+    view_layer = bpy.context.view_layer
+    previous = list(view_layer.objects.selected)
+    previous_active = view_layer.objects.active
+
+    for obj in previous:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    view_layer.objects.active = active
+
+    try:
+        yield
+    finally:
+        for obj in list(view_layer.objects.selected):
+            obj.select_set(False)
+        for obj in previous:
+            with contextlib.suppress(ReferenceError):
+                obj.select_set(True)
+        try:
+            view_layer.objects.active = previous_active
+        except ReferenceError:
+            view_layer.objects.active = None
 
 
 class CommandExecutor:
     """Executes CAD commands in Blender."""
 
+    __slots__ = (
+        "_bsdf_input_index",
+        "_categories_cache",
+        "_cycles_gpu",
+        "_handlers",
+        "_known_dirs",
+        "_material_cache",
+        "_material_cache_complete",
+        "_material_prefetch",
+        "_material_prefetch_error",
+        "_materials_lock",
+        "_validation_cache",
+        "_visual_mat_cache",
+        "materials_client",
+    )
+
     def __init__(self, materials_client=None):
         # Materials client for engineering materials from server
         self.materials_client = materials_client
 
+        # Engineering materials already fetched from the server, by id.
+        # The whole library is prefetched in the background after the first
+        # lookup; the lock only guards cache updates, never a server request,
+        # so main-thread commands don't wait on the download.
+        self._material_cache: Dict[str, Any] = {}
+        self._materials_lock = threading.Lock()
+        self._material_prefetch: Optional[threading.Thread] = None
+        self._material_prefetch_error: Optional[str] = None
+        self._material_cache_complete = False
+        self._categories_cache: Optional[List[str]] = None
+
+        # Visual Blender materials by appearance hash
+        self._visual_mat_cache: Dict[str, bpy.types.Material] = {}
+
+        # Principled BSDF socket positions by name (fixed for a Blender version)
+        self._bsdf_input_index: Optional[Dict[str, int]] = None
+
+        # Mesh validation results keyed by mesh name -> (fingerprint, result)
+        self._validation_cache: Dict[str, Tuple[tuple, Dict[str, Any]]] = {}
+
+        # Output directories already created for renders
+        self._known_dirs: set = set()
+
+        # Cycles GPU backend and devices, probed once on first use
+        self._cycles_gpu: Optional[Dict[str, Any]] = None
+
         # Build command handler map
         self._handlers: Dict[str, Callable] = {}
         self._register_handlers()
@@ -28,9 +214,29 @@ class CommandExecutor:
         # Find all methods starting with _cmd_
         for name in dir(self):
             if name.startswith("_cmd_"):
-                cmd_type = name[5:]  # Remove _cmd_ prefix
+                # Remove _cmd_ prefix; interned to match interned command types
+                cmd_type = sys.intern(name[5:])
                 self._handlers[cmd_type] = getattr(self, name)
 
+    # Commands that never modify the scene and so keep scene caches valid
+    READ_ONLY_COMMANDS = frozenset(
+        {
+            "get_state",
+            "list_objects",
+            "get_object_details",
+            "measure_distance",
+            "validate_geometry",
+            "health_check",
+            "get_bake_status",
+            "list_engineering_materials",
+            "get_engineering_material",
+            "get_object_engineering_material",
+            "get_simulation_capabilities",
+            "get_node_group_info",
+            "clear_script_cache",
+        }
+    )
+
     def execute(self, cmd_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a command by type.
 
@@ -54,18 +260,16 @@ class CommandExecutor:
         try:
             result = handler(params)
 
+            # Commands may change the scene before the next depsgraph update
+            if cmd_type not in self.READ_ONLY_COMMANDS:
+                scene_cache.mark_dirty()
+
             # Enrich error responses with operation context
             if result.get("status") == "error":
                 result["operation"] = cmd_type
                 if "params" not in result:
                     # Include relevant params (filter out large data)
-                    safe_params = {
-                        k: v
-                        for k, v in params.items()
-                        if not isinstance(v, (bytes, bytearray))
-                        and (not isinstance(v, (list, dict)) or len(str(v)) < 200)
-                    }
-                    result["params"] = safe_params
+                    result["params"] = _filter_params(params)
 
             return result
 
@@ -74,11 +278,7 @@ class CommandExecutor:
                 "status": "error",
                 "operation": cmd_type,
                 "error": f"{type(e).__name__}: {str(e)}",
-                "params": {
-                    k: v
-                    for k, v in params.items()
-                    if not isinstance(v, (bytes, bytearray)) and (not isinstance(v, (list, dict)) or len(str(v)) < 200)
-                },
+                "params": _filter_params(params),
             }
 
     # =========================================================================
@@ -330,7 +530,7 @@ class CommandExecutor:
 
         if rotation:
             # Full Euler rotation
-            obj.rotation_euler = mathutils.Euler([math.radians(r) for r in rotation], "XYZ")
+            obj.rotation_euler = mathutils.Euler([r * _DEG2RAD for r in rotation], "XYZ")
         elif axis and angle:
             # Single axis rotation
             axis_map = {"X": 0, "Y": 1, "Z": 2}
@@ -341,7 +541,7 @@ class CommandExecutor:
         return {
             "status": "success",
             "object": obj.name,
-            "rotation_euler": [math.degrees(r) for r in obj.rotation_euler],
+            "rotation_euler": [r * _RAD2DEG for r in obj.rotation_euler],
         }
 
     def _cmd_scale_object(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -618,6 +818,17 @@ class CommandExecutor:
             "offset": offset,
         }
 
+    # Mirror axis flags keyed by sorted, lower-cased axis string
+    MIRROR_AXIS_FLAGS = {
+        "x": (True, False, False),
+        "y": (False, True, False),
+        "z": (False, False, True),
+        "xy": (True, True, False),
+        "xz": (True, False, True),
+        "yz": (False, True, True),
+        "xyz": (True, True, True),
+    }
+
     def _cmd_add_mirror(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Add mirror modifier to an object.
 
@@ -647,9 +858,11 @@ class CommandExecutor:
             mod.use_axis = axis[:3] if len(axis) >= 3 else axis + [False] * (3 - len(axis))
         else:
             axis_str = axis.lower()
-            mod.use_axis[0] = "x" in axis_str
-            mod.use_axis[1] = "y" in axis_str
-            mod.use_axis[2] = "z" in axis_str
+            flags = self.MIRROR_AXIS_FLAGS.get("".join(sorted(axis_str)))
+            if flags is None:
+                # Unrecognised spelling (e.g. "x-axis"), fall back to substring matching
+                flags = ("x" in axis_str, "y" in axis_str, "z" in axis_str)
+            mod.use_axis = flags
 
         if mirror_object:
             mirror_obj = bpy.data.objects.get(mirror_object)
@@ -745,16 +958,37 @@ class CommandExecutor:
     def _cmd_get_state(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get current scene state."""
         scene = bpy.context.scene
+        scene_objects = scene.objects
+        count = len(scene_objects)
         objects = []
 
-        for obj in scene.objects:
+        # Read all transforms with one foreach_get per attribute
+        locations = np.empty(count * 3, dtype=np.float64)
+        rotations = np.empty(count * 3, dtype=np.float64)
+        scales = np.empty(count * 3, dtype=np.float64)
+        scene_objects.foreach_get("location", locations)
+        scene_objects.foreach_get("rotation_euler", rotations)
+        scene_objects.foreach_get("scale", scales)
+        np.degrees(rotations, out=rotations)
+
+        # Resolve collection visibility once instead of per-object visible_get()
+        visible_collections = self._visible_collections(bpy.context.view_layer)
+
+        for obj, location, rotation, scale in zip(
+            scene_objects,
+            locations.reshape(count, 3).tolist(),
+            rotations.reshape(count, 3).tolist(),
+            scales.reshape(count, 3).tolist(),
+        ):
             obj_data = {
                 "name": obj.name,
                 "type": obj.type,
-                "location": list(obj.location),
-                "rotation": [math.degrees(r) for r in obj.rotation_euler],
-                "scale": list(obj.scale),
-                "visible": obj.visible_get(),
+                "location": location,
+                "rotation": rotation,
+                "scale": scale,
+                "visible": not obj.hide_viewport
+                and not obj.hide_get()
+                and any(coll in visible_collections for coll in obj.users_collection),
             }
 
             if obj.type == "MESH" and obj.data:
@@ -772,6 +1006,26 @@ class CommandExecutor:
             "objects": objects,
         }
 
+    @staticmethod
+    def _visible_collections(view_layer) -> set:
+        """Collect the collections that are visible in a view layer's viewport.
+
+        Walks the layer-collection tree once. A collection counts as visible if
+        at least one of its layer collections is neither excluded nor hidden,
+        and no ancestor is.
+        """
+        visible = set()
+        stack = [(view_layer.layer_collection, False)]
+        while stack:
+            layer_coll, parent_hidden = stack.pop()
+            hidden = (
+                parent_hidden or layer_coll.exclude or layer_coll.hide_viewport or layer_coll.collection.hide_viewport
+            )
+            if not hidden:
+                visible.add(layer_coll.collection)
+            stack.extend((child, hidden) for child in layer_coll.children)
+        return visible
+
     def _cmd_list_objects(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """List all objects with optional filtering."""
         obj_type = params.get("type")  # Optional type filter
@@ -807,7 +1061,7 @@ class CommandExecutor:
             "name": obj.name,
             "type": obj.type,
             "location": list(obj.location),
-            "rotation_euler": [math.degrees(r) for r in obj.rotation_euler],
+            "rotation_euler": [r * _RAD2DEG for r in obj.rotation_euler],
             "scale": list(obj.scale),
             "dimensions": list(obj.dimensions),
             "visible": obj.visible_get(),
@@ -864,6 +1118,112 @@ class CommandExecutor:
             "location2": list(obj2.location),
         }
 
+    @staticmethod
+    def _read_mesh_topology(mesh) -> Dict[str, np.ndarray]:
+        """Read the loop arrays used by mesh validation.
+
+        Every array is fetched once with foreach_get, so the checks run on
+        flat buffers without building a bmesh copy of the mesh.
+        """
+        loop_count = len(mesh.loops)
+        topology = {
+            "loop_verts": np.empty(loop_count, dtype=np.int32),
+            "loop_edges": np.empty(loop_count, dtype=np.int32),
+        }
+        mesh.loops.foreach_get("vertex_index", topology["loop_verts"])
+        mesh.loops.foreach_get("edge_index", topology["loop_edges"])
+        return topology
+
+    @staticmethod
+    def _face_areas(mesh) -> np.ndarray:
+        """Compute every polygon's area from its loop triangles in one pass."""
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        coords = coords.reshape(-1, 3)
+
+        mesh.calc_loop_triangles()
+        tri_count = len(mesh.loop_triangles)
+        tris = np.empty(tri_count * 3, dtype=np.int32)
+        tri_faces = np.empty(tri_count, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", tris)
+        mesh.loop_triangles.foreach_get("polygon_index", tri_faces)
+        tris = tris.reshape(-1, 3)
+
+        origin = coords[tris[:, 0]]
+        cross = np.cross(coords[tris[:, 1]] - origin, coords[tris[:, 2]] - origin)
+        tri_areas = 0.5 * np.linalg.norm(cross, axis=1)
+
+        # Sum triangle areas back onto the polygon each triangle came from
+        return np.bincount(tri_faces, weights=tri_areas, minlength=len(mesh.polygons))
+
+    @staticmethod
+    def _mesh_fingerprint(mesh) -> tuple:
+        """Identify a mesh's current geometry for validation caching.
+
+        Combines element counts with hashes of the vertex coordinates and
+        loop vertex indices, so any edit that affects the checks changes it.
+        """
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.vertices.foreach_get("co", coords)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+        return (
+            len(mesh.vertices),
+            len(mesh.edges),
+            len(mesh.polygons),
+            len(mesh.loops),
+            hash(coords.tobytes()),
+            hash(loop_verts.tobytes()),
+        )
+
+    # Result keys for the sample indices reported by each validation check
+    VALIDATION_INDEX_KEYS = {
+        "non_manifold_edges": "non_manifold_edge_indices",
+        "loose_vertices": "loose_vertex_indices",
+        "loose_edges": "loose_edge_indices",
+        "zero_area_faces": "zero_area_face_indices",
+        "flipped_normals": "flipped_edge_indices",
+    }
+
+    @staticmethod
+    def _summarize_mask(mask: np.ndarray, limit: int = 10) -> Tuple[int, List[int]]:
+        """Return how many entries of a boolean mask are set and the first few indices."""
+        return int(np.count_nonzero(mask)), np.flatnonzero(mask)[:limit].tolist()
+
+    def _iter_mesh_checks(self, mesh) -> Iterator[Tuple[str, int, List[int]]]:
+        """Yield (check_name, issue_count, sample_indices), cheapest check first.
+
+        Checks are computed lazily so callers can stop at the first failure.
+        """
+        topology = self._read_mesh_topology(mesh)
+        loop_verts = topology["loop_verts"]
+
+        # Loose vertices are not used by any face corner
+        vert_face_counts = np.bincount(loop_verts, minlength=len(mesh.vertices))
+        yield "loose_vertices", *self._summarize_mask(vert_face_counts == 0)
+
+        # Zero-area (degenerate) faces
+        yield "zero_area_faces", *self._summarize_mask(self._face_areas(mesh) < 1e-8)
+
+        # Number of faces using each edge (one loop per face corner)
+        edge_face_counts = np.bincount(topology["loop_edges"], minlength=len(mesh.edges))
+        yield "loose_edges", *self._summarize_mask(edge_face_counts == 0)
+
+        # Manifold edges are shared by exactly two faces
+        yield "non_manifold_edges", *self._summarize_mask(edge_face_counts != 2)
+
+        # Flipped normals: the two faces of a manifold edge must traverse it
+        # in opposite directions, so their loops on that edge start at
+        # different vertices. Boundary and non-manifold edges are skipped.
+        loops_by_edge = np.argsort(topology["loop_edges"], kind="stable")
+        first_slot = np.cumsum(edge_face_counts) - edge_face_counts
+        manifold = np.flatnonzero(edge_face_counts == 2)
+        loop_a = loops_by_edge[first_slot[manifold]]
+        loop_b = loops_by_edge[first_slot[manifold] + 1]
+        flipped = np.zeros(len(mesh.edges), dtype=bool)
+        flipped[manifold] = loop_verts[loop_a] == loop_verts[loop_b]
+        yield "flipped_normals", *self._summarize_mask(flipped)
+
     def _cmd_validate_geometry(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Validate mesh geometry for common issues.
 
@@ -872,17 +1232,18 @@ class CommandExecutor:
         - Loose vertices (vertices not connected to any face)
         - Loose edges (edges not connected to any face)
         - Zero-area faces (degenerate faces)
-        - Flipped normals (faces with inconsistent winding)
+        - Flipped normals (manifold edges whose two faces have inconsistent winding)
 
         Args:
             object: Object name to validate (validates all mesh objects if not specified)
+            quick: Stop at the first failing check and only report its name
 
         Returns:
-            status, validation results with issue counts and details
+            status, validation results with issue counts and details. Results
+            reused from an earlier call on unchanged mesh data have cached=True.
         """
-        import bmesh
-
         obj_name = params.get("object")
+        quick = params.get("quick", False)
 
         # Get objects to validate
         if obj_name:
@@ -893,7 +1254,7 @@ class CommandExecutor:
                 return {"status": "error", "error": f"Object '{obj_name}' is not a mesh"}
             objects_to_check = [obj]
         else:
-            objects_to_check = [o for o in bpy.context.scene.objects if o.type == "MESH"]
+            objects_to_check = scene_cache.get_mesh_objects()
 
         if not objects_to_check:
             return {"status": "error", "error": "No mesh objects to validate"}
@@ -901,88 +1262,46 @@ class CommandExecutor:
         results = []
 
         for obj in objects_to_check:
-            # Create bmesh for analysis
-            bm = bmesh.new()
-            bm.from_mesh(obj.data)
-            bm.verts.ensure_lookup_table()
-            bm.edges.ensure_lookup_table()
-            bm.faces.ensure_lookup_table()
-
-            issues = {
-                "non_manifold_edges": [],
-                "loose_vertices": [],
-                "loose_edges": [],
-                "zero_area_faces": [],
-                "flipped_normals": 0,
-            }
+            mesh = obj.data
+            vertex_count = len(mesh.vertices)
+            edge_count = len(mesh.edges)
+            face_count = len(mesh.polygons)
+
+            # Reuse the previous result while the mesh data is unchanged
+            fingerprint = self._mesh_fingerprint(mesh)
+            cached = self._validation_cache.get(mesh.name_full)
+            if cached is not None and cached[0] == fingerprint:
+                result = dict(cached[1], object=obj.name, cached=True)
+                if quick and not result["valid"]:
+                    failed = next(check for check, count in result["issues"].items() if count)
+                    return {
+                        "status": "success",
+                        "valid": False,
+                        "object": obj.name,
+                        "failed_check": failed,
+                    }
+                results.append(result)
+                continue
 
-            # Check for non-manifold edges
-            for edge in bm.edges:
-                if not edge.is_manifold:
-                    issues["non_manifold_edges"].append(edge.index)
-
-            # Check for loose vertices (not connected to any face)
-            for vert in bm.verts:
-                if not vert.link_faces:
-                    issues["loose_vertices"].append(vert.index)
-
-            # Check for loose edges (not connected to any face)
-            for edge in bm.edges:
-                if not edge.link_faces:
-                    issues["loose_edges"].append(edge.index)
-
-            # Check for zero-area faces (degenerate)
-            for face in bm.faces:
-                if face.calc_area() < 1e-8:
-                    issues["zero_area_faces"].append(face.index)
-
-            # Check for flipped normals using face islands
-            # Count faces that point opposite to their neighbors
-            checked_faces = set()
-            flipped_count = 0
-
-            for face in bm.faces:
-                if face.index in checked_faces:
-                    continue
-
-                # For each linked face, check if normals are consistent
-                for edge in face.edges:
-                    for linked_face in edge.link_faces:
-                        if linked_face == face:
-                            continue
-                        checked_faces.add(linked_face.index)
-
-                        # Check winding consistency via shared edge
-                        # If both faces use the edge in the same direction, one is flipped
-                        face_verts = [v.index for v in face.verts]
-                        linked_verts = [v.index for v in linked_face.verts]
-
-                        edge_v0, edge_v1 = edge.verts[0].index, edge.verts[1].index
-
-                        # Find edge direction in each face
-                        try:
-                            f_idx0 = face_verts.index(edge_v0)
-                            f_idx1 = face_verts.index(edge_v1)
-                            l_idx0 = linked_verts.index(edge_v0)
-                            l_idx1 = linked_verts.index(edge_v1)
-
-                            # Check if edge direction is same (indicates flip)
-                            f_direction = (f_idx1 - f_idx0) % len(face_verts) == 1
-                            l_direction = (l_idx1 - l_idx0) % len(linked_verts) == 1
-
-                            if f_direction == l_direction:
-                                flipped_count += 1
-                        except ValueError:
-                            pass
-
-            issues["flipped_normals"] = flipped_count
+            issues = {}
+            sample_indices = {}
+            for check, count, indices in self._iter_mesh_checks(mesh):
+                issues[check] = count
+                sample_indices[check] = indices
+                if quick and count:
+                    return {
+                        "status": "success",
+                        "valid": False,
+                        "object": obj.name,
+                        "failed_check": check,
+                    }
 
             # Compute summary
             issue_count = (
-                len(issues["non_manifold_edges"])
-                + len(issues["loose_vertices"])
-                + len(issues["loose_edges"])
-                + len(issues["zero_area_faces"])
+                issues["non_manifold_edges"]
+                + issues["loose_vertices"]
+                + issues["loose_edges"]
+                + issues["zero_area_faces"]
                 + (1 if issues["flipped_normals"] > 0 else 0)
             )
 
@@ -991,30 +1310,19 @@ class CommandExecutor:
             result = {
                 "object": obj.name,
                 "valid": is_valid,
-                "vertex_count": len(bm.verts),
-                "edge_count": len(bm.edges),
-                "face_count": len(bm.faces),
-                "issues": {
-                    "non_manifold_edges": len(issues["non_manifold_edges"]),
-                    "loose_vertices": len(issues["loose_vertices"]),
-                    "loose_edges": len(issues["loose_edges"]),
-                    "zero_area_faces": len(issues["zero_area_faces"]),
-                    "flipped_normals": issues["flipped_normals"],
-                },
+                "vertex_count": vertex_count,
+                "edge_count": edge_count,
+                "face_count": face_count,
+                "issues": issues,
             }
 
-            # Include indices only if there are issues (limit to first 10 for brevity)
-            if issues["non_manifold_edges"]:
-                result["non_manifold_edge_indices"] = issues["non_manifold_edges"][:10]
-            if issues["loose_vertices"]:
-                result["loose_vertex_indices"] = issues["loose_vertices"][:10]
-            if issues["loose_edges"]:
-                result["loose_edge_indices"] = issues["loose_edges"][:10]
-            if issues["zero_area_faces"]:
-                result["zero_area_face_indices"] = issues["zero_area_faces"][:10]
+            # Include indices only if there are issues (first 10 for brevity)
+            for check, key in self.VALIDATION_INDEX_KEYS.items():
+                if sample_indices[check]:
+                    result[key] = sample_indices[check]
 
+            self._validation_cache[mesh.name_full] = (fingerprint, result)
             results.append(result)
-            bm.free()
 
         # Overall summary
         all_valid = all(r["valid"] for r in results)
@@ -1163,47 +1471,48 @@ class CommandExecutor:
         Returns:
             status, filepath, dimensions
         """
-        import os
-
         filepath = params.get("filepath", "/tmp/viewport.png")
         width = params.get("width", 1920)
         height = params.get("height", 1080)
 
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        # Ensure directory exists (once per directory for frame sequences)
+        output_dir = os.path.dirname(filepath) or "."
+        if output_dir not in self._known_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            self._known_dirs.add(output_dir)
 
-        # Store original render settings
-        scene = bpy.context.scene
-        orig_res_x = scene.render.resolution_x
-        orig_res_y = scene.render.resolution_y
-        orig_filepath = scene.render.filepath
-        orig_file_format = scene.render.image_settings.file_format
+        # Find a 3D viewport before touching any render settings
+        area = next((a for a in bpy.context.screen.areas if a.type == "VIEW_3D"), None)
+        if area is None:
+            return {
+                "status": "error",
+                "error": "No 3D viewport found",
+            }
 
+        # Determine format from extension
+        ext = os.path.splitext(filepath)[1].lower()
+        file_format = "JPEG" if ext in (".jpg", ".jpeg") else "PNG"
+
+        # Only write (and later restore) settings that actually differ, so
+        # repeated captures at the same size don't invalidate render state
+        render = bpy.context.scene.render
+        overrides = (
+            (render, "resolution_x", width),
+            (render, "resolution_y", height),
+            (render, "filepath", filepath),
+            (render.image_settings, "file_format", file_format),
+        )
+        changed = []
         try:
-            # Configure render settings for viewport capture
-            scene.render.resolution_x = width
-            scene.render.resolution_y = height
-            scene.render.filepath = filepath
-
-            # Determine format from extension
-            ext = os.path.splitext(filepath)[1].lower()
-            if ext == ".jpg" or ext == ".jpeg":
-                scene.render.image_settings.file_format = "JPEG"
-            else:
-                scene.render.image_settings.file_format = "PNG"
-
-            # Find a 3D viewport
-            for area in bpy.context.screen.areas:
-                if area.type == "VIEW_3D":
-                    # Override context for the viewport render
-                    with bpy.context.temp_override(area=area):
-                        bpy.ops.render.opengl(write_still=True)
-                    break
-            else:
-                return {
-                    "status": "error",
-                    "error": "No 3D viewport found",
-                }
+            for owner, attr, value in overrides:
+                original = getattr(owner, attr)
+                if original != value:
+                    setattr(owner, attr, value)
+                    changed.append((owner, attr, original))
+
+            # Override context for the viewport render
+            with bpy.context.temp_override(area=area):
+                bpy.ops.render.opengl(write_still=True)
 
             return {
                 "status": "success",
@@ -1214,10 +1523,18 @@ class CommandExecutor:
 
         finally:
             # Restore original settings
-            scene.render.resolution_x = orig_res_x
-            scene.render.resolution_y = orig_res_y
-            scene.render.filepath = orig_filepath
-            scene.render.image_settings.file_format = orig_file_format
+            for owner, attr, original in reversed(changed):
+                setattr(owner, attr, original)
+
+    # Map direction to Blender view type
+    VIEW_AXIS_TYPES = {
+        "front": "FRONT",
+        "back": "BACK",
+        "left": "LEFT",
+        "right": "RIGHT",
+        "top": "TOP",
+        "bottom": "BOTTOM",
+    }
 
     def _cmd_set_view(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Set viewport camera angle.
@@ -1229,16 +1546,7 @@ class CommandExecutor:
             status, direction
         """
         direction = params.get("direction", "front")
-
-        # Map direction to Blender view type
-        view_map = {
-            "front": "FRONT",
-            "back": "BACK",
-            "left": "LEFT",
-            "right": "RIGHT",
-            "top": "TOP",
-            "bottom": "BOTTOM",
-        }
+        view = direction.lower()
 
         # Find a 3D viewport
         for area in bpy.context.screen.areas:
@@ -1254,18 +1562,18 @@ class CommandExecutor:
                         return {"status": "error", "error": "No viewport region found"}
 
                     with bpy.context.temp_override(area=area, region=region):
-                        if direction.lower() == "isometric":
+                        if view == "isometric":
                             # Set to isometric-like view (rotate from front)
                             bpy.ops.view3d.view_axis(type="FRONT")
                             # Orbit to get isometric angle
                             rv3d = area.spaces.active.region_3d
                             rv3d.view_perspective = "PERSP"
                             # Set rotation for isometric view (approx 45° azimuth, 35° elevation)
-                            from mathutils import Euler
-
-                            rv3d.view_rotation = Euler((math.radians(60), 0, math.radians(45)), "XYZ").to_quaternion()
-                        elif direction.lower() in view_map:
-                            bpy.ops.view3d.view_axis(type=view_map[direction.lower()])
+                            rv3d.view_rotation = mathutils.Euler(
+                                (math.radians(60), 0, math.radians(45)), "XYZ"
+                            ).to_quaternion()
+                        elif view in self.VIEW_AXIS_TYPES:
+                            bpy.ops.view3d.view_axis(type=self.VIEW_AXIS_TYPES[view])
                         else:
                             return {
                                 "status": "error",
@@ -1359,12 +1667,17 @@ class CommandExecutor:
                 return {"status": "error", "error": f"Object '{name}' not found"}
             target_objs.append(obj)
 
-        # Solo mode: hide all objects not in target list
+        # Solo mode: hide all objects not in target list in one batched write.
+        # foreach_set skips RNA updates; the per-target assignments below still
+        # go through RNA and tag the depsgraph relations for the whole file.
         if solo:
-            for obj in bpy.data.objects:
-                if obj not in target_objs:
-                    obj.hide_viewport = True
-                    obj.hide_render = True
+            snapshot = scene_cache.get_snapshot()
+            hidden = np.ones(len(snapshot.objects), dtype=bool)
+            hidden[[snapshot.index[obj.name_full] for obj in target_objs]] = False
+            if not np.array_equal(hidden, snapshot.hide_viewport):
+                bpy.data.objects.foreach_set("hide_viewport", hidden)
+            if not np.array_equal(hidden, snapshot.hide_render):
+                bpy.data.objects.foreach_set("hide_render", hidden)
 
         # Set visibility for target objects
         for obj in target_objs:
@@ -1378,6 +1691,71 @@ class CommandExecutor:
             "solo": solo,
         }
 
+    # =========================================================================
+    # BATCH OPERATIONS
+    # =========================================================================
+
+    # Commands execute_batch may dispatch
+    BATCH_COMMANDS = frozenset(
+        {
+            "create_cube",
+            "create_sphere",
+            "create_cylinder",
+            "create_cone",
+            "move_object",
+            "rotate_object",
+            "scale_object",
+            "add_rigid_body",
+            "add_rigid_body_bulk",
+            "add_cloth",
+            "add_collision",
+            "add_fluid_domain",
+            "add_fluid_flow",
+            "add_fluid_effector",
+            "add_soft_body",
+            "bake_physics",
+        }
+    )
+
+    def _cmd_execute_batch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run several commands in order in one call.
+
+        Args:
+            commands: List of {command, params}; stops at the first failure
+
+        Returns:
+            status, number of commands applied, per-command results
+        """
+        commands = params.get("commands", [])
+        if not commands:
+            return {"status": "error", "error": "commands list is required"}
+
+        results = []
+        for i, entry in enumerate(commands):
+            command = entry.get("command")
+            if command not in self.BATCH_COMMANDS:
+                return {
+                    "status": "error",
+                    "error": f"Command {i}: '{command}' cannot be batched",
+                    "applied": i,
+                    "results": results,
+                }
+            result = self.execute(command, entry.get("params", {}))
+            if result.get("status") not in ("success", "started"):
+                return {
+                    "status": "error",
+                    "error": f"Command {i} ({command}): {result.get('error', 'Unknown error')}",
+                    "applied": i,
+                    "results": results,
+                }
+            results.append(result)
+
+        return {
+            "status": "success",
+            "applied": len(results),
+            "results": results,
+        }
+
     # =========================================================================
     # PHYSICS OPERATIONS
     # =========================================================================
@@ -1392,6 +1770,10 @@ class CommandExecutor:
             friction: Surface friction 0-1 (default: 0.5)
             restitution: Bounciness 0-1 (default: 0.0)
             shape: Collision shape - CONVEX_HULL, MESH, BOX, SPHERE, etc.
+            use_margin: Use a custom collision margin (default: False)
+            collision_margin: Margin in meters, used with use_margin (default: 0.04)
+            quality_preset: FAST, BALANCED or ACCURATE substeps and solver
+                iterations, applied only when this creates the rigid body world
 
         Returns:
             status, object name, rigid body configuration
@@ -1399,24 +1781,32 @@ class CommandExecutor:
         obj_name = params.get("object")
         body_type = params.get("type", "ACTIVE")  # ACTIVE or PASSIVE
         mass = params.get("mass", 1.0)
-        friction = params.get("friction", 0.5)
-        restitution = params.get("restitution", 0.0)
         collision_shape = params.get("shape", "CONVEX_HULL")
+        quality_preset = params.get("quality_preset")
 
         obj = bpy.data.objects.get(obj_name)
         if not obj:
             return {"status": "error", "error": f"Object '{obj_name}' not found"}
+        if quality_preset is not None and quality_preset not in RIGID_BODY_QUALITY_PRESETS:
+            return {
+                "status": "error",
+                "error": f"Invalid quality_preset: {quality_preset}. Valid: {list(RIGID_BODY_QUALITY_PRESETS)}",
+            }
 
-        # Make active and add rigid body
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.rigidbody.object_add(type=body_type)
+        # Add the rigid body against the object directly instead of making it
+        # active; this creates the world if needed
+        scene = bpy.context.scene
+        world_created = scene.rigidbody_world is None
+        with bpy.context.temp_override(object=obj, active_object=obj):
+            bpy.ops.rigidbody.object_add(type=body_type)
+
+        # Don't override settings of a world that already existed
+        if world_created and quality_preset is not None:
+            rbw = scene.rigidbody_world
+            rbw.substeps_per_frame, rbw.solver_iterations = RIGID_BODY_QUALITY_PRESETS[quality_preset]
 
         # Configure
-        rb = obj.rigid_body
-        rb.mass = mass
-        rb.friction = friction
-        rb.restitution = restitution
-        rb.collision_shape = collision_shape
+        self._configure_rigid_body(obj.rigid_body, params)
 
         return {
             "status": "success",
@@ -1428,6 +1818,68 @@ class CommandExecutor:
             },
         }
 
+    @staticmethod
+    def _configure_rigid_body(rb, params: Dict[str, Any]):
+        """Apply add_rigid_body settings to a newly added rigid body."""
+        rb.mass = params.get("mass", 1.0)
+        rb.friction = params.get("friction", 0.5)
+        rb.restitution = params.get("restitution", 0.0)
+        rb.collision_shape = params.get("shape", "CONVEX_HULL")
+        # A new rigid body starts with the margin disabled
+        if params.get("use_margin", False):
+            rb.use_margin = True
+            rb.collision_margin = params.get("collision_margin", 0.04)
+
+    def _cmd_add_rigid_body_bulk(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add rigid body physics to several objects with one objects_add call.
+
+        Args:
+            objects: List of object names (required)
+            Other settings as for add_rigid_body, applied to every object
+
+        Returns:
+            status, object names, rigid body configuration
+        """
+        names = params.get("objects", [])
+        body_type = params.get("type", "ACTIVE")
+        quality_preset = params.get("quality_preset")
+
+        if not names:
+            return {"status": "error", "error": "objects list is required"}
+        objects = []
+        for name in names:
+            obj = bpy.data.objects.get(name)
+            if not obj:
+                return {"status": "error", "error": f"Object '{name}' not found"}
+            objects.append(obj)
+        if quality_preset is not None and quality_preset not in RIGID_BODY_QUALITY_PRESETS:
+            return {
+                "status": "error",
+                "error": f"Invalid quality_preset: {quality_preset}. Valid: {list(RIGID_BODY_QUALITY_PRESETS)}",
+            }
+
+        scene = bpy.context.scene
+        world_created = scene.rigidbody_world is None
+        with bpy.context.temp_override(selected_objects=objects, active_object=objects[0], object=objects[0]):
+            bpy.ops.rigidbody.objects_add(type=body_type)
+
+        if world_created and quality_preset is not None:
+            rbw = scene.rigidbody_world
+            rbw.substeps_per_frame, rbw.solver_iterations = RIGID_BODY_QUALITY_PRESETS[quality_preset]
+
+        for obj in objects:
+            self._configure_rigid_body(obj.rigid_body, params)
+
+        return {
+            "status": "success",
+            "objects": [obj.name for obj in objects],
+            "rigid_body": {
+                "type": body_type,
+                "mass": params.get("mass", 1.0),
+                "shape": params.get("shape", "CONVEX_HULL"),
+            },
+        }
+
     def _cmd_add_cloth(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Add cloth simulation modifier to an object.
 
@@ -1435,6 +1887,8 @@ class CommandExecutor:
             object: Object name (required) - must be a mesh
             mass: Cloth mass in kg (default: 0.3)
             stiffness: Tension and compression stiffness (default: 15.0)
+            quality: Quality steps (default: 5)
+            quality_preset: FAST, BALANCED or ACCURATE (optional, overrides quality)
 
         Returns:
             status, object name, cloth configuration
@@ -1442,16 +1896,26 @@ class CommandExecutor:
         obj_name = params.get("object")
         mass = params.get("mass", 0.3)
         stiffness = params.get("stiffness", 15.0)
+        quality = params.get("quality", 5)
+        quality_preset = params.get("quality_preset")
 
         obj = bpy.data.objects.get(obj_name)
         if not obj:
             return {"status": "error", "error": f"Object '{obj_name}' not found"}
+        if quality_preset is not None:
+            if quality_preset not in CLOTH_QUALITY_PRESETS:
+                return {
+                    "status": "error",
+                    "error": f"Invalid quality_preset: {quality_preset}. Valid: {list(CLOTH_QUALITY_PRESETS)}",
+                }
+            quality = CLOTH_QUALITY_PRESETS[quality_preset]
 
         # Add cloth modifier
         mod = obj.modifiers.new(name="Cloth", type="CLOTH")
 
         # Configure
         cloth = mod.settings
+        cloth.quality = quality
         cloth.mass = mass
         cloth.tension_stiffness = stiffness
         cloth.compression_stiffness = stiffness
@@ -1460,6 +1924,7 @@ class CommandExecutor:
             "status": "success",
             "object": obj.name,
             "cloth": {
+                "quality": quality,
                 "mass": mass,
                 "stiffness": stiffness,
             },
@@ -1474,12 +1939,15 @@ class CommandExecutor:
         Args:
             frame_start: First frame to bake (default: 1)
             frame_end: Last frame to bake (default: 250)
+            background: Run the bake as a background job and return
+                immediately (default: False)
 
         Returns:
-            status, frame range
+            status ('started' for background bakes), frame range
         """
         frame_start = params.get("frame_start", 1)
         frame_end = params.get("frame_end", 250)
+        background = params.get("background", False)
 
         # Set frame range
         bpy.context.scene.frame_start = frame_start
@@ -1487,6 +1955,16 @@ class CommandExecutor:
 
         # Bake rigid body simulation if exists
         if bpy.context.scene.rigidbody_world:
+            if background:
+                # INVOKE_DEFAULT runs the point cache bake as a window-manager
+                # job, so the UI keeps redrawing while it runs
+                bpy.ops.ptcache.bake_all("INVOKE_DEFAULT", bake=True)
+                return {
+                    "status": "started",
+                    "frame_start": frame_start,
+                    "frame_end": frame_end,
+                    "message": "Physics bake started in background.",
+                }
             bpy.ops.ptcache.bake_all(bake=True)
 
         return {
@@ -1599,20 +2077,21 @@ class CommandExecutor:
         cache_dir = domain_settings.cache_directory
         is_baked = domain_settings.cache_frame_end > 0
 
-        # Check for cache files to estimate progress
-        import os
-
-        cache_files = []
-        if os.path.exists(cache_dir):
-            cache_files = [f for f in os.listdir(cache_dir) if f.endswith(".bobj.gz") or f.endswith(".uni")]
-
         # Determine bake state
         frame_start = bpy.context.scene.frame_start
         frame_end = bpy.context.scene.frame_end
         total_frames = frame_end - frame_start + 1
 
-        # Estimate progress from cache files
-        baked_frames = len(cache_files)
+        # Estimate progress from cache files, stopping once every frame is accounted for
+        baked_frames = 0
+        if os.path.isdir(cache_dir):
+            with os.scandir(cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith((".bobj.gz", ".uni")):
+                        baked_frames += 1
+                        if baked_frames >= total_frames:
+                            break
+
         progress = min(100, int((baked_frames / max(1, total_frames)) * 100))
 
         return {
@@ -1675,6 +2154,18 @@ class CommandExecutor:
     # MATERIAL OPERATIONS
     # =========================================================================
 
+    def _set_bsdf_inputs(self, bsdf, values: Dict[str, Any]):
+        """Set Principled BSDF input defaults by socket position.
+
+        Socket positions differ between Blender versions, so they are
+        resolved by name once and then indexed directly.
+        """
+        if self._bsdf_input_index is None:
+            self._bsdf_input_index = {socket.name: i for i, socket in enumerate(bsdf.inputs)}
+        inputs = bsdf.inputs
+        for name, value in values.items():
+            inputs[self._bsdf_input_index[name]].default_value = value
+
     def _cmd_create_material(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new PBR material with Principled BSDF shader.
 
@@ -1698,9 +2189,7 @@ class CommandExecutor:
         # Get principled BSDF node
         bsdf = mat.node_tree.nodes.get("Principled BSDF")
         if bsdf:
-            bsdf.inputs["Base Color"].default_value = color
-            bsdf.inputs["Metallic"].default_value = metallic
-            bsdf.inputs["Roughness"].default_value = roughness
+            self._set_bsdf_inputs(bsdf, {"Base Color": color, "Metallic": metallic, "Roughness": roughness})
 
         return {
             "status": "success",
@@ -1708,15 +2197,11 @@ class CommandExecutor:
             "color": color,
         }
 
-    def _cmd_assign_material(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_with_object
+    def _cmd_assign_material(self, params: Dict[str, Any], obj) -> Dict[str, Any]:
         """Assign a material to an object."""
-        obj_name = params.get("object")
         mat_name = params.get("material")
 
-        obj = bpy.data.objects.get(obj_name)
-        if not obj:
-            return {"status": "error", "error": f"Object '{obj_name}' not found"}
-
         mat = bpy.data.materials.get(mat_name)
         if not mat:
             return {"status": "error", "error": f"Material '{mat_name}' not found"}
@@ -1737,16 +2222,90 @@ class CommandExecutor:
     # ENGINEERING MATERIAL OPERATIONS (Server-synced)
     # =========================================================================
 
+    def _start_material_prefetch(self):
+        """Fetch the full material library in a background thread, once."""
+        if self._material_prefetch is not None or not self.materials_client:
+            return
+        self._material_prefetch = threading.Thread(target=self._prefetch_materials, daemon=True)
+        self._material_prefetch.start()
+
+    def _prefetch_materials(self):
+        """Populate the material cache from list_materials().
+
+        A failure is kept in _material_prefetch_error and returned as a
+        warning by list_engineering_materials.
+        """
+        try:
+            materials = self.materials_client.list_materials()
+        except Exception as e:
+            self._material_prefetch_error = str(e)
+            return
+        with self._materials_lock:
+            self._material_cache.update({m.id: m for m in materials})
+            self._material_cache_complete = True
+
+    def _get_material_cached(self, material_id: str):
+        """Get an engineering material, fetching it from the server only once.
+
+        Args:
+            material_id: Engineering material id
+
+        Returns:
+            The material, or None if the server doesn't know it
+        """
+        material = self._material_cache.get(material_id)
+        if material is None:
+            # Fetched directly rather than waiting for a running prefetch
+            material = self.materials_client.get_material(material_id)
+            if material is not None:
+                with self._materials_lock:
+                    self._material_cache[material_id] = material
+        self._start_material_prefetch()
+        return material
+
+    def _get_categories(self) -> List[str]:
+        """Get the material categories, asking the server once per cache refresh."""
+        if self._categories_cache is None:
+            self._categories_cache = self.materials_client.get_categories()
+        return self._categories_cache
+
     def _cmd_list_engineering_materials(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """List available engineering materials from the server library."""
+        """List available engineering materials from the server library.
+
+        Args:
+            category: Only list materials in this category
+            name_contains: Only list materials whose name contains this text (case-insensitive)
+            min_density: Only list materials at least this dense (kg/m^3)
+            page_limit: Maximum number of materials to return (default: all)
+            page_offset: Number of matching materials to skip (default: 0)
+
+        Returns:
+            status, materials on this page, total match count, paging info, categories
+        """
         if not self.materials_client:
             return {"status": "error", "error": "Materials client not available"}
 
         category = params.get("category")
+        name_contains = params.get("name_contains")
+        min_density = params.get("min_density")
+        page_limit = params.get("page_limit")
+        page_offset = max(0, params.get("page_offset", 0))
 
         try:
-            materials = self.materials_client.list_materials(category=category)
-            return {
+            # Serve from the prefetched library when it holds every material
+            if self._material_cache_complete:
+                materials = [m for m in self._material_cache.values() if category is None or m.category == category]
+            else:
+                materials = self.materials_client.list_materials(category=category)
+            if name_contains:
+                needle = name_contains.lower()
+                materials = [m for m in materials if needle in m.name.lower()]
+            if min_density is not None:
+                materials = [m for m in materials if m.density_kg_m3 and m.density_kg_m3 >= min_density]
+
+            page_end = len(materials) if page_limit is None else page_offset + max(0, page_limit)
+            page = materials[page_offset:page_end]
+            result = {
                 "status": "success",
                 "materials": [
                     {
@@ -1754,13 +2313,18 @@ class CommandExecutor:
                         "name": m.name,
                         "category": m.category,
                         "density_kg_m3": m.density_kg_m3,
-                        "youngs_modulus_gpa": (m.youngs_modulus_pa / 1e9) if m.youngs_modulus_pa else None,
+                        "youngs_modulus_gpa": (m.youngs_modulus_pa * _PA_TO_GPA) if m.youngs_modulus_pa else None,
                     }
-                    for m in materials
+                    for m in page
                 ],
                 "count": len(materials),
-                "categories": self.materials_client.get_categories(),
+                "page_offset": page_offset,
+                "more_data_available": page_end < len(materials),
+                "categories": self._get_categories(),
             }
+            if self._material_prefetch_error:
+                result["warning"] = f"Material prefetch failed: {self._material_prefetch_error}"
+            return result
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
@@ -1774,7 +2338,7 @@ class CommandExecutor:
             return {"status": "error", "error": "material_id is required"}
 
         try:
-            material = self.materials_client.get_material(material_id)
+            material = self._get_material_cached(material_id)
             if not material:
                 return {"status": "error", "error": f"Material '{material_id}' not found"}
 
@@ -1785,7 +2349,52 @@ class CommandExecutor:
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
-    def _cmd_assign_engineering_material(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_visual_material(self, material) -> bpy.types.Material:
+        """Get the visual Blender material for an engineering material.
+
+        Engineering materials that look the same share one Blender material.
+        A hash of the shader inputs is stored on each visual material, and
+        the first material made for an appearance (named Conjure_<id> after
+        the engineering material that created it) is reused for the rest.
+        """
+        appearance = (tuple(material.base_color), material.metallic, material.roughness)
+        key = hashlib.blake2b(repr(appearance).encode(), digest_size=8).hexdigest()
+
+        visual_mat = self._visual_mat_cache.get(key)
+        if visual_mat is not None and _material_alive(visual_mat):
+            return visual_mat
+
+        # Not cached yet this session (or deleted): look for a material made
+        # earlier, e.g. in a saved file, before creating one
+        visual_mat = next(
+            (mat for mat in bpy.data.materials if mat.get(_APPEARANCE_PROP) == key),
+            None,
+        )
+        if visual_mat is None:
+            visual_mat_name = f"Conjure_{material.id}"
+            visual_mat = bpy.data.materials.get(visual_mat_name)
+            # A Conjure_<id> material with another appearance may be shared,
+            # so only one without a stored hash is taken over
+            if visual_mat is None or _APPEARANCE_PROP in visual_mat:
+                visual_mat = bpy.data.materials.new(name=visual_mat_name)
+            visual_mat.use_nodes = True
+
+            bsdf = visual_mat.node_tree.nodes.get("Principled BSDF")
+            if bsdf:
+                r, g, b = material.base_color
+                values = {"Base Color": (r, g, b, 1.0)}
+                if material.metallic is not None:
+                    values["Metallic"] = material.metallic
+                if material.roughness is not None:
+                    values["Roughness"] = material.roughness
+                self._set_bsdf_inputs(bsdf, values)
+            visual_mat[_APPEARANCE_PROP] = key
+
+        self._visual_mat_cache[key] = visual_mat
+        return visual_mat
+
+    @_with_object
+    def _cmd_assign_engineering_material(self, params: Dict[str, Any], obj) -> Dict[str, Any]:
         """
         Assign an engineering material to an object.
 
@@ -1796,26 +2405,19 @@ class CommandExecutor:
         if not self.materials_client:
             return {"status": "error", "error": "Materials client not available"}
 
-        obj_name = params.get("object")
         material_id = params.get("material_id")
         apply_visual = params.get("apply_visual", True)
 
-        if not obj_name:
-            return {"status": "error", "error": "object is required"}
         if not material_id:
             return {"status": "error", "error": "material_id is required"}
 
-        obj = bpy.data.objects.get(obj_name)
-        if not obj:
-            return {"status": "error", "error": f"Object '{obj_name}' not found"}
-
         # Get the engineering material
-        material = self.materials_client.get_material(material_id)
+        material = self._get_material_cached(material_id)
         if not material:
             return {"status": "error", "error": f"Engineering material '{material_id}' not found"}
 
         # Store the engineering material assignment
-        self.materials_client.assign_material(obj_name, material_id)
+        self.materials_client.assign_material(obj.name, material_id)
 
         # Store in object custom properties for persistence
         obj["conjure_material_id"] = material_id
@@ -1836,23 +2438,7 @@ class CommandExecutor:
 
         # Optionally apply visual material
         if apply_visual and material.base_color:
-            visual_mat_name = f"Conjure_{material.id}"
-
-            # Create or get the visual material
-            visual_mat = bpy.data.materials.get(visual_mat_name)
-            if not visual_mat:
-                visual_mat = bpy.data.materials.new(name=visual_mat_name)
-                visual_mat.use_nodes = True
-
-            # Update visual properties
-            bsdf = visual_mat.node_tree.nodes.get("Principled BSDF")
-            if bsdf:
-                r, g, b = material.base_color
-                bsdf.inputs["Base Color"].default_value = (r, g, b, 1.0)
-                if material.metallic is not None:
-                    bsdf.inputs["Metallic"].default_value = material.metallic
-                if material.roughness is not None:
-                    bsdf.inputs["Roughness"].default_value = material.roughness
+            visual_mat = self._get_visual_material(material)
 
             # Assign to object
             if obj.data and hasattr(obj.data, "materials"):
@@ -1865,16 +2451,9 @@ class CommandExecutor:
 
         return result
 
-    def _cmd_get_object_engineering_material(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_with_object
+    def _cmd_get_object_engineering_material(self, params: Dict[str, Any], obj) -> Dict[str, Any]:
         """Get the engineering material assigned to an object."""
-        obj_name = params.get("object")
-        if not obj_name:
-            return {"status": "error", "error": "object is required"}
-
-        obj = bpy.data.objects.get(obj_name)
-        if not obj:
-            return {"status": "error", "error": f"Object '{obj_name}' not found"}
-
         # Check custom properties first
         material_id = obj.get("conjure_material_id")
         if not material_id:
@@ -1889,7 +2468,7 @@ class CommandExecutor:
         material_data = {"id": material_id, "name": obj.get("conjure_material_name", "Unknown")}
 
         if self.materials_client:
-            material = self.materials_client.get_material(material_id)
+            material = self._get_material_cached(material_id)
             if material:
                 material_data = material.to_dict()
 
@@ -1899,24 +2478,19 @@ class CommandExecutor:
             "engineering_material": material_data,
         }
 
-    def _cmd_clear_engineering_material(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Clear the engineering material assignment from an object."""
-        obj_name = params.get("object")
-        if not obj_name:
-            return {"status": "error", "error": "object is required"}
-
-        obj = bpy.data.objects.get(obj_name)
-        if not obj:
-            return {"status": "error", "error": f"Object '{obj_name}' not found"}
+    # Custom properties that record an object's engineering material
+    ENGINEERING_MATERIAL_PROPS = ("conjure_material_id", "conjure_material_name", "conjure_density_kg_m3")
 
+    @_with_object
+    def _cmd_clear_engineering_material(self, params: Dict[str, Any], obj) -> Dict[str, Any]:
+        """Clear the engineering material assignment from an object."""
         # Clear custom properties
-        for prop in ["conjure_material_id", "conjure_material_name", "conjure_density_kg_m3"]:
-            if prop in obj:
-                del obj[prop]
+        for prop in self.ENGINEERING_MATERIAL_PROPS:
+            obj.pop(prop, None)
 
         # Clear from materials client
         if self.materials_client:
-            self.materials_client.clear_object_material(obj_name)
+            self.materials_client.clear_object_material(obj.name)
 
         return {
             "status": "success",
@@ -1930,14 +2504,23 @@ class CommandExecutor:
             return {"status": "error", "error": "Materials client not available"}
 
         try:
+            with self._materials_lock:
+                self._material_cache.clear()
+                self._material_cache_complete = False
             success = self.materials_client.refresh_cache()
             if success:
                 materials = self.materials_client.list_materials()
+                with self._materials_lock:
+                    self._material_cache.update({m.id: m for m in materials})
+                    self._material_cache_complete = True
+                self._material_prefetch_error = None
+            if success:
+                self._categories_cache = None
                 return {
                     "status": "success",
                     "message": "Materials cache refreshed",
                     "material_count": len(materials),
-                    "categories": self.materials_client.get_categories(),
+                    "categories": self._get_categories(),
                 }
             else:
                 return {"status": "error", "error": "Failed to refresh cache"}
@@ -1948,20 +2531,25 @@ class CommandExecutor:
     # ANIMATION OPERATIONS
     # =========================================================================
 
-    def _cmd_insert_keyframe(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Insert a keyframe on an object property."""
-        obj_name = params.get("object")
+    # Combined keyframe options expanded to their transform channels
+    KEYFRAME_PATH_GROUPS = {
+        "LOCROT": ("location", "rotation_euler"),
+        "LOCROTSCALE": ("location", "rotation_euler", "scale"),
+    }
+
+    @_with_object
+    def _cmd_insert_keyframe(self, params: Dict[str, Any], obj) -> Dict[str, Any]:
+        """Insert a keyframe on an object property (or LOCROT / LOCROTSCALE)."""
         data_path = params.get("data_path", "location")
         frame = params.get("frame")
 
-        obj = bpy.data.objects.get(obj_name)
-        if not obj:
-            return {"status": "error", "error": f"Object '{obj_name}' not found"}
-
-        if frame is not None:
-            bpy.context.scene.frame_set(frame)
+        # frame_set re-evaluates the whole depsgraph, so skip it when already there
+        scene = bpy.context.scene
+        if frame is not None and scene.frame_current != frame:
+            scene.frame_set(frame)
 
-        obj.keyframe_insert(data_path=data_path)
+        for path in self.KEYFRAME_PATH_GROUPS.get(data_path, (data_path,)):
+            obj.keyframe_insert(data_path=path)
 
         return {
             "status": "success",
@@ -1970,6 +2558,44 @@ class CommandExecutor:
             "frame": bpy.context.scene.frame_current,
         }
 
+    def _cmd_insert_keyframes_batch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert many keyframes, changing the scene frame once per distinct frame.
+
+        Args:
+            inserts: List of {object, data_path (default: location), frame (optional)}
+
+        Returns:
+            status, number of keyframes inserted, frames visited
+        """
+        inserts = params.get("inserts", [])
+        if not inserts:
+            return {"status": "error", "error": "inserts list is required"}
+
+        # Validate all objects exist and group by frame (None = current frame)
+        by_frame: Dict[Optional[int], List[Tuple[Any, str]]] = {}
+        for insert in inserts:
+            obj_name = insert.get("object")
+            obj = bpy.data.objects.get(obj_name)
+            if not obj:
+                return {"status": "error", "error": f"Object '{obj_name}' not found"}
+            by_frame.setdefault(insert.get("frame"), []).append((obj, insert.get("data_path", "location")))
+
+        scene = bpy.context.scene
+        frames = []
+        for frame, keys in by_frame.items():
+            if frame is not None and scene.frame_current != frame:
+                scene.frame_set(frame)
+            for obj, data_path in keys:
+                for path in self.KEYFRAME_PATH_GROUPS.get(data_path, (data_path,)):
+                    obj.keyframe_insert(data_path=path)
+            frames.append(scene.frame_current)
+
+        return {
+            "status": "success",
+            "keyframes_inserted": len(inserts),
+            "frames": frames,
+        }
+
     def _cmd_create_armature(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create an armature for rigging."""
         name = params.get("name", "Armature")
@@ -1986,6 +2612,96 @@ class CommandExecutor:
             "bones": len(obj.data.bones),
         }
 
+    def _cmd_add_bone(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add one or more bones to an armature in a single edit-mode pass.
+
+        Args:
+            armature: Armature object name (required)
+            bones: List of {name, head, tail, parent_bone, connected} (optional;
+                   without it a single bone is read from these params)
+
+        Returns:
+            status, armature, added bone names
+        """
+        armature_name = params.get("armature")
+        obj = bpy.data.objects.get(armature_name) if armature_name else None
+        if not obj or obj.type != "ARMATURE":
+            return {"status": "error", "error": f"Armature '{armature_name}' not found"}
+
+        bones = params.get("bones") or [params]
+
+        # One edit-mode pass for the batch; the previous active object,
+        # selection and mode are restored afterwards
+        with bone_edit_session(obj) as edit_bones:
+            added = [
+                add_edit_bone(
+                    edit_bones,
+                    spec.get("name", "Bone"),
+                    spec.get("head", (0.0, 0.0, 0.0)),
+                    spec.get("tail", (0.0, 0.0, 1.0)),
+                    spec.get("parent_bone"),
+                    spec.get("connected", False),
+                ).name
+                for spec in bones
+            ]
+
+        return {
+            "status": "success",
+            "armature": obj.name,
+            "bones": added,
+        }
+
+    def _cmd_pose_bones_batch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Pose many bones of an armature in one call.
+
+        Pose bone transforms don't need pose mode, so no mode switch is made.
+
+        Args:
+            armature: Armature object name (required)
+            bones: List of {name, location, rotation, scale} (required)
+            insert_keyframe: Key the transforms at the current frame (optional, default: False)
+
+        Returns:
+            status, number of bones posed, names not found
+        """
+        armature_name = params.get("armature")
+        bones = params.get("bones", [])
+        insert_keyframe = params.get("insert_keyframe", False)
+
+        obj = bpy.data.objects.get(armature_name) if armature_name else None
+        if not obj or obj.type != "ARMATURE":
+            return {"status": "error", "error": f"Armature '{armature_name}' not found"}
+        if not bones:
+            return {"status": "error", "error": "bones list is required"}
+
+        pose_bones = obj.pose.bones
+        missing = []
+        posed = 0
+        for entry in bones:
+            pose_bone = pose_bones.get(entry.get("name", ""))
+            if pose_bone is None:
+                missing.append(entry.get("name"))
+                continue
+
+            if "location" in entry:
+                pose_bone.location = entry["location"]
+            if "rotation" in entry:
+                pose_bone.rotation_euler = entry["rotation"]
+            if "scale" in entry:
+                pose_bone.scale = entry["scale"]
+
+            if insert_keyframe:
+                for path in self.KEYFRAME_PATH_GROUPS["LOCROTSCALE"]:
+                    pose_bone.keyframe_insert(data_path=path)
+            posed += 1
+
+        return {
+            "status": "success",
+            "armature": obj.name,
+            "posed": posed,
+            "missing": missing,
+        }
+
     # =========================================================================
     # SIMULATION OPERATIONS (Phase 3)
     # =========================================================================
@@ -1997,8 +2713,6 @@ class CommandExecutor:
         This is used by the server's /api/v1/simulation/dynamic-properties endpoint
         when routing simulation to this Blender client.
         """
-        from ..adapters.simulation_adapter import get_simulation_adapter
-
         obj_name = params.get("object")
         material_id = params.get("material_id")
         density = params.get("density")
@@ -2037,8 +2751,6 @@ class CommandExecutor:
         This is used by the server's /api/v1/simulation/run endpoint
         when routing physics simulations to this Blender client.
         """
-        from ..adapters.simulation_adapter import get_simulation_adapter
-
         simulation_type = params.get("simulation_type")
         objects = params.get("objects", [])
         frame_start = params.get("frame_start", 1)
@@ -2079,8 +2791,6 @@ class CommandExecutor:
 
         Used for transferring geometry between Conjure clients/server.
         """
-        from ..adapters.simulation_adapter import get_simulation_adapter
-
         obj_name = params.get("object")
         include_materials = params.get("include_materials", False)
 
@@ -2102,19 +2812,33 @@ class CommandExecutor:
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
+    # Largest UGF mesh accepted by import_geometry_ugf
+    MAX_UGF_VERTICES = 5_000_000
+    MAX_UGF_FACES = 10_000_000
+
     def _cmd_import_geometry_ugf(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Import geometry from Universal Geometry Format (UGF).
 
         Used for receiving geometry from other Conjure clients/server.
         """
-        from ..adapters.simulation_adapter import get_simulation_adapter
-
         ugf_data = params.get("ugf")
         object_name = params.get("name")
 
         if not ugf_data:
             return {"status": "error", "error": "ugf data is required"}
+        if not isinstance(ugf_data, dict):
+            return {"status": "error", "error": "ugf data must be an object"}
+
+        # Reject oversized payloads before building any mesh data
+        vertex_count = len(ugf_data.get("vertices") or ())
+        face_count = len(ugf_data.get("faces") or ())
+        if vertex_count > self.MAX_UGF_VERTICES or face_count > self.MAX_UGF_FACES:
+            return {
+                "status": "error",
+                "error": f"UGF payload too large: {vertex_count} vertices, {face_count} faces "
+                f"(max {self.MAX_UGF_VERTICES} vertices, {self.MAX_UGF_FACES} faces)",
+            }
 
         try:
             adapter = get_simulation_adapter()
@@ -2130,9 +2854,21 @@ class CommandExecutor:
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
-    def _cmd_add_soft_body(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _get_or_add_modifier(obj, name: str, mod_type: str):
+        """Return the object's modifier of a physics type, adding it if missing.
+
+        Physics modifiers can only be added once per object, so repeated
+        commands update the existing modifier in place instead.
+        """
+        mod = find_modifier(obj, name, mod_type)
+        if mod is None:
+            mod = obj.modifiers.new(name=name, type=mod_type)
+        return mod
+
+    @_with_object
+    def _cmd_add_soft_body(self, params: Dict[str, Any], obj) -> Dict[str, Any]:
         """Add soft body simulation to an object."""
-        obj_name = params.get("object")
         mass = params.get("mass", 1.0)
         friction = params.get("friction", 0.5)
         speed = params.get("speed", 1.0)
@@ -2142,12 +2878,8 @@ class CommandExecutor:
         pull = params.get("pull", 0.9)
         push = params.get("push", 0.9)
 
-        obj = bpy.data.objects.get(obj_name)
-        if not obj:
-            return {"status": "error", "error": f"Object '{obj_name}' not found"}
-
         # Add soft body modifier
-        mod = obj.modifiers.new(name="Softbody", type="SOFT_BODY")
+        mod = self._get_or_add_modifier(obj, "Softbody", "SOFT_BODY")
         sb = mod.settings
 
         sb.mass = mass
@@ -2176,7 +2908,8 @@ class CommandExecutor:
         "ultra": 256,  # Maximum quality, very slow
     }
 
-    def _cmd_add_fluid_domain(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_with_object
+    def _cmd_add_fluid_domain(self, params: Dict[str, Any], obj) -> Dict[str, Any]:
         """Add fluid domain to an object.
 
         Args:
@@ -2192,7 +2925,6 @@ class CommandExecutor:
         Returns:
             status, object name, fluid domain settings
         """
-        obj_name = params.get("object")
         domain_type = params.get("domain_type", "LIQUID")
         preset = params.get("preset", "medium")
         resolution = params.get("resolution_max")
@@ -2201,10 +2933,6 @@ class CommandExecutor:
         use_mesh = params.get("use_mesh", True)
         cache_dir = params.get("cache_directory")
 
-        obj = bpy.data.objects.get(obj_name)
-        if not obj:
-            return {"status": "error", "error": f"Object '{obj_name}' not found"}
-
         # Resolve resolution from preset if not explicitly provided
         if resolution is None:
             if preset not in self.FLUID_RESOLUTION_PRESETS:
@@ -2215,8 +2943,9 @@ class CommandExecutor:
             resolution = self.FLUID_RESOLUTION_PRESETS[preset]
 
         # Add fluid modifier
-        mod = obj.modifiers.new(name="Fluid", type="FLUID")
-        mod.fluid_type = "DOMAIN"
+        mod = self._get_or_add_modifier(obj, "Fluid", "FLUID")
+        if mod.fluid_type != "DOMAIN":
+            mod.fluid_type = "DOMAIN"
 
         domain = mod.domain_settings
         domain.domain_type = domain_type
@@ -2242,20 +2971,17 @@ class CommandExecutor:
             },
         }
 
-    def _cmd_add_fluid_flow(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_with_object
+    def _cmd_add_fluid_flow(self, params: Dict[str, Any], obj) -> Dict[str, Any]:
         """Add fluid flow (source/inflow) to an object."""
-        obj_name = params.get("object")
         flow_type = params.get("flow_type", "LIQUID")
         flow_behavior = params.get("flow_behavior", "INFLOW")
         use_inflow = params.get("use_inflow", True)
         velocity_factor = params.get("velocity_factor", 1.0)
 
-        obj = bpy.data.objects.get(obj_name)
-        if not obj:
-            return {"status": "error", "error": f"Object '{obj_name}' not found"}
-
-        mod = obj.modifiers.new(name="Fluid", type="FLUID")
-        mod.fluid_type = "FLOW"
+        mod = self._get_or_add_modifier(obj, "Fluid", "FLUID")
+        if mod.fluid_type != "FLOW":
+            mod.fluid_type = "FLOW"
 
         flow = mod.flow_settings
         flow.flow_type = flow_type
@@ -2272,20 +2998,17 @@ class CommandExecutor:
             },
         }
 
-    def _cmd_add_fluid_effector(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_with_object
+    def _cmd_add_fluid_effector(self, params: Dict[str, Any], obj) -> Dict[str, Any]:
         """Add fluid effector (obstacle/guide) to an object."""
-        obj_name = params.get("object")
         effector_type = params.get("effector_type", "COLLISION")
         use_effector = params.get("use_effector", True)
         subframes = params.get("subframes", 0)
         surface_distance = params.get("surface_distance", 0.0)
 
-        obj = bpy.data.objects.get(obj_name)
-        if not obj:
-            return {"status": "error", "error": f"Object '{obj_name}' not found"}
-
-        mod = obj.modifiers.new(name="Fluid", type="FLUID")
-        mod.fluid_type = "EFFECTOR"
+        mod = self._get_or_add_modifier(obj, "Fluid", "FLUID")
+        if mod.fluid_type != "EFFECTOR":
+            mod.fluid_type = "EFFECTOR"
 
         effector = mod.effector_settings
         effector.effector_type = effector_type
@@ -2301,18 +3024,14 @@ class CommandExecutor:
             },
         }
 
-    def _cmd_add_collision(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_with_object
+    def _cmd_add_collision(self, params: Dict[str, Any], obj) -> Dict[str, Any]:
         """Add collision modifier for cloth/soft body interaction."""
-        obj_name = params.get("object")
         damping = params.get("damping", 0.0)
         thickness_outer = params.get("thickness_outer", 0.02)
         friction = params.get("friction", 0.0)
 
-        obj = bpy.data.objects.get(obj_name)
-        if not obj:
-            return {"status": "error", "error": f"Object '{obj_name}' not found"}
-
-        mod = obj.modifiers.new(name="Collision", type="COLLISION")
+        mod = self._get_or_add_modifier(obj, "Collision", "COLLISION")
         coll = mod.settings
         coll.damping = damping
         coll.thickness_outer = thickness_outer
@@ -2327,19 +3046,16 @@ class CommandExecutor:
             },
         }
 
-    def _cmd_remove_rigid_body(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_with_object
+    def _cmd_remove_rigid_body(self, params: Dict[str, Any], obj) -> Dict[str, Any]:
         """Remove rigid body physics from an object."""
-        obj_name = params.get("object")
-
-        obj = bpy.data.objects.get(obj_name)
-        if not obj:
-            return {"status": "error", "error": f"Object '{obj_name}' not found"}
-
         if not obj.rigid_body:
-            return {"status": "error", "error": f"Object '{obj_name}' has no rigid body"}
+            return {"status": "error", "error": f"Object '{obj.name}' has no rigid body"}
 
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.rigidbody.object_remove()
+        # Run against the object directly instead of making it active;
+        # RigidBodyObject has no data-API removal
+        with bpy.context.temp_override(object=obj, active_object=obj):
+            bpy.ops.rigidbody.object_remove()
 
         return {
             "status": "success",
@@ -2347,24 +3063,19 @@ class CommandExecutor:
             "message": "Rigid body removed",
         }
 
-    def _cmd_remove_cloth(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @_with_object
+    def _cmd_remove_cloth(self, params: Dict[str, Any], obj) -> Dict[str, Any]:
         """Remove cloth modifier from an object."""
-        obj_name = params.get("object")
+        mod = find_modifier(obj, "Cloth", "CLOTH")
+        if mod is None:
+            return {"status": "error", "error": f"Object '{obj.name}' has no cloth modifier"}
 
-        obj = bpy.data.objects.get(obj_name)
-        if not obj:
-            return {"status": "error", "error": f"Object '{obj_name}' not found"}
-
-        for mod in obj.modifiers:
-            if mod.type == "CLOTH":
-                obj.modifiers.remove(mod)
-                return {
-                    "status": "success",
-                    "object": obj.name,
-                    "message": "Cloth modifier removed",
-                }
-
-        return {"status": "error", "error": f"Object '{obj_name}' has no cloth modifier"}
+        obj.modifiers.remove(mod)
+        return {
+            "status": "success",
+            "object": obj.name,
+            "message": "Cloth modifier removed",
+        }
 
     def _cmd_configure_rigid_body_world(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Configure rigid body world settings."""
@@ -2379,46 +3090,55 @@ class CommandExecutor:
         if scene.rigidbody_world is None:
             bpy.ops.rigidbody.world_add()
 
+        # Only write settings that differ; every write tags the depsgraph and
+        # invalidates the rigid body cache
         rbw = scene.rigidbody_world
-        rbw.time_scale = time_scale
-        rbw.substeps_per_frame = substeps
-        rbw.solver_iterations = solver_iterations
-        scene.gravity = mathutils.Vector(gravity)
+        if rbw.time_scale != time_scale:
+            rbw.time_scale = time_scale
+        if rbw.substeps_per_frame != substeps:
+            rbw.substeps_per_frame = substeps
+        if rbw.solver_iterations != solver_iterations:
+            rbw.solver_iterations = solver_iterations
+        if scene.gravity[:] != tuple(gravity):
+            scene.gravity = gravity
 
         return {
             "status": "success",
             "rigid_body_world": {
-                "gravity": list(scene.gravity),
+                "gravity": gravity,
                 "time_scale": time_scale,
                 "substeps": substeps,
                 "solver_iterations": solver_iterations,
             },
         }
 
+    # Static response for get_simulation_capabilities, built once
+    SIMULATION_CAPABILITIES = {
+        "status": "success",
+        "capabilities": {
+            "physics": {
+                "supported": True,
+                "types": ["rigid_body", "soft_body", "cloth", "fluid"],
+                "gpu_accelerated": True,
+                "realtime_capable": True,
+            },
+            "dynamic_properties": {
+                "supported": True,
+                "mass_calculation": True,
+                "volume_calculation": True,
+                "center_of_mass": True,
+                "moments_of_inertia": True,
+                "surface_area": True,
+            },
+            "heat_transfer": {"supported": False},
+            "flow_analysis": {"supported": False},
+            "structural": {"supported": False},
+        },
+    }
+
     def _cmd_get_simulation_capabilities(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get the simulation capabilities of this Blender client."""
-        return {
-            "status": "success",
-            "capabilities": {
-                "physics": {
-                    "supported": True,
-                    "types": ["rigid_body", "soft_body", "cloth", "fluid"],
-                    "gpu_accelerated": True,
-                    "realtime_capable": True,
-                },
-                "dynamic_properties": {
-                    "supported": True,
-                    "mass_calculation": True,
-                    "volume_calculation": True,
-                    "center_of_mass": True,
-                    "moments_of_inertia": True,
-                    "surface_area": True,
-                },
-                "heat_transfer": {"supported": False},
-                "flow_analysis": {"supported": False},
-                "structural": {"supported": False},
-            },
-        }
+        return self.SIMULATION_CAPABILITIES
 
     # =========================================================================
     # GEOMETRY NODES OPERATIONS
@@ -2426,8 +3146,6 @@ class CommandExecutor:
 
     def _cmd_create_node_group(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new Geometry Nodes modifier/group."""
-        from ..adapters.nodes_adapter import get_nodes_adapter
-
         adapter = get_nodes_adapter()
         return adapter.create_node_group(
             name=params.get("name", "GeometryNodes"),
@@ -2436,8 +3154,6 @@ class CommandExecutor:
 
     def _cmd_add_node(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Add a node to a geometry node group."""
-        from ..adapters.nodes_adapter import get_nodes_adapter
-
         adapter = get_nodes_adapter()
         return adapter.add_node(
             node_group_name=params["node_group_name"],
@@ -2449,8 +3165,6 @@ class CommandExecutor:
 
     def _cmd_connect_nodes(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Connect two nodes in a geometry node group."""
-        from ..adapters.nodes_adapter import get_nodes_adapter
-
         adapter = get_nodes_adapter()
         return adapter.connect_nodes(
             node_group_name=params["node_group_name"],
@@ -2462,8 +3176,6 @@ class CommandExecutor:
 
     def _cmd_set_node_input(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Set a node input value."""
-        from ..adapters.nodes_adapter import get_nodes_adapter
-
         adapter = get_nodes_adapter()
         return adapter.set_node_input(
             node_group_name=params["node_group_name"],
@@ -2474,8 +3186,6 @@ class CommandExecutor:
 
     def _cmd_add_group_input(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Add an input to the node group interface."""
-        from ..adapters.nodes_adapter import get_nodes_adapter
-
         adapter = get_nodes_adapter()
         return adapter.add_group_input(
             node_group_name=params["node_group_name"],
@@ -2486,8 +3196,6 @@ class CommandExecutor:
 
     def _cmd_get_node_group_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get information about a geometry node group."""
-        from ..adapters.nodes_adapter import get_nodes_adapter
-
         adapter = get_nodes_adapter()
         return adapter.get_node_group_info(
             node_group_name=params["node_group_name"],
@@ -2495,8 +3203,6 @@ class CommandExecutor:
 
     def _cmd_apply_node_group(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Apply a geometry node group to an object as a modifier."""
-        from ..adapters.nodes_adapter import get_nodes_adapter
-
         adapter = get_nodes_adapter()
         return adapter.apply_node_group(
             object_name=params["object_name"],
@@ -2506,8 +3212,6 @@ class CommandExecutor:
 
     def _cmd_create_procedural_grid(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create a procedural grid with optional wave deformation."""
-        from ..adapters.nodes_adapter import get_nodes_adapter
-
         adapter = get_nodes_adapter()
         return adapter.create_procedural_grid(
             object_name=params.get("object_name", "ProceduralGrid"),
@@ -2528,15 +3232,23 @@ class CommandExecutor:
 
         Args:
             frame: Frame number to set (required)
+            subframe: Fraction between frames, 0.0 to 1.0 (optional, default: 0.0)
 
         Returns:
             status, current frame
         """
         frame = params.get("frame", 1)
-        bpy.context.scene.frame_set(frame)
+        subframe = params.get("subframe", 0.0)
+
+        # frame_set re-evaluates the whole depsgraph, so skip it for the current frame
+        scene = bpy.context.scene
+        if scene.frame_current != frame or scene.frame_subframe != subframe:
+            scene.frame_set(frame, subframe=subframe)
+
         return {
             "status": "success",
-            "frame": bpy.context.scene.frame_current,
+            "frame": scene.frame_current,
+            "subframe": scene.frame_subframe,
         }
 
     def _cmd_set_frame_range(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -2578,9 +3290,8 @@ class CommandExecutor:
             bpy.ops.screen.animation_play()
 
         # Check if animation is playing (this may not reflect immediate state change)
-        is_playing = (
-            bpy.context.screen.is_animation_playing if hasattr(bpy.context.screen, "is_animation_playing") else True
-        )
+        screen = bpy.context.screen
+        is_playing = screen.is_animation_playing if _HAS_IS_ANIMATION_PLAYING and screen is not None else True
 
         return {
             "status": "success",
@@ -2592,6 +3303,67 @@ class CommandExecutor:
     # RENDER OPERATIONS
     # =========================================================================
 
+    # Cycles compute backends, fastest first
+    CYCLES_GPU_BACKENDS = ("OPTIX", "CUDA", "HIP", "ONEAPI", "METAL")
+
+    def _enable_cycles_gpu(self) -> Dict[str, Any]:
+        """Render the scene's Cycles on the GPU when one is available.
+
+        Devices are probed once per session; without a GPU the scene's device
+        setting is left as it is.
+
+        Returns:
+            Dict with the selected backend and enabled device names
+        """
+        if self._cycles_gpu is None:
+            self._cycles_gpu = self._probe_cycles_gpu()
+
+        cycles = bpy.context.scene.cycles
+        if self._cycles_gpu["gpu_backend"] is not None and cycles.device != "GPU":
+            cycles.device = "GPU"
+        return dict(self._cycles_gpu)
+
+    def _probe_cycles_gpu(self) -> Dict[str, Any]:
+        """Find a Cycles GPU backend without downgrading the user's preferences.
+
+        A compute device type the user already chose is kept, as is their
+        device selection; GPU devices are only enabled when none of that type
+        are. If no GPU is found the original compute device type is restored.
+
+        Returns:
+            Dict with the selected backend and enabled device names
+        """
+        addon = bpy.context.preferences.addons.get("cycles")
+        if addon is None:
+            return {"gpu_backend": None, "gpu_devices": []}
+
+        cprefs = addon.preferences
+        original = cprefs.compute_device_type
+        candidates = (original,) if original != "NONE" else self.CYCLES_GPU_BACKENDS
+
+        backend = None
+        for device_type in candidates:
+            try:
+                cprefs.compute_device_type = device_type
+            except TypeError:
+                continue
+            cprefs.get_devices()
+            if any(d.type == device_type for d in cprefs.devices):
+                backend = device_type
+                break
+
+        if backend is None:
+            if cprefs.compute_device_type != original:
+                cprefs.compute_device_type = original
+            return {"gpu_backend": None, "gpu_devices": []}
+
+        gpus = [d for d in cprefs.devices if d.type == backend]
+        if not any(d.use for d in gpus):
+            for device in gpus:
+                device.use = True
+
+        return {"gpu_backend": backend, "gpu_devices": [d.name for d in gpus if d.use]}
+
     def _cmd_render_image(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Render current frame to image file.
 
@@ -2599,23 +3371,58 @@ class CommandExecutor:
             filepath: Output file path (required)
             engine: Render engine (optional, e.g., CYCLES, BLENDER_EEVEE)
             samples: Sample count for rendering (optional)
+            use_gpu: Render Cycles on the GPU when one is available (optional, default: True)
+            noise_threshold: Cycles adaptive sampling noise threshold; enables adaptive
+                             sampling (optional, default: scene setting)
+            min_samples: Cycles adaptive sampling minimum samples, 0 for automatic
+                         (optional, default: scene setting)
+            tile_size: Cycles tile size, e.g. 2048 to render a GPU frame as one tile
+                       (optional, default: scene setting)
+            persistent_data: Keep Cycles scene data between renders, trading memory
+                             for faster frame sequences (optional, default: scene setting)
 
         Returns:
             status, filepath
         """
-        import os
-
         filepath = params.get("filepath", "/tmp/render.png")
         engine = params.get("engine")
         samples = params.get("samples")
-
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        use_gpu = params.get("use_gpu", True)
+        noise_threshold = params.get("noise_threshold")
+        min_samples = params.get("min_samples")
+        tile_size = params.get("tile_size")
+        persistent_data = params.get("persistent_data")
+
+        # Ensure directory exists (once per directory for frame sequences)
+        output_dir = os.path.dirname(filepath) or "."
+        if output_dir not in self._known_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            self._known_dirs.add(output_dir)
 
         # Optionally set render engine
         if engine:
             bpy.context.scene.render.engine = engine
 
+        gpu_info = {}
+        if bpy.context.scene.render.engine == "CYCLES":
+            if use_gpu:
+                gpu_info = self._enable_cycles_gpu()
+
+            # Sampling and tiling are scene settings, so only change what was asked for
+            cycles = bpy.context.scene.cycles
+            if noise_threshold is not None:
+                cycles.use_adaptive_sampling = True
+                cycles.adaptive_threshold = noise_threshold
+            if min_samples is not None:
+                cycles.adaptive_min_samples = min_samples
+            if tile_size is not None:
+                cycles.use_auto_tile = True
+                cycles.tile_size = tile_size
+
+            # Reuse BVH, textures and shaders from the previous render
+            if persistent_data is not None:
+                bpy.context.scene.render.use_persistent_data = bool(persistent_data)
+
         # Optionally set samples
         if samples:
             if bpy.context.scene.render.engine == "CYCLES":
@@ -2625,39 +3432,53 @@ class CommandExecutor:
 
         # Set output path and render
         bpy.context.scene.render.filepath = filepath
-        bpy.ops.render.render(write_still=True)
+        try:
+            bpy.ops.render.render(write_still=True)
+        except RuntimeError:
+            # The directory may have been removed since it was created
+            self._known_dirs.discard(output_dir)
+            raise
 
         return {
             "status": "success",
             "filepath": filepath,
             "engine": bpy.context.scene.render.engine,
+            **gpu_info,
         }
 
+    RENDER_ENGINES = frozenset({"CYCLES", "BLENDER_EEVEE", "BLENDER_EEVEE_NEXT", "BLENDER_WORKBENCH"})
+
     def _cmd_set_render_engine(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Set render engine.
 
         Args:
             engine: Render engine name (required)
                     Options: CYCLES, BLENDER_EEVEE, BLENDER_EEVEE_NEXT, BLENDER_WORKBENCH
+            use_gpu: Render Cycles on the GPU when one is available (optional, default: True)
 
         Returns:
             status, current engine
         """
         engine = params.get("engine", "CYCLES")
+        use_gpu = params.get("use_gpu", True)
 
         # Validate engine name
-        valid_engines = ["CYCLES", "BLENDER_EEVEE", "BLENDER_EEVEE_NEXT", "BLENDER_WORKBENCH"]
-        if engine.upper() not in valid_engines:
+        if engine.upper() not in self.RENDER_ENGINES:
             return {
                 "status": "error",
-                "error": f"Invalid engine: {engine}. Valid options: {valid_engines}",
+                "error": f"Invalid engine: {engine}. Valid options: {sorted(self.RENDER_ENGINES)}",
             }
 
         bpy.context.scene.render.engine = engine.upper()
 
+        gpu_info = {}
+        if use_gpu and bpy.context.scene.render.engine == "CYCLES":
+            gpu_info = self._enable_cycles_gpu()
+
         return {
             "status": "success",
             "engine": bpy.context.scene.render.engine,
+            **gpu_info,
         }
 
     def _cmd_set_render_resolution(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -2669,23 +3490,53 @@ class CommandExecutor:
             percentage: Resolution percentage scale (optional, default: 100)
 
         Returns:
-            status, resolution settings
+            status, resolution settings and effective output size
         """
         width = params.get("width", 1920)
         height = params.get("height", 1080)
         percentage = params.get("percentage", 100)
 
-        bpy.context.scene.render.resolution_x = width
-        bpy.context.scene.render.resolution_y = height
-        bpy.context.scene.render.resolution_percentage = percentage
+        # Every write invalidates render results and previews, so skip unchanged values
+        render = bpy.context.scene.render
+        if render.resolution_x != width:
+            render.resolution_x = width
+        if render.resolution_y != height:
+            render.resolution_y = height
+        if render.resolution_percentage != percentage:
+            render.resolution_percentage = percentage
 
         return {
             "status": "success",
             "width": width,
             "height": height,
             "percentage": percentage,
+            "effective_width": width * percentage // 100,
+            "effective_height": height * percentage // 100,
         }
 
+    @staticmethod
+    def _link_new_object(name: str, data, location) -> bpy.types.Object:
+        """Create an object in the active collection and make it active.
+
+        The data-API equivalent of the object add operators, without the
+        operator call and its context setup.
+        """
+        obj = bpy.data.objects.new(name, data)
+        obj.location = location
+        bpy.context.collection.objects.link(obj)
+        bpy.context.view_layer.objects.active = obj
+        return obj
+
+    # 3-point rig: role, name, location, rotation (radians), area size
+    STUDIO_LIGHTS = (
+        # Key light - main light, positioned high and to the side
+        ("key", "Studio_Key", (5, -5, 8), (60 * _DEG2RAD, 0, 45 * _DEG2RAD), 2),
+        # Fill light - softer light on opposite side
+        ("fill", "Studio_Fill", (-4, -3, 4), (45 * _DEG2RAD, 0, -30 * _DEG2RAD), 3),
+        # Rim light - backlight for edge definition
+        ("rim", "Studio_Rim", (0, 6, 5), (120 * _DEG2RAD, 0, 180 * _DEG2RAD), 1.5),
+    )
+
     def _cmd_create_studio_lighting(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create 3-point studio lighting setup.
 
@@ -2705,34 +3556,16 @@ class CommandExecutor:
         fill_energy = params.get("fill_energy", 300) * intensity
         rim_energy = params.get("rim_energy", 500) * intensity
 
+        energies = {"key": key_energy, "fill": fill_energy, "rim": rim_energy}
         created_lights = []
 
-        # Key light - main light, positioned high and to the side
-        bpy.ops.object.light_add(type="AREA", location=(5, -5, 8))
-        key_light = bpy.context.active_object
-        key_light.name = "Studio_Key"
-        key_light.data.energy = key_energy
-        key_light.data.size = 2
-        key_light.rotation_euler = (math.radians(60), 0, math.radians(45))
-        created_lights.append(key_light.name)
-
-        # Fill light - softer light on opposite side
-        bpy.ops.object.light_add(type="AREA", location=(-4, -3, 4))
-        fill_light = bpy.context.active_object
-        fill_light.name = "Studio_Fill"
-        fill_light.data.energy = fill_energy
-        fill_light.data.size = 3
-        fill_light.rotation_euler = (math.radians(45), 0, math.radians(-30))
-        created_lights.append(fill_light.name)
-
-        # Rim light - backlight for edge definition
-        bpy.ops.object.light_add(type="AREA", location=(0, 6, 5))
-        rim_light = bpy.context.active_object
-        rim_light.name = "Studio_Rim"
-        rim_light.data.energy = rim_energy
-        rim_light.data.size = 1.5
-        rim_light.rotation_euler = (math.radians(120), 0, math.radians(180))
-        created_lights.append(rim_light.name)
+        for role, name, location, rotation, size in self.STUDIO_LIGHTS:
+            light_data = bpy.data.lights.new(name, "AREA")
+            light_data.energy = energies[role]
+            light_data.size = size
+            light = self._link_new_object(name, light_data, location)
+            light.rotation_euler = rotation
+            created_lights.append(light.name)
 
         return {
             "status": "success",
@@ -2772,14 +3605,14 @@ class CommandExecutor:
             }
             exec_locals = {}
 
-            exec(script, exec_globals, exec_locals)
+            exec(_compile_script(script), exec_globals, exec_locals)
 
             # Return any result variable if set
             result = exec_locals.get("result")
 
             return {
                 "status": "success",
-                "result": str(result) if result is not None else None,
+                "result": result if result is None or isinstance(result, str) else _RESULT_REPR.repr(result),
             }
         except Exception as e:
             return {
@@ -2787,6 +3620,9 @@ class CommandExecutor:
                 "error": f"{type(e).__name__}: {str(e)}",
             }
 
+    # Items of an iterable evaluate result included in the response
+    EVALUATE_MAX_ITEMS = 100
+
     def _cmd_evaluate(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate Python expression and return result.
 
@@ -2794,7 +3630,7 @@ class CommandExecutor:
             expression: Python expression to evaluate (required)
 
         Returns:
-            status, evaluation result
+            status, evaluation result (and total_count when an iterable was truncated)
         """
         expression = params.get("expression", "")
 
@@ -2809,28 +3645,51 @@ class CommandExecutor:
                 "math": math,
             }
 
-            result = eval(expression, eval_globals)
-
-            # Convert result to JSON-serializable format
-            if hasattr(result, "__iter__") and not isinstance(result, (str, dict)):
+            result = eval(_compile_expression(expression), eval_globals)
+
+            # Convert result to JSON-serializable format, keeping only the
+            # first items of large iterables such as bpy.data collections
+            total_count = None
+            if hasattr(result, "__iter__") and not isinstance(result, (str, dict, list, tuple)):
+                items = iter(result)
+                head = list(itertools.islice(items, self.EVALUATE_MAX_ITEMS))
+                total_count = len(head) + sum(1 for _ in items)
+                result = head
+            elif isinstance(result, tuple):
                 result = list(result)
 
-            return {
+            response = {
                 "status": "success",
-                "result": str(result)
+                "result": _RESULT_REPR.repr(result)
                 if not isinstance(result, (str, int, float, bool, list, dict, type(None)))
                 else result,
             }
+            if total_count is not None and total_count > len(result):
+                response["total_count"] = total_count
+            return response
         except Exception as e:
             return {
                 "status": "error",
                 "error": f"{type(e).__name__}: {str(e)}",
             }
 
+    def _cmd_clear_script_cache(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop the compiled run_script and evaluate code objects.
+
+        Returns:
+            status, number of cached entries cleared
+        """
+        cleared = _compile_script.cache_info().currsize + _compile_expression.cache_info().currsize
+        _compile_script.cache_clear()
+        _compile_expression.cache_clear()
+        return {"status": "success", "cleared": cleared}
+
     # =========================================================================
     # SCENE OPERATIONS
     # =========================================================================
 
+    LIGHT_TYPES = frozenset({"POINT", "SUN", "SPOT", "AREA"})
+
     def _cmd_add_light(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Add a light to the scene.
 
@@ -2851,20 +3710,19 @@ class CommandExecutor:
         color = params.get("color")
 
         # Validate light type
-        valid_types = ["POINT", "SUN", "SPOT", "AREA"]
-        if light_type not in valid_types:
+        if light_type not in self.LIGHT_TYPES:
             return {
                 "status": "error",
-                "error": f"Invalid light type: {light_type}. Valid options: {valid_types}",
+                "error": f"Invalid light type: {light_type}. Valid options: {sorted(self.LIGHT_TYPES)}",
             }
 
-        bpy.ops.object.light_add(type=light_type, location=tuple(location))
-        light = bpy.context.active_object
-        light.name = name
-        light.data.energy = energy
+        light_data = bpy.data.lights.new(name, light_type)
+        light_data.energy = energy
 
         if color:
-            light.data.color = tuple(color[:3])
+            light_data.color = tuple(color[:3])
+
+        light = self._link_new_object(name, light_data, tuple(location))
 
         return {
             "status": "success",
@@ -2891,13 +3749,12 @@ class CommandExecutor:
         rotation = params.get("rotation", [60, 0, 0])
         lens = params.get("lens", 50)
 
-        bpy.ops.object.camera_add(location=tuple(location))
-        camera = bpy.context.active_object
-        camera.name = name
-        camera.data.lens = lens
+        camera_data = bpy.data.cameras.new(name)
+        camera_data.lens = lens
+        camera = self._link_new_object(name, camera_data, tuple(location))
 
         # Apply rotation in degrees
-        camera.rotation_euler = [math.radians(r) for r in rotation]
+        camera.rotation_euler = [r * _DEG2RAD for r in rotation]
 
         return {
             "status": "success",
@@ -2920,7 +3777,6 @@ class CommandExecutor:
         keep_cameras = params.get("keep_cameras", False)
         keep_lights = params.get("keep_lights", False)
 
-        deleted_count = 0
         objects_to_delete = []
 
         for obj in bpy.data.objects:
@@ -2930,9 +3786,10 @@ class CommandExecutor:
                 continue
             objects_to_delete.append(obj)
 
-        for obj in objects_to_delete:
-            bpy.data.objects.remove(obj, do_unlink=True)
-            deleted_count += 1
+        # One batched removal instead of relinking the scene per object
+        deleted_count = len(objects_to_delete)
+        if objects_to_delete:
+            bpy.data.batch_remove(ids=objects_to_delete)
 
         return {
             "status": "success",
@@ -2975,6 +3832,60 @@ class CommandExecutor:
     # IMPORT OPERATIONS
     # =========================================================================
 
+    def _import_with_capture(self, importer: Callable, root_scale: float = 1.0, **kwargs) -> List[bpy.types.Object]:
+        """Run an import operator and return the objects it created.
+
+        The importer runs with a temporary collection active, so its objects
+        are read straight from that collection instead of diffing
+        bpy.data.objects. They are then moved to the previously active
+        collection. A root_scale other than 1.0 is applied to the imported
+        hierarchy roots.
+        """
+        view_layer = bpy.context.view_layer
+        previous = view_layer.active_layer_collection
+        target = previous.collection
+
+        capture = bpy.data.collections.new("_conjure_import_tmp")
+        bpy.context.scene.collection.children.link(capture)
+        try:
+            view_layer.active_layer_collection = view_layer.layer_collection.children[capture.name]
+            importer(**kwargs)
+            if root_scale != 1.0:
+                self._apply_import_scale(capture, root_scale)
+        finally:
+            view_layer.active_layer_collection = previous
+            new_objects = list(capture.all_objects)
+            for child in capture.children:
+                target.children.link(child)
+            for obj in capture.objects:
+                target.objects.link(obj)
+            bpy.data.collections.remove(capture)
+
+        return new_objects
+
+    @staticmethod
+    def _apply_import_scale(capture: bpy.types.Collection, scale: float):
+        """Scale imported hierarchies from their roots so children aren't scaled twice.
+
+        Objects linked directly to the capture collection are written in one
+        foreach_set call; roots inside importer-created child collections are
+        set one by one.
+        """
+        imported = set(capture.all_objects)
+        direct = capture.objects
+        count = len(direct)
+        if count:
+            roots = np.fromiter((obj.parent not in imported for obj in direct), dtype=bool, count=count)
+            scales = np.empty(count * 3, dtype=np.float32)
+            direct.foreach_get("scale", scales)
+            scales.reshape(-1, 3)[roots] = scale
+            direct.foreach_set("scale", scales)
+
+        direct_set = set(direct)
+        for obj in imported:
+            if obj not in direct_set and obj.parent not in imported:
+                obj.scale = (scale, scale, scale)
+
     def _cmd_import_stl(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Import an STL file.
 
@@ -2991,26 +3902,12 @@ class CommandExecutor:
         if not filepath:
             return {"status": "error", "error": "filepath is required"}
 
-        # Remember objects before import
-        objects_before = set(bpy.data.objects.keys())
-
-        bpy.ops.wm.stl_import(filepath=filepath)
-
-        # Find newly imported objects
-        objects_after = set(bpy.data.objects.keys())
-        new_objects = list(objects_after - objects_before)
-
-        # Apply scale if needed
-        if scale != 1.0:
-            for obj_name in new_objects:
-                obj = bpy.data.objects.get(obj_name)
-                if obj:
-                    obj.scale = (scale, scale, scale)
+        new_objects = self._import_with_capture(bpy.ops.wm.stl_import, root_scale=scale, filepath=filepath)
 
         return {
             "status": "success",
             "filepath": filepath,
-            "imported_objects": new_objects,
+            "imported_objects": [obj.name for obj in new_objects],
             "scale": scale,
         }
 
@@ -3030,23 +3927,12 @@ class CommandExecutor:
         if not filepath:
             return {"status": "error", "error": "filepath is required"}
 
-        objects_before = set(bpy.data.objects.keys())
-
-        bpy.ops.wm.obj_import(filepath=filepath)
-
-        objects_after = set(bpy.data.objects.keys())
-        new_objects = list(objects_after - objects_before)
-
-        if scale != 1.0:
-            for obj_name in new_objects:
-                obj = bpy.data.objects.get(obj_name)
-                if obj:
-                    obj.scale = (scale, scale, scale)
+        new_objects = self._import_with_capture(bpy.ops.wm.obj_import, root_scale=scale, filepath=filepath)
 
         return {
             "status": "success",
             "filepath": filepath,
-            "imported_objects": new_objects,
+            "imported_objects": [obj.name for obj in new_objects],
             "scale": scale,
         }
 
@@ -3064,17 +3950,12 @@ class CommandExecutor:
         if not filepath:
             return {"status": "error", "error": "filepath is required"}
 
-        objects_before = set(bpy.data.objects.keys())
-
-        bpy.ops.import_scene.gltf(filepath=filepath)
-
-        objects_after = set(bpy.data.objects.keys())
-        new_objects = list(objects_after - objects_before)
+        new_objects = self._import_with_capture(bpy.ops.import_scene.gltf, filepath=filepath)
 
         return {
             "status": "success",
             "filepath": filepath,
-            "imported_objects": new_objects,
+            "imported_objects": [obj.name for obj in new_objects],
         }
 
     def _cmd_import_fbx(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -3093,17 +3974,12 @@ class CommandExecutor:
         if not filepath:
             return {"status": "error", "error": "filepath is required"}
 
-        objects_before = set(bpy.data.objects.keys())
-
-        bpy.ops.import_scene.fbx(filepath=filepath, global_scale=scale)
-
-        objects_after = set(bpy.data.objects.keys())
-        new_objects = list(objects_after - objects_before)
+        new_objects = self._import_with_capture(bpy.ops.import_scene.fbx, filepath=filepath, global_scale=scale)
 
         return {
             "status": "success",
             "filepath": filepath,
-            "imported_objects": new_objects,
+            "imported_objects": [obj.name for obj in new_objects],
             "scale": scale,
         }
 
@@ -3132,16 +4008,12 @@ class CommandExecutor:
         if not obj:
             return {"status": "error", "error": f"Object '{obj_name}' not found"}
 
-        # Select and make active
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-
-        bpy.ops.object.transform_apply(
-            location=apply_location,
-            rotation=apply_rotation,
-            scale=apply_scale,
-        )
+        with _selected((obj,), obj):
+            bpy.ops.object.transform_apply(
+                location=apply_location,
+                rotation=apply_rotation,
+                scale=apply_scale,
+            )
 
         return {
             "status": "success",
@@ -3183,12 +4055,8 @@ class CommandExecutor:
                 "error": f"Invalid origin type: {origin_type}. Valid options: {list(type_map.keys())}",
             }
 
-        # Select and make active
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-
-        bpy.ops.object.origin_set(type=type_map[origin_type])
+        with _selected((obj,), obj):
+            bpy.ops.object.origin_set(type=type_map[origin_type])
 
         return {
             "status": "success",
@@ -3248,26 +4116,27 @@ class CommandExecutor:
         if not object_names or len(object_names) < 2:
             return {"status": "error", "error": "At least 2 objects required to join"}
 
-        # Get all objects
+        # Resolve every name from one pass over bpy.data.objects rather than
+        # a name scan per lookup
+        objects_by_name = {obj.name: obj for obj in bpy.data.objects}
+
         objects = []
         for name in object_names:
-            obj = bpy.data.objects.get(name)
+            obj = objects_by_name.get(name)
             if not obj:
                 return {"status": "error", "error": f"Object '{name}' not found"}
             objects.append(obj)
 
         # Determine target
-        target = bpy.data.objects.get(target_name) if target_name else objects[0]
+        target = objects_by_name.get(target_name) if target_name else objects[0]
         if not target:
             return {"status": "error", "error": f"Target object '{target_name}' not found"}
 
-        # Select all objects and make target active
-        bpy.ops.object.select_all(action="DESELECT")
-        for obj in objects:
-            obj.select_set(True)
-        bpy.context.view_layer.objects.active = target
-
-        bpy.ops.object.join()
+        # join only reads the active and selected objects from context
+        with bpy.context.temp_override(
+            active_object=target, selected_objects=objects, selected_editable_objects=objects
+        ):
+            bpy.ops.object.join()
 
         return {
             "status": "success",
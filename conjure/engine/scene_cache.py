@@ -0,0 +1,142 @@
+"""
+Scene cache for Conjure.
+
+Keeps a snapshot of the file's objects between depsgraph updates so repeated
+queries don't rescan every object. Any depsgraph update, file load or undo
+step marks the cache dirty and the next lookup rebuilds it. Changes made
+earlier in the same tick (before any handler runs) are caught by checking
+the snapshot against the live object lists.
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+
+
+class ObjectSnapshot(NamedTuple):
+    """Structure-of-arrays view of bpy.data.objects.
+
+    Every array is indexed like bpy.data.objects; index maps name_full to
+    that position and in_scene flags the objects linked to the scene.
+    """
+
+    objects: List[bpy.types.Object]
+    index: Dict[str, int]
+    types: np.ndarray
+    hide_viewport: np.ndarray
+    hide_render: np.ndarray
+    in_scene: np.ndarray
+
+
+_dirty = True
+_scene_name: Optional[str] = None
+_snapshot: Optional[ObjectSnapshot] = None
+
+
+def mark_dirty(*_args) -> None:
+    """Invalidate cached scene lookups."""
+    global _dirty
+    _dirty = True
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    mark_dirty()
+
+
+@persistent
+def _on_file_change(*_args):
+    mark_dirty()
+
+
+def _build_snapshot(scene) -> ObjectSnapshot:
+    data_objects = bpy.data.objects
+    count = len(data_objects)
+    objects = list(data_objects)
+    index = {obj.name_full: i for i, obj in enumerate(objects)}
+
+    # Enum properties can't go through foreach_get, so types are gathered in Python
+    types = np.array([obj.type for obj in objects], dtype=object)
+    hide_viewport = np.empty(count, dtype=bool)
+    hide_render = np.empty(count, dtype=bool)
+    data_objects.foreach_get("hide_viewport", hide_viewport)
+    data_objects.foreach_get("hide_render", hide_render)
+
+    in_scene = np.zeros(count, dtype=bool)
+    in_scene[[index[obj.name_full] for obj in scene.objects]] = True
+
+    return ObjectSnapshot(objects, index, types, hide_viewport, hide_render, in_scene)
+
+
+def _is_current(snapshot: ObjectSnapshot, scene) -> bool:
+    """Whether the snapshot still matches the file's objects and the scene's links."""
+    data_objects = bpy.data.objects
+    if len(snapshot.objects) != len(data_objects):
+        return False
+    if len(scene.objects) != np.count_nonzero(snapshot.in_scene):
+        return False
+    # Structs compare by pointer, so this catches objects swapped within a tick
+    return snapshot.objects == list(data_objects)
+
+
+def get_snapshot(scene=None) -> ObjectSnapshot:
+    """Get the object snapshot, rebuilding it only after changes.
+
+    Args:
+        scene: Scene used for in_scene (defaults to the active scene)
+
+    Returns:
+        ObjectSnapshot of bpy.data.objects
+    """
+    global _dirty, _scene_name, _snapshot
+    if scene is None:
+        scene = bpy.context.scene
+
+    if _dirty or _snapshot is None or scene.name_full != _scene_name or not _is_current(_snapshot, scene):
+        _snapshot = _build_snapshot(scene)
+        _scene_name = scene.name_full
+        _dirty = False
+
+    return _snapshot
+
+
+def get_mesh_objects(scene=None) -> List[bpy.types.Object]:
+    """Get the mesh objects in a scene, rescanning only after changes.
+
+    Args:
+        scene: Scene to query (defaults to the active scene)
+
+    Returns:
+        List of mesh objects
+    """
+    snapshot = get_snapshot(scene)
+    mask = (snapshot.types == "MESH") & snapshot.in_scene
+    return [snapshot.objects[i] for i in np.flatnonzero(mask)]
+
+
+_HANDLERS = (
+    (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+    (bpy.app.handlers.load_post, _on_file_change),
+    (bpy.app.handlers.undo_post, _on_file_change),
+    (bpy.app.handlers.redo_post, _on_file_change),
+)
+
+
+def register():
+    """Install the handlers that invalidate the cache."""
+    for handlers, callback in _HANDLERS:
+        if callback not in handlers:
+            handlers.append(callback)
+    mark_dirty()
+
+
+def unregister():
+    """Remove the cache handlers and drop cached references."""
+    global _snapshot
+    for handlers, callback in _HANDLERS:
+        if callback in handlers:
+            handlers.remove(callback)
+    _snapshot = None
+    mark_dirty()
@@ -5,9 +5,11 @@ Contains all bpy.types.Operator implementations for Conjure functionality.
 """
 
 import bpy
+from bpy.props import BoolProperty
 
 from .animation import (
     CONJURE_OT_add_bone,
+    CONJURE_OT_add_bones_batch,
     CONJURE_OT_add_shape_key,
     CONJURE_OT_bind_armature,
     CONJURE_OT_clear_animation,
@@ -17,10 +19,12 @@ from .animation import (
     CONJURE_OT_insert_keyframe,
     CONJURE_OT_play_animation,
     CONJURE_OT_pose_bone,
+    CONJURE_OT_pose_bones_batch,
     CONJURE_OT_set_frame_range,
     CONJURE_OT_set_keyframe_interpolation,
     CONJURE_OT_set_shape_key_value,
 )
+from .batch import CONJURE_OT_flush_batch
 from .connection import (
     CONJURE_OT_connect,
     CONJURE_OT_disconnect,
@@ -33,6 +37,7 @@ from .physics import (
     CONJURE_OT_add_fluid_effector,
     CONJURE_OT_add_fluid_flow,
     CONJURE_OT_add_rigid_body,
+    CONJURE_OT_add_rigid_body_bulk,
     CONJURE_OT_add_soft_body,
     CONJURE_OT_bake_physics,
     CONJURE_OT_remove_cloth,
@@ -61,6 +66,8 @@ classes = [
     CONJURE_OT_connect,
     CONJURE_OT_disconnect,
     CONJURE_OT_test_connection,
+    # Batching
+    CONJURE_OT_flush_batch,
     # Primitives
     CONJURE_OT_create_cube,
     CONJURE_OT_create_sphere,
@@ -75,6 +82,7 @@ classes = [
     CONJURE_OT_list_objects,
     # Physics
     CONJURE_OT_add_rigid_body,
+    CONJURE_OT_add_rigid_body_bulk,
     CONJURE_OT_remove_rigid_body,
     CONJURE_OT_rigid_body_world,
     CONJURE_OT_add_cloth,
@@ -92,8 +100,10 @@ classes = [
     CONJURE_OT_set_keyframe_interpolation,
     CONJURE_OT_create_armature,
     CONJURE_OT_add_bone,
+    CONJURE_OT_add_bones_batch,
     CONJURE_OT_bind_armature,
     CONJURE_OT_pose_bone,
+    CONJURE_OT_pose_bones_batch,
     CONJURE_OT_add_shape_key,
     CONJURE_OT_set_shape_key_value,
     CONJURE_OT_set_frame_range,
@@ -101,14 +111,22 @@ classes = [
     CONJURE_OT_play_animation,
 ]
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 
 def register():
     """Register all operators."""
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
+
+    bpy.types.Scene.conjure_batch_mode = BoolProperty(
+        name="Batch Commands",
+        default=False,
+        description="Queue server commands until Apply Batch is run",
+    )
 
 
 def unregister():
     """Unregister all operators."""
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    del bpy.types.Scene.conjure_batch_mode
+
+    _unregister_classes()
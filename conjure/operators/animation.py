@@ -4,6 +4,8 @@ Animation operators for Conjure.
 These operators manage keyframes, armatures, and animation-related functionality.
 """
 
+import json
+
 import bpy
 from bpy.props import (
     BoolProperty,
@@ -15,12 +17,133 @@ from bpy.props import (
 )
 from bpy.types import Operator
 
+from ..engine import get_server
+from ..utils import add_edit_bone, bone_edit_session
+
+# Transform channels keyed by the combined keyframe options
+_TRANSFORM_PATHS = {
+    "LOCROT": ("location", "rotation_euler"),
+    "LOCROTSCALE": ("location", "rotation_euler", "scale"),
+    "ALL": ("location", "rotation_euler", "scale"),
+}
+
+# Enum property items, built once at import
+_INSERT_DATA_PATH_ITEMS = (
+    ("location", "Location", "Keyframe location"),
+    ("rotation_euler", "Rotation", "Keyframe rotation"),
+    ("scale", "Scale", "Keyframe scale"),
+    ("LOCROT", "Location + Rotation", "Keyframe both location and rotation"),
+    ("LOCROTSCALE", "All Transforms", "Keyframe location, rotation, and scale"),
+)
+
+_DELETE_DATA_PATH_ITEMS = (
+    ("location", "Location", "Delete location keyframe"),
+    ("rotation_euler", "Rotation", "Delete rotation keyframe"),
+    ("scale", "Scale", "Delete scale keyframe"),
+    ("ALL", "All Properties", "Delete all keyframes at this frame"),
+)
+
+_INTERPOLATION_ITEMS = (
+    ("CONSTANT", "Constant", "No interpolation"),
+    ("LINEAR", "Linear", "Linear interpolation"),
+    ("BEZIER", "Bezier", "Smooth bezier curve"),
+    ("SINE", "Sinusoidal", "Sine wave easing"),
+    ("QUAD", "Quadratic", "Quadratic easing"),
+    ("CUBIC", "Cubic", "Cubic easing"),
+    ("QUART", "Quartic", "Quartic easing"),
+    ("QUINT", "Quintic", "Quintic easing"),
+    ("EXPO", "Exponential", "Exponential easing"),
+    ("CIRC", "Circular", "Circular easing"),
+    ("BACK", "Back", "Overshoot easing"),
+    ("BOUNCE", "Bounce", "Bouncing easing"),
+    ("ELASTIC", "Elastic", "Elastic easing"),
+)
+
+_EASING_ITEMS = (
+    ("AUTO", "Automatic", "Automatic easing"),
+    ("EASE_IN", "Ease In", "Ease in"),
+    ("EASE_OUT", "Ease Out", "Ease out"),
+    ("EASE_IN_OUT", "Ease In-Out", "Ease in and out"),
+)
+
+_DISPLAY_TYPE_ITEMS = (
+    ("OCTAHEDRAL", "Octahedral", "Standard octahedral display"),
+    ("STICK", "Stick", "Simple stick display"),
+    ("BBONE", "B-Bone", "Bendy bone display"),
+    ("ENVELOPE", "Envelope", "Envelope display"),
+    ("WIRE", "Wire", "Wire display"),
+)
+
+_BIND_TYPE_ITEMS = (
+    ("ARMATURE_AUTO", "Automatic Weights", "Automatic weight assignment"),
+    ("ARMATURE_NAME", "By Name", "Match vertex groups to bones by name"),
+    ("ARMATURE_ENVELOPE", "Envelope Weights", "Use bone envelopes"),
+)
+
+_PLAYBACK_MODE_ITEMS = (
+    ("TOGGLE", "Toggle", "Start or stop playback"),
+    ("PLAY", "Play", "Start playback unless already playing"),
+    ("PAUSE", "Pause", "Stop playback unless already stopped"),
+)
+
+
+def _object_action(obj):
+    """Get the object's action, creating it the way keyframe_insert would."""
+    anim_data = obj.animation_data or obj.animation_data_create()
+    if anim_data.action is None:
+        anim_data.action = bpy.data.actions.new(f"{obj.name}Action")
+    return anim_data.action
+
+
+def _fast_insert(fcurves, data_path, values, frame, group):
+    """Key each component of a vector property directly on its F-curves.
+
+    Skips the data path resolution keyframe_insert does per call. Points are
+    inserted with the FAST option, so the returned F-curves need update()
+    once the batch is done.
+    """
+    touched = []
+    for index, value in enumerate(values):
+        fcurve = fcurves.find(data_path, index=index) or fcurves.new(data_path, index=index, action_group=group)
+        fcurve.keyframe_points.insert(frame, value, options={"FAST"})
+        touched.append(fcurve)
+    return touched
+
+
+def _key_pose_bone(fcurves, pose_bone, frame):
+    """Key a pose bone's location, rotation and scale with _fast_insert.
+
+    The bone's data path prefix is resolved once and F-curves are grouped
+    under the bone name, as keyframe_insert does.
+    """
+    base_path = pose_bone.path_from_id()
+    touched = []
+    for prop in _TRANSFORM_PATHS["LOCROTSCALE"]:
+        touched += _fast_insert(fcurves, f"{base_path}.{prop}", getattr(pose_bone, prop), frame, pose_bone.name)
+    return touched
+
+
+class _ServerInvokable:
+    """Mixin for operators whose invoke opens a properties dialog.
+
+    Callers that already supply every property (the server, scripts using
+    INVOKE_DEFAULT) set from_server to run execute directly.
+    """
+
+    from_server: BoolProperty(
+        name="From Server",
+        default=False,
+        options={"HIDDEN", "SKIP_SAVE"},
+        description="Skip the properties dialog and execute immediately",
+    )
+
+
 # =============================================================================
 # Keyframe Operators
 # =============================================================================
 
 
-class CONJURE_OT_insert_keyframe(Operator):
+class CONJURE_OT_insert_keyframe(_ServerInvokable, Operator):
     """Insert keyframe for the selected object."""
 
     bl_idname = "conjure.insert_keyframe"
@@ -30,13 +153,7 @@ class CONJURE_OT_insert_keyframe(Operator):
 
     data_path: EnumProperty(
         name="Property",
-        items=[
-            ("location", "Location", "Keyframe location"),
-            ("rotation_euler", "Rotation", "Keyframe rotation"),
-            ("scale", "Scale", "Keyframe scale"),
-            ("LOCROT", "Location + Rotation", "Keyframe both location and rotation"),
-            ("LOCROTSCALE", "All Transforms", "Keyframe location, rotation, and scale"),
-        ],
+        items=_INSERT_DATA_PATH_ITEMS,
         default="LOCROTSCALE",
         description="Property to keyframe",
     )
@@ -53,24 +170,23 @@ class CONJURE_OT_insert_keyframe(Operator):
         return context.active_object is not None
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         frame = self.frame
         server = get_server()
 
         if not server:
-            context.scene.frame_set(frame)
-
-            if self.data_path == "LOCROT":
-                obj.keyframe_insert(data_path="location", frame=frame)
-                obj.keyframe_insert(data_path="rotation_euler", frame=frame)
-            elif self.data_path == "LOCROTSCALE":
-                obj.keyframe_insert(data_path="location", frame=frame)
-                obj.keyframe_insert(data_path="rotation_euler", frame=frame)
-                obj.keyframe_insert(data_path="scale", frame=frame)
-            else:
-                obj.keyframe_insert(data_path=self.data_path, frame=frame)
+            scene = context.scene
+            if scene.frame_current != frame:
+                scene.frame_set(frame)
+
+            fcurves = _object_action(obj).fcurves
+            touched = []
+            for data_path in _TRANSFORM_PATHS.get(self.data_path, (self.data_path,)):
+                touched += _fast_insert(fcurves, data_path, getattr(obj, data_path), frame, "Object Transforms")
+
+            # Sort points and recalculate handles once for the whole batch
+            for fcurve in touched:
+                fcurve.update()
 
             self.report({"INFO"}, f"Inserted keyframe at frame {frame}")
             return {"FINISHED"}
@@ -92,6 +208,8 @@ class CONJURE_OT_insert_keyframe(Operator):
             return {"CANCELLED"}
 
     def invoke(self, context, event):
+        if self.from_server:
+            return self.execute(context)
         self.frame = context.scene.frame_current
         return context.window_manager.invoke_props_dialog(self)
 
@@ -106,12 +224,7 @@ class CONJURE_OT_delete_keyframe(Operator):
 
     data_path: EnumProperty(
         name="Property",
-        items=[
-            ("location", "Location", "Delete location keyframe"),
-            ("rotation_euler", "Rotation", "Delete rotation keyframe"),
-            ("scale", "Scale", "Delete scale keyframe"),
-            ("ALL", "All Properties", "Delete all keyframes at this frame"),
-        ],
+        items=_DELETE_DATA_PATH_ITEMS,
         default="ALL",
         description="Property to delete keyframe from",
     )
@@ -121,19 +234,13 @@ class CONJURE_OT_delete_keyframe(Operator):
         return context.active_object is not None
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         frame = context.scene.frame_current
         server = get_server()
 
         if not server:
-            if self.data_path == "ALL":
-                obj.keyframe_delete(data_path="location", frame=frame)
-                obj.keyframe_delete(data_path="rotation_euler", frame=frame)
-                obj.keyframe_delete(data_path="scale", frame=frame)
-            else:
-                obj.keyframe_delete(data_path=self.data_path, frame=frame)
+            for data_path in _TRANSFORM_PATHS.get(self.data_path, (self.data_path,)):
+                obj.keyframe_delete(data_path=data_path, frame=frame)
 
             self.report({"INFO"}, f"Deleted keyframe at frame {frame}")
             return {"FINISHED"}
@@ -168,8 +275,6 @@ class CONJURE_OT_clear_animation(Operator):
         return context.active_object is not None
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
@@ -191,7 +296,7 @@ class CONJURE_OT_clear_animation(Operator):
             return {"CANCELLED"}
 
 
-class CONJURE_OT_set_keyframe_interpolation(Operator):
+class CONJURE_OT_set_keyframe_interpolation(_ServerInvokable, Operator):
     """Set interpolation mode for keyframes."""
 
     bl_idname = "conjure.set_keyframe_interpolation"
@@ -201,33 +306,14 @@ class CONJURE_OT_set_keyframe_interpolation(Operator):
 
     interpolation: EnumProperty(
         name="Interpolation",
-        items=[
-            ("CONSTANT", "Constant", "No interpolation"),
-            ("LINEAR", "Linear", "Linear interpolation"),
-            ("BEZIER", "Bezier", "Smooth bezier curve"),
-            ("SINE", "Sinusoidal", "Sine wave easing"),
-            ("QUAD", "Quadratic", "Quadratic easing"),
-            ("CUBIC", "Cubic", "Cubic easing"),
-            ("QUART", "Quartic", "Quartic easing"),
-            ("QUINT", "Quintic", "Quintic easing"),
-            ("EXPO", "Exponential", "Exponential easing"),
-            ("CIRC", "Circular", "Circular easing"),
-            ("BACK", "Back", "Overshoot easing"),
-            ("BOUNCE", "Bounce", "Bouncing easing"),
-            ("ELASTIC", "Elastic", "Elastic easing"),
-        ],
+        items=_INTERPOLATION_ITEMS,
         default="BEZIER",
         description="Keyframe interpolation mode",
     )
 
     easing: EnumProperty(
         name="Easing",
-        items=[
-            ("AUTO", "Automatic", "Automatic easing"),
-            ("EASE_IN", "Ease In", "Ease in"),
-            ("EASE_OUT", "Ease Out", "Ease out"),
-            ("EASE_IN_OUT", "Ease In-Out", "Ease in and out"),
-        ],
+        items=_EASING_ITEMS,
         default="AUTO",
         description="Easing type for interpolation",
     )
@@ -238,17 +324,19 @@ class CONJURE_OT_set_keyframe_interpolation(Operator):
         return obj is not None and obj.animation_data and obj.animation_data.action
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
         if not server:
-            action = obj.animation_data.action
-            for fcurve in action.fcurves:
+            # Read the operator properties once; each access is an RNA lookup.
+            # foreach_set only takes bool/int/float properties, so the enums
+            # are still written per keyframe point.
+            interpolation = self.interpolation
+            easing = self.easing
+            for fcurve in obj.animation_data.action.fcurves:
                 for kfp in fcurve.keyframe_points:
-                    kfp.interpolation = self.interpolation
-                    kfp.easing = self.easing
+                    kfp.interpolation = interpolation
+                    kfp.easing = easing
             self.report({"INFO"}, f"Set interpolation to {self.interpolation}")
             return {"FINISHED"}
 
@@ -269,6 +357,8 @@ class CONJURE_OT_set_keyframe_interpolation(Operator):
             return {"CANCELLED"}
 
     def invoke(self, context, event):
+        if self.from_server:
+            return self.execute(context)
         return context.window_manager.invoke_props_dialog(self)
 
 
@@ -277,7 +367,7 @@ class CONJURE_OT_set_keyframe_interpolation(Operator):
 # =============================================================================
 
 
-class CONJURE_OT_create_armature(Operator):
+class CONJURE_OT_create_armature(_ServerInvokable, Operator):
     """Create a new armature object."""
 
     bl_idname = "conjure.create_armature"
@@ -300,20 +390,12 @@ class CONJURE_OT_create_armature(Operator):
 
     display_type: EnumProperty(
         name="Display As",
-        items=[
-            ("OCTAHEDRAL", "Octahedral", "Standard octahedral display"),
-            ("STICK", "Stick", "Simple stick display"),
-            ("BBONE", "B-Bone", "Bendy bone display"),
-            ("ENVELOPE", "Envelope", "Envelope display"),
-            ("WIRE", "Wire", "Wire display"),
-        ],
+        items=_DISPLAY_TYPE_ITEMS,
         default="OCTAHEDRAL",
         description="Bone display type",
     )
 
     def execute(self, context):
-        from ..engine import get_server
-
         server = get_server()
 
         if not server:
@@ -337,7 +419,7 @@ class CONJURE_OT_create_armature(Operator):
             "create_armature",
             {
                 "name": self.name,
-                "location": list(self.location),
+                "location": self.location[:],
                 "display_type": self.display_type,
             },
         )
@@ -350,10 +432,12 @@ class CONJURE_OT_create_armature(Operator):
             return {"CANCELLED"}
 
     def invoke(self, context, event):
+        if self.from_server:
+            return self.execute(context)
         return context.window_manager.invoke_props_dialog(self)
 
 
-class CONJURE_OT_add_bone(Operator):
+class CONJURE_OT_add_bone(_ServerInvokable, Operator):
     """Add a bone to the active armature."""
 
     bl_idname = "conjure.add_bone"
@@ -399,25 +483,14 @@ class CONJURE_OT_add_bone(Operator):
         return obj is not None and obj.type == "ARMATURE"
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
         if not server:
             # Must be in edit mode to add bones
-            bpy.ops.object.mode_set(mode="EDIT")
-
-            armature = obj.data
-            bone = armature.edit_bones.new(self.name)
-            bone.head = self.head
-            bone.tail = self.tail
+            with bone_edit_session(obj) as edit_bones:
+                add_edit_bone(edit_bones, self.name, self.head, self.tail, self.parent_bone, self.connected)
 
-            if self.parent_bone and self.parent_bone in armature.edit_bones:
-                bone.parent = armature.edit_bones[self.parent_bone]
-                bone.use_connect = self.connected
-
-            bpy.ops.object.mode_set(mode="OBJECT")
             self.report({"INFO"}, f"Added bone: {self.name}")
             return {"FINISHED"}
 
@@ -426,8 +499,8 @@ class CONJURE_OT_add_bone(Operator):
             {
                 "armature": obj.name,
                 "name": self.name,
-                "head": list(self.head),
-                "tail": list(self.tail),
+                "head": self.head[:],
+                "tail": self.tail[:],
                 "parent_bone": self.parent_bone,
                 "connected": self.connected,
             },
@@ -441,10 +514,77 @@ class CONJURE_OT_add_bone(Operator):
             return {"CANCELLED"}
 
     def invoke(self, context, event):
+        if self.from_server:
+            return self.execute(context)
         return context.window_manager.invoke_props_dialog(self)
 
 
-class CONJURE_OT_bind_armature(Operator):
+class CONJURE_OT_add_bones_batch(Operator):
+    """Add several bones to the active armature in one edit-mode pass."""
+
+    bl_idname = "conjure.add_bones_batch"
+    bl_label = "Add Bones"
+    bl_description = "Add a list of bones to the active armature"
+    bl_options = {"REGISTER", "UNDO"}
+
+    bones_json: StringProperty(
+        name="Bones",
+        default="[]",
+        description='JSON list of {"name", "head", "tail", "parent_bone", "connected"}',
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == "ARMATURE"
+
+    def execute(self, context):
+        obj = context.active_object
+
+        try:
+            bones = json.loads(self.bones_json)
+        except ValueError as e:
+            self.report({"ERROR"}, f"Invalid bones JSON: {e}")
+            return {"CANCELLED"}
+        if not isinstance(bones, list) or not bones:
+            self.report({"ERROR"}, "No bones to add")
+            return {"CANCELLED"}
+
+        server = get_server()
+
+        if not server:
+            # Bones are added in order, so earlier bones can parent later ones
+            with bone_edit_session(obj) as edit_bones:
+                for spec in bones:
+                    add_edit_bone(
+                        edit_bones,
+                        spec.get("name", "Bone"),
+                        spec.get("head", (0.0, 0.0, 0.0)),
+                        spec.get("tail", (0.0, 0.0, 1.0)),
+                        spec.get("parent_bone", ""),
+                        spec.get("connected", False),
+                    )
+
+            self.report({"INFO"}, f"Added {len(bones)} bone(s)")
+            return {"FINISHED"}
+
+        result = server.executor.execute(
+            "add_bone",
+            {
+                "armature": obj.name,
+                "bones": bones,
+            },
+        )
+
+        if result.get("status") == "success":
+            self.report({"INFO"}, f"Added {len(bones)} bone(s)")
+            return {"FINISHED"}
+        else:
+            self.report({"ERROR"}, result.get("error", "Unknown error"))
+            return {"CANCELLED"}
+
+
+class CONJURE_OT_bind_armature(_ServerInvokable, Operator):
     """Bind mesh to armature with automatic weights."""
 
     bl_idname = "conjure.bind_armature"
@@ -454,11 +594,7 @@ class CONJURE_OT_bind_armature(Operator):
 
     bind_type: EnumProperty(
         name="Bind Type",
-        items=[
-            ("ARMATURE_AUTO", "Automatic Weights", "Automatic weight assignment"),
-            ("ARMATURE_NAME", "By Name", "Match vertex groups to bones by name"),
-            ("ARMATURE_ENVELOPE", "Envelope Weights", "Use bone envelopes"),
-        ],
+        items=_BIND_TYPE_ITEMS,
         default="ARMATURE_AUTO",
         description="Method for binding mesh to armature",
     )
@@ -471,8 +607,6 @@ class CONJURE_OT_bind_armature(Operator):
         return any(obj.type == "MESH" for obj in context.selected_objects if obj != context.active_object)
 
     def execute(self, context):
-        from ..engine import get_server
-
         armature = context.active_object
         meshes = [obj for obj in context.selected_objects if obj.type == "MESH"]
         server = get_server()
@@ -483,8 +617,12 @@ class CONJURE_OT_bind_armature(Operator):
                 mod = mesh.modifiers.new(name="Armature", type="ARMATURE")
                 mod.object = armature
 
-                # Set parent with automatic weights
-                mesh.parent = armature
+            # parent_set acts on every selected object at once, so one call
+            # parents (and weights) all meshes to the active armature
+            selected = [*meshes, armature]
+            with context.temp_override(
+                active_object=armature, selected_objects=selected, selected_editable_objects=selected
+            ):
                 bpy.ops.object.parent_set(type=self.bind_type)
 
             self.report({"INFO"}, f"Bound {len(meshes)} mesh(es) to {armature.name}")
@@ -507,10 +645,12 @@ class CONJURE_OT_bind_armature(Operator):
             return {"CANCELLED"}
 
     def invoke(self, context, event):
+        if self.from_server:
+            return self.execute(context)
         return context.window_manager.invoke_props_dialog(self)
 
 
-class CONJURE_OT_pose_bone(Operator):
+class CONJURE_OT_pose_bone(_ServerInvokable, Operator):
     """Set pose for a bone in the active armature."""
 
     bl_idname = "conjure.pose_bone"
@@ -557,28 +697,25 @@ class CONJURE_OT_pose_bone(Operator):
         return obj is not None and obj.type == "ARMATURE"
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
         if not server:
             bpy.ops.object.mode_set(mode="POSE")
 
-            if self.bone_name not in obj.pose.bones:
+            pose_bone = obj.pose.bones.get(self.bone_name)
+            if pose_bone is None:
                 self.report({"ERROR"}, f"Bone not found: {self.bone_name}")
                 return {"CANCELLED"}
 
-            pose_bone = obj.pose.bones[self.bone_name]
             pose_bone.location = self.location
             pose_bone.rotation_euler = self.rotation
             pose_bone.scale = self.scale
 
             if self.insert_keyframe:
-                frame = context.scene.frame_current
-                pose_bone.keyframe_insert(data_path="location", frame=frame)
-                pose_bone.keyframe_insert(data_path="rotation_euler", frame=frame)
-                pose_bone.keyframe_insert(data_path="scale", frame=frame)
+                fcurves = _object_action(obj).fcurves
+                for fcurve in _key_pose_bone(fcurves, pose_bone, context.scene.frame_current):
+                    fcurve.update()
 
             self.report({"INFO"}, f"Posed bone: {self.bone_name}")
             return {"FINISHED"}
@@ -588,9 +725,9 @@ class CONJURE_OT_pose_bone(Operator):
             {
                 "armature": obj.name,
                 "bone_name": self.bone_name,
-                "location": list(self.location),
-                "rotation": list(self.rotation),
-                "scale": list(self.scale),
+                "location": self.location[:],
+                "rotation": self.rotation[:],
+                "scale": self.scale[:],
                 "insert_keyframe": self.insert_keyframe,
             },
         )
@@ -603,15 +740,108 @@ class CONJURE_OT_pose_bone(Operator):
             return {"CANCELLED"}
 
     def invoke(self, context, event):
+        if self.from_server:
+            return self.execute(context)
         return context.window_manager.invoke_props_dialog(self)
 
 
+class CONJURE_OT_pose_bones_batch(Operator):
+    """Pose several bones of the active armature in one pass."""
+
+    bl_idname = "conjure.pose_bones_batch"
+    bl_label = "Pose Bones"
+    bl_description = "Set the pose transforms for a list of bones"
+    bl_options = {"REGISTER", "UNDO"}
+
+    bones_json: StringProperty(
+        name="Bones",
+        default="[]",
+        description='JSON list of {"name", "location", "rotation", "scale"}',
+    )
+
+    insert_keyframe: BoolProperty(
+        name="Insert Keyframe",
+        default=False,
+        description="Insert keyframes at current frame",
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == "ARMATURE"
+
+    def execute(self, context):
+        obj = context.active_object
+
+        try:
+            bones = json.loads(self.bones_json)
+        except ValueError as e:
+            self.report({"ERROR"}, f"Invalid bones JSON: {e}")
+            return {"CANCELLED"}
+        if not isinstance(bones, list) or not bones:
+            self.report({"ERROR"}, "No bones to pose")
+            return {"CANCELLED"}
+
+        server = get_server()
+
+        if not server:
+            if obj.mode != "POSE":
+                bpy.ops.object.mode_set(mode="POSE")
+
+            pose_bones = obj.pose.bones
+            frame = context.scene.frame_current
+            fcurves = _object_action(obj).fcurves if self.insert_keyframe else None
+            touched = set()
+            missing = []
+            for entry in bones:
+                pose_bone = pose_bones.get(entry.get("name", ""))
+                if pose_bone is None:
+                    missing.append(entry.get("name"))
+                    continue
+
+                if "location" in entry:
+                    pose_bone.location = entry["location"]
+                if "rotation" in entry:
+                    pose_bone.rotation_euler = entry["rotation"]
+                if "scale" in entry:
+                    pose_bone.scale = entry["scale"]
+
+                if self.insert_keyframe:
+                    touched.update(_key_pose_bone(fcurves, pose_bone, frame))
+
+            # Sort points and recalculate handles once for the whole batch
+            for fcurve in touched:
+                fcurve.update()
+
+            if missing:
+                self.report({"WARNING"}, f"Bones not found: {', '.join(map(str, missing))}")
+            else:
+                self.report({"INFO"}, f"Posed {len(bones)} bone(s)")
+            return {"FINISHED"}
+
+        result = server.executor.execute(
+            "pose_bones_batch",
+            {
+                "armature": obj.name,
+                "bones": bones,
+                "insert_keyframe": self.insert_keyframe,
+            },
+        )
+
+        if result.get("status") == "success":
+            self.report({"INFO"}, f"Posed {result.get('posed', len(bones))} bone(s)")
+            return {"FINISHED"}
+        else:
+            self.report({"ERROR"}, result.get("error", "Unknown error"))
+            return {"CANCELLED"}
+
+
 # =============================================================================
 # Shape Key Operators
 # =============================================================================
 
 
-class CONJURE_OT_add_shape_key(Operator):
+class CONJURE_OT_add_shape_key(_ServerInvokable, Operator):
     """Add a shape key to the active object."""
 
     bl_idname = "conjure.add_shape_key"
@@ -637,8 +867,6 @@ class CONJURE_OT_add_shape_key(Operator):
         return obj is not None and obj.type == "MESH"
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
@@ -669,10 +897,16 @@ class CONJURE_OT_add_shape_key(Operator):
             return {"CANCELLED"}
 
     def invoke(self, context, event):
+        if self.from_server:
+            return self.execute(context)
         return context.window_manager.invoke_props_dialog(self)
 
 
-class CONJURE_OT_set_shape_key_value(Operator):
+# Shape key values closer than this are treated as unchanged
+_SHAPE_KEY_EPSILON = 1e-4
+
+
+class CONJURE_OT_set_shape_key_value(_ServerInvokable, Operator):
     """Set the value of a shape key."""
 
     bl_idname = "conjure.set_shape_key_value"
@@ -706,17 +940,24 @@ class CONJURE_OT_set_shape_key_value(Operator):
         return obj is not None and obj.type == "MESH" and obj.data.shape_keys is not None
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
+        shape_key = obj.data.shape_keys.key_blocks.get(self.shape_key_name)
+
+        # Slider drags resend near-identical values; skip updates that change nothing
+        if (
+            not self.insert_keyframe
+            and shape_key is not None
+            and abs(shape_key.value - self.value) < _SHAPE_KEY_EPSILON
+        ):
+            return {"FINISHED"}
+
         server = get_server()
 
         if not server:
-            if self.shape_key_name not in obj.data.shape_keys.key_blocks:
+            if shape_key is None:
                 self.report({"ERROR"}, f"Shape key not found: {self.shape_key_name}")
                 return {"CANCELLED"}
 
-            shape_key = obj.data.shape_keys.key_blocks[self.shape_key_name]
             shape_key.value = self.value
 
             if self.insert_keyframe:
@@ -743,6 +984,8 @@ class CONJURE_OT_set_shape_key_value(Operator):
             return {"CANCELLED"}
 
     def invoke(self, context, event):
+        if self.from_server:
+            return self.execute(context)
         return context.window_manager.invoke_props_dialog(self)
 
 
@@ -751,7 +994,7 @@ class CONJURE_OT_set_shape_key_value(Operator):
 # =============================================================================
 
 
-class CONJURE_OT_set_frame_range(Operator):
+class CONJURE_OT_set_frame_range(_ServerInvokable, Operator):
     """Set the animation frame range."""
 
     bl_idname = "conjure.set_frame_range"
@@ -782,8 +1025,6 @@ class CONJURE_OT_set_frame_range(Operator):
     )
 
     def execute(self, context):
-        from ..engine import get_server
-
         server = get_server()
 
         if not server:
@@ -810,13 +1051,37 @@ class CONJURE_OT_set_frame_range(Operator):
             return {"CANCELLED"}
 
     def invoke(self, context, event):
+        if self.from_server:
+            return self.execute(context)
         self.frame_start = context.scene.frame_start
         self.frame_end = context.scene.frame_end
         self.fps = float(context.scene.render.fps)
         return context.window_manager.invoke_props_dialog(self)
 
 
-class CONJURE_OT_goto_frame(Operator):
+# Latest frame requested by goto_frame, sent to the server by _flush_goto_frame
+_pending_goto_frame = None
+_GOTO_FRAME_INTERVAL = 0.016
+
+# Error from the last deferred set_frame, reported by the next goto_frame
+_goto_frame_error = None
+
+
+def _flush_goto_frame():
+    """Send the most recent goto_frame request to the server (one-shot timer callback)."""
+    global _pending_goto_frame, _goto_frame_error
+    frame, _pending_goto_frame = _pending_goto_frame, None
+
+    server = get_server()
+    if frame is None or not server:
+        return
+
+    result = server.executor.execute("set_frame", {"frame": frame})
+    if result.get("status") != "success":
+        _goto_frame_error = result.get("error", "Unknown error")
+
+
+class CONJURE_OT_goto_frame(_ServerInvokable, Operator):
     """Jump to a specific frame."""
 
     bl_idname = "conjure.goto_frame"
@@ -832,28 +1097,29 @@ class CONJURE_OT_goto_frame(Operator):
     )
 
     def execute(self, context):
-        from ..engine import get_server
+        global _pending_goto_frame, _goto_frame_error
 
-        server = get_server()
+        if _goto_frame_error is not None:
+            self.report({"WARNING"}, f"Previous frame sync failed: {_goto_frame_error}")
+            _goto_frame_error = None
 
-        if not server:
-            context.scene.frame_set(self.frame)
-            self.report({"INFO"}, f"Jumped to frame {self.frame}")
-            return {"FINISHED"}
+        scene = context.scene
+        if scene.frame_current != self.frame:
+            scene.frame_set(self.frame)
 
-        result = server.executor.execute(
-            "goto_frame",
-            {"frame": self.frame},
-        )
+        # Scrubbing fires this per mouse move; only the latest frame is sent
+        # to the server, once per timer tick
+        if get_server():
+            if _pending_goto_frame is None:
+                bpy.app.timers.register(_flush_goto_frame, first_interval=_GOTO_FRAME_INTERVAL)
+            _pending_goto_frame = self.frame
 
-        if result.get("status") == "success":
-            self.report({"INFO"}, f"Jumped to frame {self.frame}")
-            return {"FINISHED"}
-        else:
-            self.report({"ERROR"}, result.get("error", "Unknown error"))
-            return {"CANCELLED"}
+        self.report({"INFO"}, f"Jumped to frame {self.frame}")
+        return {"FINISHED"}
 
     def invoke(self, context, event):
+        if self.from_server:
+            return self.execute(context)
         self.frame = context.scene.frame_current
         return context.window_manager.invoke_props_dialog(self)
 
@@ -866,6 +1132,18 @@ class CONJURE_OT_play_animation(Operator):
     bl_description = "Toggle animation playback"
     bl_options = {"REGISTER"}
 
+    mode: EnumProperty(
+        name="Mode",
+        items=_PLAYBACK_MODE_ITEMS,
+        default="TOGGLE",
+        description="Toggle playback or request a specific playback state",
+    )
+
     def execute(self, context):
+        # Only toggle when the requested state differs from the current one
+        screen = context.screen
+        if self.mode != "TOGGLE" and screen is not None and screen.is_animation_playing == (self.mode == "PLAY"):
+            return {"CANCELLED"}
+
         bpy.ops.screen.animation_play()
         return {"FINISHED"}
@@ -0,0 +1,63 @@
+"""
+Command batching operators for Conjure.
+
+While the scene's batch mode is on, operators queue their server commands
+here instead of executing them; Apply Batch sends the whole queue as one
+execute_batch command.
+"""
+
+from bpy.types import Operator
+
+from ..engine import get_server
+
+# Server commands queued while the scene is in batch mode
+_pending_commands = []
+
+
+def enqueue_command(context, command, payload) -> bool:
+    """Queue a server command instead of executing it when in batch mode.
+
+    Returns:
+        True if the command was queued
+    """
+    if not context.scene.conjure_batch_mode:
+        return False
+    _pending_commands.append({"command": command, "params": payload})
+    return True
+
+
+def has_pending(names) -> bool:
+    """Whether any queued command targets one of the named objects."""
+    names = set(names)
+    return any(entry["params"].get("object") in names for entry in _pending_commands)
+
+
+class CONJURE_OT_flush_batch(Operator):
+    """Send all queued commands to the server in one call."""
+
+    bl_idname = "conjure.flush_batch"
+    bl_label = "Apply Batch"
+    bl_description = "Apply the commands queued in batch mode"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        return bool(_pending_commands)
+
+    def execute(self, context):
+        server = get_server()
+        if not server:
+            self.report({"ERROR"}, "Server not running")
+            return {"CANCELLED"}
+
+        commands = _pending_commands[:]
+        _pending_commands.clear()
+
+        result = server.executor.execute("execute_batch", {"commands": commands})
+
+        if result.get("status") == "success":
+            self.report({"INFO"}, f"Applied {len(commands)} commands")
+            return {"FINISHED"}
+        else:
+            self.report({"ERROR"}, result.get("error", "Unknown error"))
+            return {"CANCELLED"}
@@ -7,6 +7,8 @@ Operators for managing connection to Conjure server.
 import bpy
 from bpy.types import Operator
 
+from ..engine import get_server, start_server, stop_server
+
 
 class CONJURE_OT_connect(Operator):
     """Connect to Conjure server."""
@@ -16,8 +18,6 @@ class CONJURE_OT_connect(Operator):
     bl_description = "Connect to Conjure server"
 
     def execute(self, context):
-        from ..engine import get_server, start_server
-
         server = get_server()
         if server and server.running:
             self.report({"INFO"}, "Already connected")
@@ -36,8 +36,6 @@ class CONJURE_OT_disconnect(Operator):
     bl_description = "Disconnect from Conjure server"
 
     def execute(self, context):
-        from ..engine import get_server, stop_server
-
         server = get_server()
         if not server or not server.running:
             self.report({"INFO"}, "Not connected")
@@ -56,8 +54,6 @@ class CONJURE_OT_test_connection(Operator):
     bl_description = "Test connection to Conjure server"
 
     def execute(self, context):
-        from ..engine import get_server
-
         server = get_server()
         if server and server.running:
             self.report({"INFO"}, f"Connected: {server.host}:{server.port}")
@@ -4,6 +4,8 @@ Physics operators for Conjure.
 These operators manage rigid body, cloth, and fluid simulations in Blender.
 """
 
+from operator import attrgetter
+
 import bpy
 from bpy.props import (
     BoolProperty,
@@ -15,25 +17,95 @@ from bpy.props import (
 )
 from bpy.types import Operator
 
+from ..engine import get_server
+from ..utils import CLOTH_QUALITY_PRESETS, RIGID_BODY_QUALITY_PRESETS, find_modifier
+from .batch import enqueue_command
+
+# Enum property items, built once at import
+_BODY_TYPE_ITEMS = (
+    ("ACTIVE", "Active", "Object is affected by physics"),
+    ("PASSIVE", "Passive", "Object is static, affects other objects"),
+)
+
+_COLLISION_SHAPE_ITEMS = (
+    ("BOX", "Box", "Use bounding box"),
+    ("SPHERE", "Sphere", "Use bounding sphere"),
+    ("CAPSULE", "Capsule", "Use capsule shape"),
+    ("CYLINDER", "Cylinder", "Use cylinder shape"),
+    ("CONE", "Cone", "Use cone shape"),
+    ("CONVEX_HULL", "Convex Hull", "Use convex hull of mesh"),
+    ("MESH", "Mesh", "Use mesh geometry (slowest)"),
+)
+
+_RIGID_BODY_QUALITY_ITEMS = (
+    ("FAST", "Fast", "Fewer substeps and solver iterations"),
+    ("BALANCED", "Balanced", "Blender's default substeps and solver iterations"),
+    ("ACCURATE", "Accurate", "More substeps and solver iterations"),
+)
+
+_CLOTH_QUALITY_ITEMS = (
+    ("CUSTOM", "Custom", "Use the Quality Steps value"),
+    ("FAST", "Fast", "Fewer quality steps"),
+    ("BALANCED", "Balanced", "Blender's default quality steps"),
+    ("ACCURATE", "Accurate", "More quality steps"),
+)
+
+_DOMAIN_TYPE_ITEMS = (
+    ("LIQUID", "Liquid", "Simulate liquid fluid"),
+    ("GAS", "Gas", "Simulate gas/smoke/fire"),
+)
+
+_FLOW_TYPE_ITEMS = (
+    ("LIQUID", "Liquid", "Emit liquid"),
+    ("SMOKE", "Smoke", "Emit smoke"),
+    ("FIRE", "Fire", "Emit fire"),
+    ("BOTH", "Fire + Smoke", "Emit both fire and smoke"),
+)
+
+_FLOW_BEHAVIOR_ITEMS = (
+    ("INFLOW", "Inflow", "Continuously add fluid"),
+    ("OUTFLOW", "Outflow", "Remove fluid"),
+    ("GEOMETRY", "Geometry", "Use as obstacle/initial geometry"),
+)
+
+_EFFECTOR_TYPE_ITEMS = (
+    ("COLLISION", "Collision", "Object blocks fluid"),
+    ("GUIDE", "Guide", "Object guides fluid flow"),
+)
+
+_PHYSICS_TYPE_ITEMS = (
+    ("ALL", "All Physics", "Bake all physics types"),
+    ("RIGID_BODY", "Rigid Body", "Bake rigid body simulation"),
+    ("CLOTH", "Cloth", "Bake cloth simulation"),
+    ("FLUID", "Fluid", "Bake fluid simulation"),
+)
+
+
+def _payload_builder(*keys):
+    """Build an operator method returning a payload dict of the given properties.
+
+    attrgetter fetches every property in one call instead of one attribute
+    load per dict entry.
+    """
+    get = attrgetter(*keys)
+
+    def build_payload(self):
+        return dict(zip(keys, get(self)))
+
+    return build_payload
+
+
 # =============================================================================
 # Rigid Body Operators
 # =============================================================================
 
 
-class CONJURE_OT_add_rigid_body(Operator):
-    """Add rigid body physics to the selected object."""
-
-    bl_idname = "conjure.add_rigid_body"
-    bl_label = "Add Rigid Body"
-    bl_description = "Add rigid body physics to the active object"
-    bl_options = {"REGISTER", "UNDO"}
+class _RigidBodySettings:
+    """Mixin with the rigid body properties shared by the add operators."""
 
     body_type: EnumProperty(
         name="Type",
-        items=[
-            ("ACTIVE", "Active", "Object is affected by physics"),
-            ("PASSIVE", "Passive", "Object is static, affects other objects"),
-        ],
+        items=_BODY_TYPE_ITEMS,
         default="ACTIVE",
         description="Rigid body type",
     )
@@ -64,15 +136,7 @@ class CONJURE_OT_add_rigid_body(Operator):
 
     collision_shape: EnumProperty(
         name="Shape",
-        items=[
-            ("BOX", "Box", "Use bounding box"),
-            ("SPHERE", "Sphere", "Use bounding sphere"),
-            ("CAPSULE", "Capsule", "Use capsule shape"),
-            ("CYLINDER", "Cylinder", "Use cylinder shape"),
-            ("CONE", "Cone", "Use cone shape"),
-            ("CONVEX_HULL", "Convex Hull", "Use convex hull of mesh"),
-            ("MESH", "Mesh", "Use mesh geometry (slowest)"),
-        ],
+        items=_COLLISION_SHAPE_ITEMS,
         default="CONVEX_HULL",
         description="Collision shape to use",
     )
@@ -91,42 +155,76 @@ class CONJURE_OT_add_rigid_body(Operator):
         description="Collision margin in meters",
     )
 
+    quality_preset: EnumProperty(
+        name="Quality",
+        items=_RIGID_BODY_QUALITY_ITEMS,
+        default="BALANCED",
+        description="Simulation quality, applied when this creates the rigid body world",
+    )
+
+    def _apply_quality_preset(self, scene, world_created):
+        # Never override the settings of a world that already existed
+        if world_created:
+            rbw = scene.rigidbody_world
+            rbw.substeps_per_frame, rbw.solver_iterations = RIGID_BODY_QUALITY_PRESETS[self.quality_preset]
+
+    def _configure(self, rb):
+        rb.mass = self.mass
+        rb.friction = self.friction
+        rb.restitution = self.restitution
+        rb.collision_shape = self.collision_shape
+        # A new rigid body starts with the margin disabled
+        if self.use_margin:
+            rb.use_margin = True
+            rb.collision_margin = self.collision_margin
+
+    def _payload(self):
+        payload = {
+            "type": self.body_type,
+            "mass": self.mass,
+            "friction": self.friction,
+            "restitution": self.restitution,
+            "shape": self.collision_shape,
+            "use_margin": self.use_margin,
+            "quality_preset": self.quality_preset,
+        }
+        if self.use_margin:
+            payload["collision_margin"] = self.collision_margin
+        return payload
+
+
+class CONJURE_OT_add_rigid_body(_RigidBodySettings, Operator):
+    """Add rigid body physics to the selected object."""
+
+    bl_idname = "conjure.add_rigid_body"
+    bl_label = "Add Rigid Body"
+    bl_description = "Add rigid body physics to the active object"
+    bl_options = {"REGISTER", "UNDO"}
+
     @classmethod
     def poll(cls, context):
-        return context.active_object is not None and context.active_object.type == "MESH"
+        obj = context.active_object
+        return obj is not None and obj.type == "MESH"
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
         if not server:
             # Direct Blender operation
+            world_created = context.scene.rigidbody_world is None
             bpy.ops.rigidbody.object_add(type=self.body_type)
-            rb = obj.rigid_body
-            rb.mass = self.mass
-            rb.friction = self.friction
-            rb.restitution = self.restitution
-            rb.collision_shape = self.collision_shape
-            rb.use_margin = self.use_margin
-            rb.collision_margin = self.collision_margin
+            self._apply_quality_preset(context.scene, world_created)
+            self._configure(obj.rigid_body)
             self.report({"INFO"}, f"Added rigid body to: {obj.name}")
             return {"FINISHED"}
 
-        result = server.executor.execute(
-            "add_rigid_body",
-            {
-                "object": obj.name,
-                "type": self.body_type,
-                "mass": self.mass,
-                "friction": self.friction,
-                "restitution": self.restitution,
-                "collision_shape": self.collision_shape,
-                "use_margin": self.use_margin,
-                "collision_margin": self.collision_margin,
-            },
-        )
+        payload = {"object": obj.name, **self._payload()}
+        if enqueue_command(context, "add_rigid_body", payload):
+            self.report({"INFO"}, f"Queued rigid body for: {obj.name}")
+            return {"FINISHED"}
+
+        result = server.executor.execute("add_rigid_body", payload)
 
         if result.get("status") == "success":
             self.report({"INFO"}, f"Added rigid body to: {obj.name}")
@@ -139,6 +237,51 @@ class CONJURE_OT_add_rigid_body(Operator):
         return context.window_manager.invoke_props_dialog(self)
 
 
+class CONJURE_OT_add_rigid_body_bulk(_RigidBodySettings, Operator):
+    """Add rigid body physics to every selected mesh in one pass."""
+
+    bl_idname = "conjure.add_rigid_body_bulk"
+    bl_label = "Add Rigid Body to Selected"
+    bl_description = "Add rigid body physics to all selected mesh objects"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        return any(obj.type == "MESH" for obj in context.selected_objects)
+
+    def execute(self, context):
+        objects = [obj for obj in context.selected_objects if obj.type == "MESH"]
+        server = get_server()
+
+        if not server:
+            # One objects_add call covers every mesh instead of one operator per object
+            world_created = context.scene.rigidbody_world is None
+            with context.temp_override(selected_objects=objects, active_object=objects[0], object=objects[0]):
+                bpy.ops.rigidbody.objects_add(type=self.body_type)
+            self._apply_quality_preset(context.scene, world_created)
+            for obj in objects:
+                self._configure(obj.rigid_body)
+            self.report({"INFO"}, f"Added rigid body to {len(objects)} objects")
+            return {"FINISHED"}
+
+        payload = {"objects": [obj.name for obj in objects], **self._payload()}
+        if enqueue_command(context, "add_rigid_body_bulk", payload):
+            self.report({"INFO"}, f"Queued rigid body for {len(objects)} objects")
+            return {"FINISHED"}
+
+        result = server.executor.execute("add_rigid_body_bulk", payload)
+
+        if result.get("status") == "success":
+            self.report({"INFO"}, f"Added rigid body to {len(objects)} objects")
+            return {"FINISHED"}
+        else:
+            self.report({"ERROR"}, result.get("error", "Unknown error"))
+            return {"CANCELLED"}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+
 class CONJURE_OT_remove_rigid_body(Operator):
     """Remove rigid body physics from the selected object."""
 
@@ -153,8 +296,6 @@ class CONJURE_OT_remove_rigid_body(Operator):
         return obj is not None and obj.rigid_body is not None
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
@@ -216,29 +357,45 @@ class CONJURE_OT_rigid_body_world(Operator):
     )
 
     def execute(self, context):
-        from ..engine import get_server
-
         scene = context.scene
+        rbw = scene.rigidbody_world
+
+        # Confirming the dialog without edits leaves nothing to do; cancelling
+        # also keeps an empty step off the undo stack
+        if rbw is not None and (
+            rbw.time_scale,
+            rbw.substeps_per_frame,
+            rbw.solver_iterations,
+            scene.gravity[:],
+        ) == (self.time_scale, self.substeps_per_frame, self.solver_iterations, self.gravity[:]):
+            self.report({"INFO"}, "Rigid body world settings unchanged")
+            return {"CANCELLED"}
+
         server = get_server()
 
         if not server:
             # Ensure rigid body world exists
-            if scene.rigidbody_world is None:
+            if rbw is None:
                 bpy.ops.rigidbody.world_add()
-
-            rbw = scene.rigidbody_world
-            rbw.time_scale = self.time_scale
-            rbw.substeps_per_frame = self.substeps_per_frame
-            rbw.solver_iterations = self.solver_iterations
+                rbw = scene.rigidbody_world
+
+            # Skip unchanged settings so the simulation cache isn't invalidated
+            if rbw.time_scale != self.time_scale:
+                rbw.time_scale = self.time_scale
+            if rbw.substeps_per_frame != self.substeps_per_frame:
+                rbw.substeps_per_frame = self.substeps_per_frame
+            if rbw.solver_iterations != self.solver_iterations:
+                rbw.solver_iterations = self.solver_iterations
             # Gravity is set on the scene
-            scene.gravity = self.gravity
+            if scene.gravity[:] != self.gravity[:]:
+                scene.gravity = self.gravity
             self.report({"INFO"}, "Updated rigid body world settings")
             return {"FINISHED"}
 
         result = server.executor.execute(
             "configure_rigid_body_world",
             {
-                "gravity": list(self.gravity),
+                "gravity": tuple(self.gravity),
                 "time_scale": self.time_scale,
                 "substeps_per_frame": self.substeps_per_frame,
                 "solver_iterations": self.solver_iterations,
@@ -255,11 +412,12 @@ class CONJURE_OT_rigid_body_world(Operator):
     def invoke(self, context, event):
         # Initialize from current values if they exist
         scene = context.scene
-        if scene.rigidbody_world:
-            self.time_scale = scene.rigidbody_world.time_scale
-            self.substeps_per_frame = scene.rigidbody_world.substeps_per_frame
-            self.solver_iterations = scene.rigidbody_world.solver_iterations
-        self.gravity = scene.gravity
+        rbw = scene.rigidbody_world
+        if rbw is not None:
+            self.time_scale = rbw.time_scale
+            self.substeps_per_frame = rbw.substeps_per_frame
+            self.solver_iterations = rbw.solver_iterations
+        self.gravity = scene.gravity[:]
         return context.window_manager.invoke_props_dialog(self)
 
 
@@ -276,6 +434,24 @@ class CONJURE_OT_add_cloth(Operator):
     bl_description = "Add cloth simulation modifier to the active object"
     bl_options = {"REGISTER", "UNDO"}
 
+    # Properties sent to the server as-is
+    _build_payload = _payload_builder(
+        "mass",
+        "air_damping",
+        "tension_stiffness",
+        "compression_stiffness",
+        "bending_stiffness",
+        "use_pressure",
+        "pressure",
+    )
+
+    quality_preset: EnumProperty(
+        name="Quality",
+        items=_CLOTH_QUALITY_ITEMS,
+        default="CUSTOM",
+        description="Simulation quality preset",
+    )
+
     quality: IntProperty(
         name="Quality Steps",
         default=5,
@@ -340,11 +516,10 @@ class CONJURE_OT_add_cloth(Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.active_object is not None and context.active_object.type == "MESH"
+        obj = context.active_object
+        return obj is not None and obj.type == "MESH"
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
@@ -353,7 +528,7 @@ class CONJURE_OT_add_cloth(Operator):
             cloth_mod = obj.modifiers.new(name="Cloth", type="CLOTH")
             cloth = cloth_mod.settings
 
-            cloth.quality = self.quality
+            cloth.quality = CLOTH_QUALITY_PRESETS.get(self.quality_preset, self.quality)
             cloth.mass = self.mass
             cloth.air_damping = self.air_damping
             cloth.tension_stiffness = self.tension_stiffness
@@ -365,20 +540,15 @@ class CONJURE_OT_add_cloth(Operator):
             self.report({"INFO"}, f"Added cloth to: {obj.name}")
             return {"FINISHED"}
 
-        result = server.executor.execute(
-            "add_cloth",
-            {
-                "object": obj.name,
-                "quality": self.quality,
-                "mass": self.mass,
-                "air_damping": self.air_damping,
-                "tension_stiffness": self.tension_stiffness,
-                "compression_stiffness": self.compression_stiffness,
-                "bending_stiffness": self.bending_stiffness,
-                "use_pressure": self.use_pressure,
-                "pressure": self.pressure,
-            },
-        )
+        payload = {"object": obj.name, "quality": self.quality, **self._build_payload()}
+        # The executor resolves presets; CUSTOM sends the quality steps as-is
+        if self.quality_preset != "CUSTOM":
+            payload["quality_preset"] = self.quality_preset
+        if enqueue_command(context, "add_cloth", payload):
+            self.report({"INFO"}, f"Queued cloth for: {obj.name}")
+            return {"FINISHED"}
+
+        result = server.executor.execute("add_cloth", payload)
 
         if result.get("status") == "success":
             self.report({"INFO"}, f"Added cloth to: {obj.name}")
@@ -402,21 +572,19 @@ class CONJURE_OT_remove_cloth(Operator):
     @classmethod
     def poll(cls, context):
         obj = context.active_object
-        if obj is None:
-            return False
-        return any(m.type == "CLOTH" for m in obj.modifiers)
+        # Redraws call this constantly; the name lookup avoids the type scan
+        # unless the modifier was renamed. Not cached, since the modifier
+        # stack can change without the object changing.
+        return obj is not None and find_modifier(obj, "Cloth", "CLOTH") is not None
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
         if not server:
-            for mod in obj.modifiers:
-                if mod.type == "CLOTH":
-                    obj.modifiers.remove(mod)
-                    break
+            mod = find_modifier(obj, "Cloth", "CLOTH")
+            if mod is not None:
+                obj.modifiers.remove(mod)
             self.report({"INFO"}, f"Removed cloth from: {obj.name}")
             return {"FINISHED"}
 
@@ -441,6 +609,9 @@ class CONJURE_OT_add_collision(Operator):
     bl_description = "Add collision modifier for physics interaction"
     bl_options = {"REGISTER", "UNDO"}
 
+    # Properties sent to the server as-is
+    _build_payload = _payload_builder("damping", "thickness_outer", "friction")
+
     damping: FloatProperty(
         name="Damping",
         default=0.0,
@@ -467,11 +638,10 @@ class CONJURE_OT_add_collision(Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.active_object is not None and context.active_object.type == "MESH"
+        obj = context.active_object
+        return obj is not None and obj.type == "MESH"
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
@@ -484,15 +654,12 @@ class CONJURE_OT_add_collision(Operator):
             self.report({"INFO"}, f"Added collision to: {obj.name}")
             return {"FINISHED"}
 
-        result = server.executor.execute(
-            "add_collision",
-            {
-                "object": obj.name,
-                "damping": self.damping,
-                "thickness_outer": self.thickness_outer,
-                "friction": self.friction,
-            },
-        )
+        payload = {"object": obj.name, **self._build_payload()}
+        if enqueue_command(context, "add_collision", payload):
+            self.report({"INFO"}, f"Queued collision for: {obj.name}")
+            return {"FINISHED"}
+
+        result = server.executor.execute("add_collision", payload)
 
         if result.get("status") == "success":
             self.report({"INFO"}, f"Added collision to: {obj.name}")
@@ -518,12 +685,14 @@ class CONJURE_OT_add_fluid_domain(Operator):
     bl_description = "Add fluid domain modifier to the active object"
     bl_options = {"REGISTER", "UNDO"}
 
+    # Properties sent to the server as-is
+    _build_payload = _payload_builder(
+        "domain_type", "resolution_max", "use_adaptive_domain", "timesteps_max", "use_mesh"
+    )
+
     domain_type: EnumProperty(
         name="Domain Type",
-        items=[
-            ("LIQUID", "Liquid", "Simulate liquid fluid"),
-            ("GAS", "Gas", "Simulate gas/smoke/fire"),
-        ],
+        items=_DOMAIN_TYPE_ITEMS,
         default="LIQUID",
         description="Type of fluid simulation",
     )
@@ -558,11 +727,10 @@ class CONJURE_OT_add_fluid_domain(Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.active_object is not None and context.active_object.type == "MESH"
+        obj = context.active_object
+        return obj is not None and obj.type == "MESH"
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
@@ -581,17 +749,12 @@ class CONJURE_OT_add_fluid_domain(Operator):
             self.report({"INFO"}, f"Added fluid domain to: {obj.name}")
             return {"FINISHED"}
 
-        result = server.executor.execute(
-            "add_fluid_domain",
-            {
-                "object": obj.name,
-                "domain_type": self.domain_type,
-                "resolution_max": self.resolution_max,
-                "use_adaptive_domain": self.use_adaptive_domain,
-                "timesteps_max": self.timesteps_max,
-                "use_mesh": self.use_mesh,
-            },
-        )
+        payload = {"object": obj.name, **self._build_payload()}
+        if enqueue_command(context, "add_fluid_domain", payload):
+            self.report({"INFO"}, f"Queued fluid domain for: {obj.name}")
+            return {"FINISHED"}
+
+        result = server.executor.execute("add_fluid_domain", payload)
 
         if result.get("status") == "success":
             self.report({"INFO"}, f"Added fluid domain to: {obj.name}")
@@ -612,25 +775,19 @@ class CONJURE_OT_add_fluid_flow(Operator):
     bl_description = "Add fluid flow/inflow modifier to the active object"
     bl_options = {"REGISTER", "UNDO"}
 
+    # Properties sent to the server as-is
+    _build_payload = _payload_builder("flow_type", "flow_behavior", "use_inflow", "velocity_factor")
+
     flow_type: EnumProperty(
         name="Flow Type",
-        items=[
-            ("LIQUID", "Liquid", "Emit liquid"),
-            ("SMOKE", "Smoke", "Emit smoke"),
-            ("FIRE", "Fire", "Emit fire"),
-            ("BOTH", "Fire + Smoke", "Emit both fire and smoke"),
-        ],
+        items=_FLOW_TYPE_ITEMS,
         default="LIQUID",
         description="Type of flow emission",
     )
 
     flow_behavior: EnumProperty(
         name="Behavior",
-        items=[
-            ("INFLOW", "Inflow", "Continuously add fluid"),
-            ("OUTFLOW", "Outflow", "Remove fluid"),
-            ("GEOMETRY", "Geometry", "Use as obstacle/initial geometry"),
-        ],
+        items=_FLOW_BEHAVIOR_ITEMS,
         default="INFLOW",
         description="Flow behavior type",
     )
@@ -651,11 +808,10 @@ class CONJURE_OT_add_fluid_flow(Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.active_object is not None and context.active_object.type == "MESH"
+        obj = context.active_object
+        return obj is not None and obj.type == "MESH"
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
@@ -672,16 +828,12 @@ class CONJURE_OT_add_fluid_flow(Operator):
             self.report({"INFO"}, f"Added fluid flow to: {obj.name}")
             return {"FINISHED"}
 
-        result = server.executor.execute(
-            "add_fluid_flow",
-            {
-                "object": obj.name,
-                "flow_type": self.flow_type,
-                "flow_behavior": self.flow_behavior,
-                "use_inflow": self.use_inflow,
-                "velocity_factor": self.velocity_factor,
-            },
-        )
+        payload = {"object": obj.name, **self._build_payload()}
+        if enqueue_command(context, "add_fluid_flow", payload):
+            self.report({"INFO"}, f"Queued fluid flow for: {obj.name}")
+            return {"FINISHED"}
+
+        result = server.executor.execute("add_fluid_flow", payload)
 
         if result.get("status") == "success":
             self.report({"INFO"}, f"Added fluid flow to: {obj.name}")
@@ -702,12 +854,12 @@ class CONJURE_OT_add_fluid_effector(Operator):
     bl_description = "Add fluid effector/obstacle modifier to the active object"
     bl_options = {"REGISTER", "UNDO"}
 
+    # Properties sent to the server as-is
+    _build_payload = _payload_builder("effector_type", "use_effector", "subframes", "surface_distance")
+
     effector_type: EnumProperty(
         name="Effector Type",
-        items=[
-            ("COLLISION", "Collision", "Object blocks fluid"),
-            ("GUIDE", "Guide", "Object guides fluid flow"),
-        ],
+        items=_EFFECTOR_TYPE_ITEMS,
         default="COLLISION",
         description="Type of effector",
     )
@@ -736,11 +888,10 @@ class CONJURE_OT_add_fluid_effector(Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.active_object is not None and context.active_object.type == "MESH"
+        obj = context.active_object
+        return obj is not None and obj.type == "MESH"
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
@@ -757,16 +908,12 @@ class CONJURE_OT_add_fluid_effector(Operator):
             self.report({"INFO"}, f"Added fluid effector to: {obj.name}")
             return {"FINISHED"}
 
-        result = server.executor.execute(
-            "add_fluid_effector",
-            {
-                "object": obj.name,
-                "effector_type": self.effector_type,
-                "use_effector": self.use_effector,
-                "subframes": self.subframes,
-                "surface_distance": self.surface_distance,
-            },
-        )
+        payload = {"object": obj.name, **self._build_payload()}
+        if enqueue_command(context, "add_fluid_effector", payload):
+            self.report({"INFO"}, f"Queued fluid effector for: {obj.name}")
+            return {"FINISHED"}
+
+        result = server.executor.execute("add_fluid_effector", payload)
 
         if result.get("status") == "success":
             self.report({"INFO"}, f"Added fluid effector to: {obj.name}")
@@ -789,12 +936,7 @@ class CONJURE_OT_bake_physics(Operator):
 
     physics_type: EnumProperty(
         name="Type",
-        items=[
-            ("ALL", "All Physics", "Bake all physics types"),
-            ("RIGID_BODY", "Rigid Body", "Bake rigid body simulation"),
-            ("CLOTH", "Cloth", "Bake cloth simulation"),
-            ("FLUID", "Fluid", "Bake fluid simulation"),
-        ],
+        items=_PHYSICS_TYPE_ITEMS,
         default="ALL",
         description="Type of physics to bake",
     )
@@ -814,8 +956,6 @@ class CONJURE_OT_bake_physics(Operator):
     )
 
     def execute(self, context):
-        from ..engine import get_server
-
         server = get_server()
 
         if not server:
@@ -823,31 +963,40 @@ class CONJURE_OT_bake_physics(Operator):
             context.scene.frame_start = self.frame_start
             context.scene.frame_end = self.frame_end
 
-            if self.physics_type == "ALL" or self.physics_type == "RIGID_BODY":
-                if context.scene.rigidbody_world:
-                    bpy.ops.ptcache.bake_all(bake=True)
+            # bake_all bakes every point cache in the scene (rigid body, cloth,
+            # soft body) in one pass; run it as a job so the UI stays responsive
+            if self.physics_type == "ALL" or (self.physics_type == "RIGID_BODY" and context.scene.rigidbody_world):
+                bpy.ops.ptcache.bake_all("INVOKE_DEFAULT", bake=True)
+                self.report({"INFO"}, f"Started {self.physics_type.lower()} bake")
+                return {"FINISHED"}
 
             if self.physics_type == "CLOTH":
+                # Only the selected cloths; ptcache.bake takes one cache at a time
                 for obj in context.selected_objects:
-                    for mod in obj.modifiers:
-                        if mod.type == "CLOTH":
-                            # Point cache bake for cloth
-                            with context.temp_override(object=obj, point_cache=mod.point_cache):
-                                bpy.ops.ptcache.bake(bake=True)
+                    mod = find_modifier(obj, "Cloth", "CLOTH")
+                    if mod is not None:
+                        with context.temp_override(object=obj, point_cache=mod.point_cache):
+                            bpy.ops.ptcache.bake(bake=True)
 
             self.report({"INFO"}, f"Baked {self.physics_type.lower()} simulation")
             return {"FINISHED"}
 
-        result = server.executor.execute(
-            "bake_physics",
-            {
-                "physics_type": self.physics_type,
-                "frame_start": self.frame_start,
-                "frame_end": self.frame_end,
-            },
-        )
+        payload = {
+            "physics_type": self.physics_type,
+            "frame_start": self.frame_start,
+            "frame_end": self.frame_end,
+            "background": True,
+        }
+        if enqueue_command(context, "bake_physics", payload):
+            self.report({"INFO"}, f"Queued {self.physics_type.lower()} bake")
+            return {"FINISHED"}
 
-        if result.get("status") == "success":
+        result = server.executor.execute("bake_physics", payload)
+
+        if result.get("status") == "started":
+            self.report({"INFO"}, f"Started {self.physics_type.lower()} bake")
+            return {"FINISHED"}
+        elif result.get("status") == "success":
             self.report({"INFO"}, f"Baked {self.physics_type.lower()} simulation")
             return {"FINISHED"}
         else:
@@ -873,6 +1022,11 @@ class CONJURE_OT_add_soft_body(Operator):
     bl_description = "Add soft body simulation modifier to the active object"
     bl_options = {"REGISTER", "UNDO"}
 
+    # Properties sent to the server as-is
+    _build_payload = _payload_builder(
+        "mass", "friction", "speed", "goal_strength", "goal_friction", "use_edges", "pull", "push"
+    )
+
     mass: FloatProperty(
         name="Mass",
         default=1.0,
@@ -937,11 +1091,10 @@ class CONJURE_OT_add_soft_body(Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.active_object is not None and context.active_object.type == "MESH"
+        obj = context.active_object
+        return obj is not None and obj.type == "MESH"
 
     def execute(self, context):
-        from ..engine import get_server
-
         obj = context.active_object
         server = get_server()
 
@@ -961,20 +1114,12 @@ class CONJURE_OT_add_soft_body(Operator):
             self.report({"INFO"}, f"Added soft body to: {obj.name}")
             return {"FINISHED"}
 
-        result = server.executor.execute(
-            "add_soft_body",
-            {
-                "object": obj.name,
-                "mass": self.mass,
-                "friction": self.friction,
-                "speed": self.speed,
-                "goal_strength": self.goal_strength,
-                "goal_friction": self.goal_friction,
-                "use_edges": self.use_edges,
-                "pull": self.pull,
-                "push": self.push,
-            },
-        )
+        payload = {"object": obj.name, **self._build_payload()}
+        if enqueue_command(context, "add_soft_body", payload):
+            self.report({"INFO"}, f"Queued soft body for: {obj.name}")
+            return {"FINISHED"}
+
+        result = server.executor.execute("add_soft_body", payload)
 
         if result.get("status") == "success":
             self.report({"INFO"}, f"Added soft body to: {obj.name}")
@@ -8,8 +8,51 @@ import bpy
 from bpy.props import FloatProperty, FloatVectorProperty, IntProperty, StringProperty
 from bpy.types import Operator
 
+from ..engine import get_server
+from .batch import enqueue_command
 
-class CONJURE_OT_create_cube(Operator):
+
+class _PrimitiveOperator:
+    """Mixin with the execute/invoke shared by the primitive operators.
+
+    Subclasses set the server command, the noun used in reports and the
+    payload properties, and define _add_primitive for the local path.
+    """
+
+    _command = ""
+    _noun = ""
+    _payload_keys = ("name",)
+
+    def execute(self, context):
+        server = get_server()
+        if not server:
+            # Fallback to direct Blender operation
+            self._add_primitive()
+            bpy.context.active_object.name = self.name
+            self.report({"INFO"}, f"Created {self._noun}: {self.name}")
+            return {"FINISHED"}
+
+        # Execute via server
+        payload = {key: getattr(self, key) for key in self._payload_keys}
+        payload["location"] = self.location[:]
+        if enqueue_command(context, self._command, payload):
+            self.report({"INFO"}, f"Queued {self._noun}: {self.name}")
+            return {"FINISHED"}
+
+        result = server.executor.execute(self._command, payload)
+
+        if result.get("status") == "success":
+            self.report({"INFO"}, f"Created {self._noun}: {result.get('object')}")
+            return {"FINISHED"}
+        else:
+            self.report({"ERROR"}, result.get("error", "Unknown error"))
+            return {"CANCELLED"}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+
+class CONJURE_OT_create_cube(_PrimitiveOperator, Operator):
     """Create a cube via Conjure."""
 
     bl_idname = "conjure.create_cube"
@@ -17,6 +60,10 @@ class CONJURE_OT_create_cube(Operator):
     bl_description = "Create a cube mesh primitive"
     bl_options = {"REGISTER", "UNDO"}
 
+    _command = "create_cube"
+    _noun = "cube"
+    _payload_keys = ("name", "size")
+
     name: StringProperty(
         name="Name",
         default="Cube",
@@ -37,39 +84,11 @@ class CONJURE_OT_create_cube(Operator):
         description="Location for the new cube",
     )
 
-    def execute(self, context):
-        from ..engine import get_server
-
-        server = get_server()
-        if not server:
-            # Fallback to direct Blender operation
-            bpy.ops.mesh.primitive_cube_add(size=self.size, location=self.location)
-            bpy.context.active_object.name = self.name
-            self.report({"INFO"}, f"Created cube: {self.name}")
-            return {"FINISHED"}
-
-        # Execute via server
-        result = server.executor.execute(
-            "create_cube",
-            {
-                "name": self.name,
-                "size": self.size,
-                "location": list(self.location),
-            },
-        )
-
-        if result.get("status") == "success":
-            self.report({"INFO"}, f"Created cube: {result.get('object')}")
-            return {"FINISHED"}
-        else:
-            self.report({"ERROR"}, result.get("error", "Unknown error"))
-            return {"CANCELLED"}
-
-    def invoke(self, context, event):
-        return context.window_manager.invoke_props_dialog(self)
+    def _add_primitive(self):
+        bpy.ops.mesh.primitive_cube_add(size=self.size, location=self.location)
 
 
-class CONJURE_OT_create_sphere(Operator):
+class CONJURE_OT_create_sphere(_PrimitiveOperator, Operator):
     """Create a sphere via Conjure."""
 
     bl_idname = "conjure.create_sphere"
@@ -77,6 +96,10 @@ class CONJURE_OT_create_sphere(Operator):
     bl_description = "Create a UV sphere mesh primitive"
     bl_options = {"REGISTER", "UNDO"}
 
+    _command = "create_sphere"
+    _noun = "sphere"
+    _payload_keys = ("name", "radius", "segments", "rings")
+
     name: StringProperty(
         name="Name",
         default="Sphere",
@@ -113,44 +136,16 @@ class CONJURE_OT_create_sphere(Operator):
         description="Location for the new sphere",
     )
 
-    def execute(self, context):
-        from ..engine import get_server
-
-        server = get_server()
-        if not server:
-            bpy.ops.mesh.primitive_uv_sphere_add(
-                radius=self.radius,
-                segments=self.segments,
-                ring_count=self.rings,
-                location=self.location,
-            )
-            bpy.context.active_object.name = self.name
-            self.report({"INFO"}, f"Created sphere: {self.name}")
-            return {"FINISHED"}
-
-        result = server.executor.execute(
-            "create_sphere",
-            {
-                "name": self.name,
-                "radius": self.radius,
-                "segments": self.segments,
-                "rings": self.rings,
-                "location": list(self.location),
-            },
+    def _add_primitive(self):
+        bpy.ops.mesh.primitive_uv_sphere_add(
+            radius=self.radius,
+            segments=self.segments,
+            ring_count=self.rings,
+            location=self.location,
         )
 
-        if result.get("status") == "success":
-            self.report({"INFO"}, f"Created sphere: {result.get('object')}")
-            return {"FINISHED"}
-        else:
-            self.report({"ERROR"}, result.get("error", "Unknown error"))
-            return {"CANCELLED"}
-
-    def invoke(self, context, event):
-        return context.window_manager.invoke_props_dialog(self)
-
 
-class CONJURE_OT_create_cylinder(Operator):
+class CONJURE_OT_create_cylinder(_PrimitiveOperator, Operator):
     """Create a cylinder via Conjure."""
 
     bl_idname = "conjure.create_cylinder"
@@ -158,6 +153,10 @@ class CONJURE_OT_create_cylinder(Operator):
     bl_description = "Create a cylinder mesh primitive"
     bl_options = {"REGISTER", "UNDO"}
 
+    _command = "create_cylinder"
+    _noun = "cylinder"
+    _payload_keys = ("name", "radius", "depth", "vertices")
+
     name: StringProperty(
         name="Name",
         default="Cylinder",
@@ -193,44 +192,16 @@ class CONJURE_OT_create_cylinder(Operator):
         description="Location for the new cylinder",
     )
 
-    def execute(self, context):
-        from ..engine import get_server
-
-        server = get_server()
-        if not server:
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=self.radius,
-                depth=self.depth,
-                vertices=self.vertices,
-                location=self.location,
-            )
-            bpy.context.active_object.name = self.name
-            self.report({"INFO"}, f"Created cylinder: {self.name}")
-            return {"FINISHED"}
-
-        result = server.executor.execute(
-            "create_cylinder",
-            {
-                "name": self.name,
-                "radius": self.radius,
-                "depth": self.depth,
-                "vertices": self.vertices,
-                "location": list(self.location),
-            },
+    def _add_primitive(self):
+        bpy.ops.mesh.primitive_cylinder_add(
+            radius=self.radius,
+            depth=self.depth,
+            vertices=self.vertices,
+            location=self.location,
         )
 
-        if result.get("status") == "success":
-            self.report({"INFO"}, f"Created cylinder: {result.get('object')}")
-            return {"FINISHED"}
-        else:
-            self.report({"ERROR"}, result.get("error", "Unknown error"))
-            return {"CANCELLED"}
-
-    def invoke(self, context, event):
-        return context.window_manager.invoke_props_dialog(self)
-
 
-class CONJURE_OT_create_cone(Operator):
+class CONJURE_OT_create_cone(_PrimitiveOperator, Operator):
     """Create a cone via Conjure."""
 
     bl_idname = "conjure.create_cone"
@@ -238,6 +209,10 @@ class CONJURE_OT_create_cone(Operator):
     bl_description = "Create a cone mesh primitive"
     bl_options = {"REGISTER", "UNDO"}
 
+    _command = "create_cone"
+    _noun = "cone"
+    _payload_keys = ("name", "radius1", "radius2", "depth", "vertices")
+
     name: StringProperty(
         name="Name",
         default="Cone",
@@ -280,40 +255,11 @@ class CONJURE_OT_create_cone(Operator):
         description="Location for the new cone",
     )
 
-    def execute(self, context):
-        from ..engine import get_server
-
-        server = get_server()
-        if not server:
-            bpy.ops.mesh.primitive_cone_add(
-                radius1=self.radius1,
-                radius2=self.radius2,
-                depth=self.depth,
-                vertices=self.vertices,
-                location=self.location,
-            )
-            bpy.context.active_object.name = self.name
-            self.report({"INFO"}, f"Created cone: {self.name}")
-            return {"FINISHED"}
-
-        result = server.executor.execute(
-            "create_cone",
-            {
-                "name": self.name,
-                "radius1": self.radius1,
-                "radius2": self.radius2,
-                "depth": self.depth,
-                "vertices": self.vertices,
-                "location": list(self.location),
-            },
+    def _add_primitive(self):
+        bpy.ops.mesh.primitive_cone_add(
+            radius1=self.radius1,
+            radius2=self.radius2,
+            depth=self.depth,
+            vertices=self.vertices,
+            location=self.location,
         )
-
-        if result.get("status") == "success":
-            self.report({"INFO"}, f"Created cone: {result.get('object')}")
-            return {"FINISHED"}
-        else:
-            self.report({"ERROR"}, result.get("error", "Unknown error"))
-            return {"CANCELLED"}
-
-    def invoke(self, context, event):
-        return context.window_manager.invoke_props_dialog(self)
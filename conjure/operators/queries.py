@@ -8,6 +8,11 @@ import bpy
 from bpy.props import EnumProperty, StringProperty
 from bpy.types import Operator
 
+from ..engine import get_server
+
+# Number of object names shown in the list_objects report
+_LIST_REPORT_LIMIT = 10
+
 
 class CONJURE_OT_get_state(Operator):
     """Get scene state via Conjure."""
@@ -17,8 +22,6 @@ class CONJURE_OT_get_state(Operator):
     bl_description = "Get current scene state information"
 
     def execute(self, context):
-        from ..engine import get_server
-
         server = get_server()
         if not server:
             # Direct query without server
@@ -63,16 +66,17 @@ class CONJURE_OT_list_objects(Operator):
     )
 
     def execute(self, context):
-        from ..engine import get_server
-
         type_filter = None if self.object_type == "ALL" else self.object_type
 
         server = get_server()
         if not server:
-            objects = [obj.name for obj in context.scene.objects if type_filter is None or obj.type == type_filter]
-            self.report(
-                {"INFO"}, f"Objects ({len(objects)}): {', '.join(objects[:10])}{'...' if len(objects) > 10 else ''}"
-            )
+            # Query the live scene and only resolve the names shown
+            objects = context.scene.objects
+            if type_filter is not None:
+                objects = [obj for obj in objects if obj.type == type_filter]
+            names = [obj.name for obj in objects[:_LIST_REPORT_LIMIT]]
+            more = "..." if len(objects) > _LIST_REPORT_LIMIT else ""
+            self.report({"INFO"}, f"Objects ({len(objects)}): {', '.join(names)}{more}")
             return {"FINISHED"}
 
         result = server.executor.execute(
@@ -82,8 +86,9 @@ class CONJURE_OT_list_objects(Operator):
 
         if result.get("status") == "success":
             objects = result.get("objects", [])
-            names = [obj.get("name", "?") for obj in objects]
-            self.report({"INFO"}, f"Objects ({len(names)}): {', '.join(names[:10])}{'...' if len(names) > 10 else ''}")
+            names = [obj.get("name", "?") for obj in objects[:_LIST_REPORT_LIMIT]]
+            more = "..." if len(objects) > _LIST_REPORT_LIMIT else ""
+            self.report({"INFO"}, f"Objects ({len(objects)}): {', '.join(names)}{more}")
             return {"FINISHED"}
         else:
             self.report({"ERROR"}, result.get("error", "Unknown error"))
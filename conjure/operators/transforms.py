@@ -4,9 +4,68 @@ Transform operators for Conjure.
 Operators for moving, rotating, and scaling objects.
 """
 
+import math
+
 import bpy
 from bpy.props import FloatProperty, FloatVectorProperty, StringProperty
 from bpy.types import Operator
+from mathutils import Vector
+
+from ..engine import get_server
+from ..utils import find_missing, get_many, split_names
+from .batch import enqueue_command, has_pending
+
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
+# Transforms closer than this to the current value are not sent
+_NOOP_EPSILON = 1e-6
+
+
+def _target_names(operator, context):
+    """Names from the operator's ';'-separated list, else the active object."""
+    if operator.object_name:
+        return split_names(operator.object_name)
+    return [context.active_object.name] if context.active_object else []
+
+
+def _lookup_objects(operator, names):
+    """Resolve all names at once, reporting the first missing one."""
+    try:
+        return get_many(names)
+    except KeyError:
+        operator.report({"ERROR"}, f"Object '{find_missing(names)[0]}' not found")
+        return None
+
+
+def _already_at(context, names, attr, target):
+    """Whether every named object's attr already matches target.
+
+    Always False while commands are queued (or about to be) for the
+    objects, since the live state doesn't reflect them yet.
+    """
+    if context.scene.conjure_batch_mode or has_pending(names):
+        return False
+    data_objects = bpy.data.objects
+    for name in names:
+        obj = data_objects.get(name)
+        # Missing objects are left for the server to report
+        if obj is None or any(abs(a - b) > _NOOP_EPSILON for a, b in zip(getattr(obj, attr), target)):
+            return False
+    return True
+
+
+def _enqueue_each(context, command, names, payload):
+    """Queue one command per object when in batch mode."""
+    return all(enqueue_command(context, command, {"object": name, **payload}) for name in names)
+
+
+def _execute_each(server, command, names, payload):
+    """Run a command per object, as one execute_batch call for several objects."""
+    if len(names) == 1:
+        return server.executor.execute(command, {"object": names[0], **payload})
+    commands = [{"command": command, "params": {"object": name, **payload}} for name in names]
+    return server.executor.execute("execute_batch", {"commands": commands})
 
 
 class CONJURE_OT_move_object(Operator):
@@ -19,7 +78,7 @@ class CONJURE_OT_move_object(Operator):
 
     object_name: StringProperty(
         name="Object",
-        description="Name of the object to move",
+        description="Name of the object to move (separate several with ';')",
     )
 
     location: FloatVectorProperty(
@@ -30,34 +89,35 @@ class CONJURE_OT_move_object(Operator):
     )
 
     def execute(self, context):
-        from ..engine import get_server
-
-        obj_name = self.object_name or (context.active_object.name if context.active_object else None)
-        if not obj_name:
+        names = _target_names(self, context)
+        if not names:
             self.report({"ERROR"}, "No object selected")
             return {"CANCELLED"}
+        label = ", ".join(names)
 
         server = get_server()
         if not server:
-            obj = bpy.data.objects.get(obj_name)
-            if obj:
-                obj.location = self.location
-                self.report({"INFO"}, f"Moved {obj_name}")
-                return {"FINISHED"}
-            else:
-                self.report({"ERROR"}, f"Object '{obj_name}' not found")
+            objects = _lookup_objects(self, names)
+            if objects is None:
                 return {"CANCELLED"}
+            for obj in objects:
+                obj.location = self.location
+            self.report({"INFO"}, f"Moved {label}")
+            return {"FINISHED"}
 
-        result = server.executor.execute(
-            "move_object",
-            {
-                "object": obj_name,
-                "location": list(self.location),
-            },
-        )
+        if _already_at(context, names, "location", self.location):
+            self.report({"INFO"}, f"{label} already at location")
+            return {"FINISHED"}
+
+        payload = {"location": self.location[:]}
+        if _enqueue_each(context, "move_object", names, payload):
+            self.report({"INFO"}, f"Queued move of {label}")
+            return {"FINISHED"}
+
+        result = _execute_each(server, "move_object", names, payload)
 
         if result.get("status") == "success":
-            self.report({"INFO"}, f"Moved {obj_name}")
+            self.report({"INFO"}, f"Moved {label}")
             return {"FINISHED"}
         else:
             self.report({"ERROR"}, result.get("error", "Unknown error"))
@@ -80,7 +140,7 @@ class CONJURE_OT_rotate_object(Operator):
 
     object_name: StringProperty(
         name="Object",
-        description="Name of the object to rotate",
+        description="Name of the object to rotate (separate several with ';')",
     )
 
     rotation: FloatVectorProperty(
@@ -91,47 +151,46 @@ class CONJURE_OT_rotate_object(Operator):
     )
 
     def execute(self, context):
-        import math
-
-        from ..engine import get_server
-
-        obj_name = self.object_name or (context.active_object.name if context.active_object else None)
-        if not obj_name:
+        names = _target_names(self, context)
+        if not names:
             self.report({"ERROR"}, "No object selected")
             return {"CANCELLED"}
+        label = ", ".join(names)
 
         server = get_server()
         if not server:
-            obj = bpy.data.objects.get(obj_name)
-            if obj:
-                obj.rotation_euler = [math.radians(r) for r in self.rotation]
-                self.report({"INFO"}, f"Rotated {obj_name}")
-                return {"FINISHED"}
-            else:
-                self.report({"ERROR"}, f"Object '{obj_name}' not found")
+            objects = _lookup_objects(self, names)
+            if objects is None:
                 return {"CANCELLED"}
+            # Scale all three angles in one mathutils (C) operation
+            rotation = Vector(self.rotation) * _DEG2RAD
+            for obj in objects:
+                obj.rotation_euler = rotation
+            self.report({"INFO"}, f"Rotated {label}")
+            return {"FINISHED"}
 
-        result = server.executor.execute(
-            "rotate_object",
-            {
-                "object": obj_name,
-                "rotation": list(self.rotation),
-            },
-        )
+        if _already_at(context, names, "rotation_euler", Vector(self.rotation) * _DEG2RAD):
+            self.report({"INFO"}, f"{label} already at rotation")
+            return {"FINISHED"}
+
+        payload = {"rotation": self.rotation[:]}
+        if _enqueue_each(context, "rotate_object", names, payload):
+            self.report({"INFO"}, f"Queued rotation of {label}")
+            return {"FINISHED"}
+
+        result = _execute_each(server, "rotate_object", names, payload)
 
         if result.get("status") == "success":
-            self.report({"INFO"}, f"Rotated {obj_name}")
+            self.report({"INFO"}, f"Rotated {label}")
             return {"FINISHED"}
         else:
             self.report({"ERROR"}, result.get("error", "Unknown error"))
             return {"CANCELLED"}
 
     def invoke(self, context, event):
-        import math
-
         if context.active_object:
             self.object_name = context.active_object.name
-            self.rotation = [math.degrees(r) for r in context.active_object.rotation_euler]
+            self.rotation = Vector(context.active_object.rotation_euler) * _RAD2DEG
         return context.window_manager.invoke_props_dialog(self)
 
 
@@ -145,7 +204,7 @@ class CONJURE_OT_scale_object(Operator):
 
     object_name: StringProperty(
         name="Object",
-        description="Name of the object to scale",
+        description="Name of the object to scale (separate several with ';')",
     )
 
     scale: FloatVectorProperty(
@@ -163,37 +222,43 @@ class CONJURE_OT_scale_object(Operator):
     )
 
     def execute(self, context):
-        from ..engine import get_server
-
-        obj_name = self.object_name or (context.active_object.name if context.active_object else None)
-        if not obj_name:
+        names = _target_names(self, context)
+        if not names:
             self.report({"ERROR"}, "No object selected")
             return {"CANCELLED"}
+        label = ", ".join(names)
 
         server = get_server()
         if not server:
-            obj = bpy.data.objects.get(obj_name)
-            if obj:
-                if self.uniform != 1.0:
-                    obj.scale = (self.uniform, self.uniform, self.uniform)
-                else:
-                    obj.scale = self.scale
-                self.report({"INFO"}, f"Scaled {obj_name}")
-                return {"FINISHED"}
-            else:
-                self.report({"ERROR"}, f"Object '{obj_name}' not found")
+            objects = _lookup_objects(self, names)
+            if objects is None:
                 return {"CANCELLED"}
+            if self.uniform != 1.0:
+                scale = (self.uniform, self.uniform, self.uniform)
+            else:
+                scale = self.scale
+            for obj in objects:
+                obj.scale = scale
+            self.report({"INFO"}, f"Scaled {label}")
+            return {"FINISHED"}
 
-        params = {"object": obj_name}
+        params = {}
         if self.uniform != 1.0:
             params["uniform"] = self.uniform
+            target = (self.uniform, self.uniform, self.uniform)
         else:
-            params["scale"] = list(self.scale)
+            params["scale"] = target = self.scale[:]
+        if _already_at(context, names, "scale", target):
+            self.report({"INFO"}, f"{label} already at scale")
+            return {"FINISHED"}
+        if _enqueue_each(context, "scale_object", names, params):
+            self.report({"INFO"}, f"Queued scale of {label}")
+            return {"FINISHED"}
 
-        result = server.executor.execute("scale_object", params)
+        result = _execute_each(server, "scale_object", names, params)
 
         if result.get("status") == "success":
-            self.report({"INFO"}, f"Scaled {obj_name}")
+            self.report({"INFO"}, f"Scaled {label}")
             return {"FINISHED"}
         else:
             self.report({"ERROR"}, result.get("error", "Unknown error"))
@@ -25,14 +25,4 @@ classes = [
     CONJURE_PT_metrics,
 ]
 
-
-def register():
-    """Register all panels."""
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-
-def unregister():
-    """Unregister all panels."""
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+register, unregister = bpy.utils.register_classes_factory(classes)
@@ -7,6 +7,45 @@ Provides the primary UI for Conjure functionality in the 3D View sidebar.
 import bpy
 from bpy.types import Panel
 
+# Static (operator, icon, text) button columns, built once at import
+_PRIMITIVE_BUTTONS = (
+    ("conjure.create_cube", "MESH_CUBE", "Create Cube"),
+    ("conjure.create_sphere", "MESH_UVSPHERE", "Create Sphere"),
+    ("conjure.create_cylinder", "MESH_CYLINDER", "Create Cylinder"),
+    ("conjure.create_cone", "MESH_CONE", "Create Cone"),
+)
+
+_QUERY_BUTTONS = (
+    ("conjure.get_state", "INFO", "Get State"),
+    ("conjure.list_objects", "OUTLINER", "List Objects"),
+)
+
+_TRANSFORM_BUTTONS = (
+    ("conjure.move_object", "EMPTY_ARROWS", "Move"),
+    ("conjure.rotate_object", "DRIVER_ROTATIONAL_DIFFERENCE", "Rotate"),
+    ("conjure.scale_object", "FULLSCREEN_ENTER", "Scale"),
+)
+
+_ESTIMATE_BUTTONS = (
+    ("conjure.estimate_mass", "ORIENTATION_GLOBAL", "Mass Properties"),
+    ("conjure.estimate_beam", "MESH_PLANE", "Beam Analysis"),
+    ("conjure.estimate_thermal", "LIGHT_SUN", "Thermal Analysis"),
+)
+
+_SIMULATION_BUTTONS = (
+    ("conjure.run_stress", "CON_SHRINKWRAP", "Stress Analysis"),
+    ("conjure.run_thermal", "LIGHT_SUN", "Heat Transfer"),
+    ("conjure.run_dynamic", "CURVE_PATH", "Dynamic Analysis"),
+)
+
+
+def _draw_buttons(layout, buttons):
+    """Draw a column of operator buttons."""
+    col = layout.column(align=True)
+    operator = col.operator
+    for idname, icon, text in buttons:
+        operator(idname, icon=icon, text=text)
+
 
 class CONJURE_PT_main(Panel):
     """Main Conjure panel."""
@@ -32,17 +71,16 @@ class CONJURE_PT_main(Panel):
         layout.separator()
         layout.label(text="Quick Actions:")
 
-        col = layout.column(align=True)
-        col.operator("conjure.create_cube", icon="MESH_CUBE", text="Create Cube")
-        col.operator("conjure.create_sphere", icon="MESH_UVSPHERE", text="Create Sphere")
-        col.operator("conjure.create_cylinder", icon="MESH_CYLINDER", text="Create Cylinder")
-        col.operator("conjure.create_cone", icon="MESH_CONE", text="Create Cone")
+        _draw_buttons(layout, _PRIMITIVE_BUTTONS)
+
+        # Batch mode queues commands until Apply Batch sends them together
+        row = layout.row(align=True)
+        row.prop(context.scene, "conjure_batch_mode", text="Batch", toggle=True)
+        row.operator("conjure.flush_batch", icon="PLAY", text="Apply Batch")
 
         layout.separator()
 
-        col = layout.column(align=True)
-        col.operator("conjure.get_state", icon="INFO", text="Get State")
-        col.operator("conjure.list_objects", icon="OUTLINER", text="List Objects")
+        _draw_buttons(layout, _QUERY_BUTTONS)
 
 
 class CONJURE_PT_connection(Panel):
@@ -109,10 +147,7 @@ class CONJURE_PT_operations(Panel):
 
         # Transform operations
         layout.label(text="Transforms:", icon="ORIENTATION_GLOBAL")
-        col = layout.column(align=True)
-        col.operator("conjure.move_object", icon="EMPTY_ARROWS", text="Move")
-        col.operator("conjure.rotate_object", icon="DRIVER_ROTATIONAL_DIFFERENCE", text="Rotate")
-        col.operator("conjure.scale_object", icon="FULLSCREEN_ENTER", text="Scale")
+        _draw_buttons(layout, _TRANSFORM_BUTTONS)
 
         # Modifier operations (placeholder)
         layout.separator()
@@ -285,18 +320,12 @@ class CONJURE_PT_simulation(Panel):
 
         # Quick estimate section
         layout.label(text="Quick Estimates:", icon="PHYSICS")
-        col = layout.column(align=True)
-        col.operator("conjure.estimate_mass", icon="ORIENTATION_GLOBAL", text="Mass Properties")
-        col.operator("conjure.estimate_beam", icon="MESH_PLANE", text="Beam Analysis")
-        col.operator("conjure.estimate_thermal", icon="LIGHT_SUN", text="Thermal Analysis")
+        _draw_buttons(layout, _ESTIMATE_BUTTONS)
 
         # Standard simulation
         layout.separator()
         layout.label(text="Simulations:", icon="FORCE_FORCE")
-        col = layout.column(align=True)
-        col.operator("conjure.run_stress", icon="CON_SHRINKWRAP", text="Stress Analysis")
-        col.operator("conjure.run_thermal", icon="LIGHT_SUN", text="Heat Transfer")
-        col.operator("conjure.run_dynamic", icon="CURVE_PATH", text="Dynamic Analysis")
+        _draw_buttons(layout, _SIMULATION_BUTTONS)
 
         # Note about server
         layout.separator()
@@ -4,16 +4,41 @@ Conjure utilities package.
 Contains utility functions and helpers.
 """
 
+from .armature import add_edit_bone, bone_edit_session
 from .conversion import (
     degrees_to_radians,
+    degrees_to_radians_array,
+    eulers_to_array,
     list_to_vector,
+    matrices_to_array,
+    matrix_to_array,
+    matrix_to_bytes,
     radians_to_degrees,
+    radians_to_degrees_array,
     vector_to_list,
+    vectors_to_array,
 )
+from .object_access import find_missing, get_many, split_names
+from .physics import CLOTH_QUALITY_PRESETS, RIGID_BODY_QUALITY_PRESETS, find_modifier
 
 __all__ = [
     "degrees_to_radians",
     "radians_to_degrees",
     "vector_to_list",
     "list_to_vector",
+    "degrees_to_radians_array",
+    "radians_to_degrees_array",
+    "matrix_to_array",
+    "matrix_to_bytes",
+    "vectors_to_array",
+    "eulers_to_array",
+    "matrices_to_array",
+    "get_many",
+    "find_missing",
+    "split_names",
+    "bone_edit_session",
+    "add_edit_bone",
+    "RIGID_BODY_QUALITY_PRESETS",
+    "CLOTH_QUALITY_PRESETS",
+    "find_modifier",
 ]
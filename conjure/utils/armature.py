@@ -0,0 +1,66 @@
+"""
+Armature editing utilities for Conjure.
+
+Helpers shared by the bone operators and the command executor.
+"""
+
+import contextlib
+from typing import Iterator, Optional, Sequence
+
+import bpy
+
+
+@contextlib.contextmanager
+def bone_edit_session(obj: bpy.types.Object) -> Iterator[bpy.types.bpy_prop_collection]:
+    """Keep an armature in edit mode for the duration of the block.
+
+    mode_set acts on the active object, so a non-active armature is made the
+    only selected, active object for the block and the previous selection
+    and active object are restored afterwards. Edit mode is entered only if
+    the armature isn't already there and the previous mode is restored, so
+    nested or batched bone edits cost a single pair of mode toggles.
+    """
+    view_layer = bpy.context.view_layer
+    previous_active = view_layer.objects.active
+    previous_selected = None
+    if previous_active != obj:
+        previous_selected = list(view_layer.objects.selected)
+        for selected in previous_selected:
+            selected.select_set(False)
+        obj.select_set(True)
+        view_layer.objects.active = obj
+
+    previous_mode = obj.mode
+    if previous_mode != "EDIT":
+        bpy.ops.object.mode_set(mode="EDIT")
+    try:
+        yield obj.data.edit_bones
+    finally:
+        if previous_mode != "EDIT":
+            bpy.ops.object.mode_set(mode=previous_mode)
+        if previous_selected is not None:
+            obj.select_set(False)
+            for selected in previous_selected:
+                with contextlib.suppress(ReferenceError):
+                    selected.select_set(True)
+            view_layer.objects.active = previous_active
+
+
+def add_edit_bone(
+    edit_bones: bpy.types.bpy_prop_collection,
+    name: str,
+    head: Sequence[float],
+    tail: Sequence[float],
+    parent_bone: Optional[str] = "",
+    connected: bool = False,
+) -> bpy.types.EditBone:
+    """Create an edit bone, parenting it when the parent exists."""
+    bone = edit_bones.new(name)
+    bone.head = head
+    bone.tail = tail
+
+    parent = edit_bones.get(parent_bone) if parent_bone else None
+    if parent is not None:
+        bone.parent = parent
+        bone.use_connect = connected
+    return bone
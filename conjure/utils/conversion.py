@@ -5,25 +5,75 @@ Helper functions for converting between different data formats.
 """
 
 import math
-from typing import List, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 import mathutils
+import numpy as np
 
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
 
-def degrees_to_radians(degrees: Union[float, List[float], Tuple[float, ...]]) -> Union[float, List[float]]:
-    """Convert degrees to radians."""
+# Below this many angles the per-call NumPy overhead outweighs the C loop
+_NUMPY_MIN_ANGLES = 8
+
+
+def degrees_to_radians(
+    degrees: Union[float, List[float], Tuple[float, ...], np.ndarray],
+) -> Union[float, List[float], np.ndarray]:
+    """Convert degrees to radians (ndarrays are converted in bulk to a new array)."""
+    if type(degrees) is float:
+        return degrees * _DEG2RAD
+    if isinstance(degrees, np.ndarray):
+        return np.deg2rad(degrees)
     if isinstance(degrees, (list, tuple)):
-        return [math.radians(d) for d in degrees]
+        if len(degrees) == 3:
+            # Vectors and Eulers: skip the loop for the common 3-wide case
+            x, y, z = degrees
+            return [x * _DEG2RAD, y * _DEG2RAD, z * _DEG2RAD]
+        if len(degrees) >= _NUMPY_MIN_ANGLES:
+            return np.deg2rad(np.asarray(degrees, dtype=np.float64)).tolist()
+        k = _DEG2RAD
+        return [d * k for d in degrees]
     return math.radians(degrees)
 
 
-def radians_to_degrees(radians: Union[float, List[float], Tuple[float, ...]]) -> Union[float, List[float]]:
-    """Convert radians to degrees."""
+def radians_to_degrees(
+    radians: Union[float, List[float], Tuple[float, ...], np.ndarray],
+) -> Union[float, List[float], np.ndarray]:
+    """Convert radians to degrees (ndarrays are converted in bulk to a new array)."""
+    if type(radians) is float:
+        return radians * _RAD2DEG
+    if isinstance(radians, np.ndarray):
+        return np.rad2deg(radians)
     if isinstance(radians, (list, tuple)):
-        return [math.degrees(r) for r in radians]
+        if len(radians) == 3:
+            x, y, z = radians
+            return [x * _RAD2DEG, y * _RAD2DEG, z * _RAD2DEG]
+        if len(radians) >= _NUMPY_MIN_ANGLES:
+            return np.rad2deg(np.asarray(radians, dtype=np.float64)).tolist()
+        k = _RAD2DEG
+        return [r * k for r in radians]
     return math.degrees(radians)
 
 
+def degrees_to_radians_array(degrees: Sequence[float], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Convert degrees of any shape (e.g. N x 3 Eulers) to radians.
+
+    Returns a new float64 array (safe to mutate), or writes into out;
+    out may be the input array itself for in-place conversion.
+    """
+    return np.multiply(degrees, _DEG2RAD, out=out)
+
+
+def radians_to_degrees_array(radians: Sequence[float], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Convert radians of any shape (e.g. N x 3 Eulers) to degrees.
+
+    Returns a new float64 array (safe to mutate), or writes into out;
+    out may be the input array itself for in-place conversion.
+    """
+    return np.multiply(radians, _RAD2DEG, out=out)
+
+
 def vector_to_list(vector: mathutils.Vector) -> List[float]:
     """Convert mathutils.Vector to list."""
     return list(vector)
@@ -37,22 +87,67 @@ def list_to_vector(data: List[float]) -> mathutils.Vector:
 def euler_to_list(euler: mathutils.Euler, as_degrees: bool = False) -> List[float]:
     """Convert mathutils.Euler to list."""
     if as_degrees:
-        return [math.degrees(e) for e in euler]
+        x, y, z = euler
+        return [x * _RAD2DEG, y * _RAD2DEG, z * _RAD2DEG]
     return list(euler)
 
 
 def list_to_euler(data: List[float], from_degrees: bool = False, order: str = "XYZ") -> mathutils.Euler:
     """Convert list to mathutils.Euler."""
     if from_degrees:
-        data = [math.radians(d) for d in data]
+        x, y, z = data
+        data = (x * _DEG2RAD, y * _DEG2RAD, z * _DEG2RAD)
     return mathutils.Euler(data, order)
 
 
 def matrix_to_list(matrix: mathutils.Matrix) -> List[List[float]]:
     """Convert mathutils.Matrix to nested list."""
-    return [list(row) for row in matrix]
+    if len(matrix) == 4:
+        # Transform matrices are 4 rows; unpack them without array setup
+        r0, r1, r2, r3 = matrix
+        return [[*r0], [*r1], [*r2], [*r3]]
+    return matrix_to_array(matrix).tolist()
+
+
+def matrix_to_array(matrix: mathutils.Matrix) -> np.ndarray:
+    """Convert mathutils.Matrix to a new float64 array (safe to mutate)."""
+    return np.array(matrix, dtype=np.float64)
+
+
+def matrix_to_bytes(matrix: mathutils.Matrix) -> bytes:
+    """Pack a matrix as row-major little-endian float64 bytes (128 for 4x4).
+
+    Preferred over matrix_to_list for binary caches and exporters.
+    """
+    return np.asarray(matrix, dtype="<f8").tobytes()
 
 
 def list_to_matrix(data: List[List[float]]) -> mathutils.Matrix:
     """Convert nested list to mathutils.Matrix."""
     return mathutils.Matrix(data)
+
+
+def vectors_to_array(vectors: Sequence[mathutils.Vector]) -> np.ndarray:
+    """Convert a sequence of 3D vectors to an (N, 3) float64 array."""
+    out = np.empty((len(vectors), 3), dtype=np.float64)
+    for i, vector in enumerate(vectors):
+        out[i] = vector
+    return out
+
+
+def eulers_to_array(eulers: Sequence[mathutils.Euler], as_degrees: bool = False) -> np.ndarray:
+    """Convert a sequence of Eulers to an (N, 3) float64 array."""
+    out = np.empty((len(eulers), 3), dtype=np.float64)
+    for i, euler in enumerate(eulers):
+        out[i] = euler
+    if as_degrees:
+        np.multiply(out, _RAD2DEG, out=out)
+    return out
+
+
+def matrices_to_array(matrices: Sequence[mathutils.Matrix]) -> np.ndarray:
+    """Convert a sequence of 4x4 matrices to an (N, 4, 4) float64 array."""
+    out = np.empty((len(matrices), 4, 4), dtype=np.float64)
+    for i, matrix in enumerate(matrices):
+        out[i] = matrix
+    return out
@@ -0,0 +1,49 @@
+"""
+Object lookup utilities for Conjure.
+
+Helpers for resolving objects by name in bulk.
+"""
+
+from operator import itemgetter
+from typing import List, Sequence, Tuple
+
+import bpy
+
+
+def split_names(names: str) -> List[str]:
+    """Split a ';'-separated object name list, dropping empty entries.
+
+    A string that is itself an object name is never split, and a part keeps
+    its surrounding whitespace when that exact name exists, so names with
+    ';' or leading/trailing spaces can still be targeted.
+    """
+    data_objects = bpy.data.objects
+    if names in data_objects:
+        return [names]
+
+    result = []
+    for name in names.split(";"):
+        if name not in data_objects:
+            name = name.strip()
+        if name:
+            result.append(name)
+    return result
+
+
+def get_many(names: Sequence[str]) -> Tuple[bpy.types.Object, ...]:
+    """Look up several objects by name with one itemgetter call.
+
+    Raises:
+        KeyError: If any name is not an object
+    """
+    if not names:
+        return ()
+    objects = itemgetter(*names)(bpy.data.objects)
+    # itemgetter returns the item itself for a single key
+    return objects if len(names) > 1 else (objects,)
+
+
+def find_missing(names: Sequence[str]) -> List[str]:
+    """Return the names that are not objects."""
+    data_objects = bpy.data.objects
+    return [name for name in names if data_objects.get(name) is None]
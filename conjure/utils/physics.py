@@ -0,0 +1,40 @@
+"""
+Physics utilities for Conjure.
+
+Quality presets and modifier lookup shared by the physics operators and
+the command executor.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import bpy
+
+# Rigid body world (substeps_per_frame, solver_iterations) per quality
+# preset; BALANCED matches Blender's defaults
+RIGID_BODY_QUALITY_PRESETS: Dict[str, Tuple[int, int]] = {
+    "FAST": (5, 6),
+    "BALANCED": (10, 10),
+    "ACCURATE": (20, 20),
+}
+
+# Cloth quality steps per quality preset; BALANCED matches Blender's default
+CLOTH_QUALITY_PRESETS: Dict[str, int] = {
+    "FAST": 3,
+    "BALANCED": 5,
+    "ACCURATE": 10,
+}
+
+
+def find_modifier(obj: bpy.types.Object, name: str, mod_type: str) -> Optional[bpy.types.Modifier]:
+    """Find an object's modifier of a type, trying the name we add it under first.
+
+    The name lookup happens in C; the per-modifier type scan is only
+    needed when the modifier was renamed.
+    """
+    mod = obj.modifiers.get(name)
+    if mod is not None and mod.type == mod_type:
+        return mod
+    for mod in obj.modifiers:
+        if mod.type == mod_type:
+            return mod
+    return None